@@ -20,11 +20,22 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 def main() -> None:
-    from simple_sender.utils.logging_config import setup_logging
-    setup_logging()
-    from simple_sender.application import App
-    App().mainloop()
+    from simple_sender.utils.startup_timeline import STARTUP_TIMELINE
+    STARTUP_TIMELINE.track_imports_from_env()
+    with STARTUP_TIMELINE.phase("logging setup"):
+        from simple_sender.utils.logging_config import setup_logging
+        setup_logging()
+    from simple_sender.metrics import METRICS
+    METRICS.start_file_dump_from_env()
+    with STARTUP_TIMELINE.phase("import application"):
+        from simple_sender.application import App
+    with STARTUP_TIMELINE.phase("App.__init__"):
+        app = App()
+    app.mainloop()
 
 
 if __name__ == "__main__":
+    # Auto-level uses a process pool for large files; needed for frozen Windows builds.
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
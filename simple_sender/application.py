@@ -54,6 +54,7 @@ from simple_sender.ui.dialogs.popup_utils import (
     set_default_parent,
 )
 from simple_sender.ui.toolpath.toolpath_settings import init_toolpath_settings
+from simple_sender.utils.startup_timeline import STARTUP_TIMELINE
 
 if TYPE_CHECKING:
     from simple_sender.macro_executor import MacroExecutor
@@ -76,6 +77,9 @@ _APP_TYPE_CHECKING_STUBS: tuple[str, ...] = (
     "_load_grbl_setting_info",
     "_create_virtual_hold_buttons",
     "_apply_keyboard_bindings",
+    "_finish_startup_timeline",
+    "_build_bound_deferred_tabs",
+    "_start_stall_watchdog",
 )
 
 
@@ -195,6 +199,9 @@ class App(tk.Tk):
         def _load_grbl_setting_info(self) -> None: ...
         def _create_virtual_hold_buttons(self) -> list[Any]: ...
         def _apply_keyboard_bindings(self) -> None: ...
+        def _finish_startup_timeline(self) -> None: ...
+        def _build_bound_deferred_tabs(self) -> None: ...
+        def _start_stall_watchdog(self) -> None: ...
 
     def __init__(self):
         super().__init__()
@@ -204,8 +211,12 @@ class App(tk.Tk):
         self.title("Simple Sender (BETA)")
         self.minsize(980, 620)
         self.bind("<Escape>", lambda _evt: self.attributes("-fullscreen", False))
-        default_jog_feed_xy, default_jog_feed_z = init_settings_store(self, _SCRIPT_DIR)
-        init_basic_preferences(self, __version__)
+        timeline = STARTUP_TIMELINE
+        self.startup_timeline = timeline
+        with timeline.phase("settings store"):
+            default_jog_feed_xy, default_jog_feed_z = init_settings_store(self, _SCRIPT_DIR)
+        with timeline.phase("preferences"):
+            init_basic_preferences(self, __version__)
         if bool(self.fullscreen_on_startup.get()):
             try:
                 self.attributes("-fullscreen", True)
@@ -213,13 +224,16 @@ class App(tk.Tk):
                 pass
         self._apply_ui_scale(self.settings.get("ui_scale", 1.5))
         init_toolpath_settings(self)
-        init_runtime_state(self, default_jog_feed_xy, default_jog_feed_z, _MACRO_SEARCH_DIRS)
+        with timeline.phase("runtime state"):
+            init_runtime_state(self, default_jog_feed_xy, default_jog_feed_z, _MACRO_SEARCH_DIRS)
         set_default_parent(self)
         patch_messagebox()
 
         # Top + main layout
-        self._build_toolbar()
-        self._build_main()
+        with timeline.phase("toolbar"):
+            self._build_toolbar()
+        with timeline.phase("main layout"):
+            self._build_main()
         self._init_screen_lock_guard()
         self._set_manual_controls_enabled(False)
 
@@ -227,8 +241,11 @@ class App(tk.Tk):
         self.after(JOYSTICK_RESTORE_DELAY_MS, self._restore_joystick_bindings_on_start)
         self.bind_all("<FocusOut>", self._on_app_focus_out)
         self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.after_idle(self._finish_startup_timeline)
+        self.after_idle(self._start_stall_watchdog)
 
-        self.refresh_ports(auto_connect=bool(self.reconnect_on_open.get()))
+        with timeline.phase("port scan"):
+            self.refresh_ports(auto_connect=bool(self.reconnect_on_open.get()))
         if not self.connected and bool(self.reconnect_on_open.get()):
             last_port = (self.settings.get("last_port") or "").strip()
             if last_port:
@@ -244,6 +261,7 @@ class App(tk.Tk):
         self.streaming_controller.bind_button_logging()
         self._virtual_hold_buttons = self._create_virtual_hold_buttons()
         self._apply_keyboard_bindings()
+        self._build_bound_deferred_tabs()
 
 
 _install_app_mixin_methods(App, _APP_MIXINS)
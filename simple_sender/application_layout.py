@@ -34,6 +34,7 @@ from simple_sender.ui.dialogs.diagnostics import (
     open_release_checklist,
     open_run_checklist,
     run_preflight_check,
+    start_profile_capture,
 )
 from simple_sender.ui.dialogs.logs import show_logs_dialog
 from simple_sender.ui.dialogs.macro_manager import show_macro_manager
@@ -61,6 +62,9 @@ class LayoutMixin:
     def _export_session_diagnostics(self):
         export_session_diagnostics(self)
 
+    def _start_profile_capture(self):
+        start_profile_capture(self)
+
     def _export_backup_bundle(self):
         export_backup_bundle(self)
 
@@ -24,8 +24,10 @@
 """
 
 # Standard library imports
+import logging
 from typing import Any, cast
 
+from simple_sender.stall_watchdog import MainLoopStallWatchdog, stall_threshold_from_env
 from simple_sender.types import AppProtocol
 
 from simple_sender.ui.app_lifecycle import (
@@ -43,6 +45,9 @@ from simple_sender.ui.settings_persistence import load_settings, save_settings
 from simple_sender.ui.threading_utils import call_on_ui_thread, post_ui_thread
 from simple_sender.ui.ui_queue import drain_ui_queue
 
+logger = logging.getLogger(__name__)
+
+
 class LifecycleMixin:
     def _drain_ui_queue(self):
         app = cast(AppProtocol, self)
@@ -58,6 +63,29 @@ class LifecycleMixin:
     def _on_close(self):
         on_close(self)
 
+    def _finish_startup_timeline(self):
+        app = cast(Any, self)
+        timeline = getattr(app, "startup_timeline", None)
+        if timeline is None or timeline.finished:
+            return
+        elapsed = timeline.finish("window ready")
+        logger.info("Startup timeline:\n" + "\n".join(timeline.report_lines()))
+        app.ui_q.put(("log", f"[startup] Window ready in {elapsed * 1000.0:.0f} ms"))
+
+    def _start_stall_watchdog(self):
+        app = cast(Any, self)
+        if getattr(app, "stall_watchdog", None) is not None or app._closing:
+            return
+        threshold = stall_threshold_from_env()
+        if threshold <= 0:
+            return
+
+        def on_stall(record):
+            app.ui_q.put(("log", f"[ui] Main loop stalled for {record.duration_ms:.0f} ms (stack in app log)"))
+
+        app.stall_watchdog = MainLoopStallWatchdog(app.after, threshold_ms=threshold, on_stall=on_stall)
+        app.stall_watchdog.start()
+
     def _call_on_ui_thread(self, func, *args, timeout: float | None = 5.0, **kwargs):
         return call_on_ui_thread(self, func, *args, timeout=timeout, **kwargs)
 
@@ -97,5 +125,5 @@ class LifecycleMixin:
     def _load_settings(self) -> dict:
         return cast(dict, load_settings(self))
 
-    def _save_settings(self):
-        save_settings(self)
+    def _save_settings(self, immediate: bool = False):
+        save_settings(self, immediate=immediate)
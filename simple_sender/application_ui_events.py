@@ -37,7 +37,12 @@ from simple_sender.ui.controls.toolbar import (
     update_resume_button_visibility,
 )
 from simple_sender.ui.dialogs import show_macro_prompt
-from simple_sender.ui.main_tabs import on_tab_changed, update_tab_visibility
+from simple_sender.ui.main_tabs import (
+    build_bound_deferred_tabs,
+    ensure_tab_built,
+    on_tab_changed,
+    update_tab_visibility,
+)
 from simple_sender.ui.settings import (
     bind_app_settings_mousewheel,
     bind_app_settings_touch_scroll,
@@ -117,6 +122,12 @@ class UiEventsMixin:
     def _on_tab_changed(self, event):
         on_tab_changed(self, event)
 
+    def _ensure_tab_built(self, label: str) -> bool:
+        return ensure_tab_built(self, label)
+
+    def _build_bound_deferred_tabs(self):
+        build_bound_deferred_tabs(self)
+
     def _on_auto_level_enabled_change(self):
         app = cast(Any, self)
         enabled = bool(app.auto_level_enabled.get())
@@ -22,6 +22,7 @@
 
 from dataclasses import dataclass
 import math
+from typing import Sequence
 
 
 @dataclass(frozen=True)
@@ -146,10 +147,147 @@ def _spiral_points(xs: list[float], ys: list[float]) -> list[tuple[float, float]
     return points
 
 
+def _neighbor_lists(points: Sequence[tuple[float, float]], k: int) -> list[list[int]]:
+    """Return the indices of up to `k` nearest points for every point.
+
+    Points are bucketed into roughly one point per cell and each search grows
+    ring by ring until the `k` best candidates are closer than any unsearched
+    cell, so sparse or masked grids stay close to O(n).
+    """
+    n = len(points)
+    k = min(k, n - 1)
+    if k <= 0:
+        return [[] for _ in range(n)]
+    minx = min(p[0] for p in points)
+    miny = min(p[1] for p in points)
+    span = max(max(p[0] for p in points) - minx, max(p[1] for p in points) - miny)
+    cell = span / math.sqrt(n) if span > 0 else 1.0
+    buckets: dict[tuple[int, int], list[int]] = {}
+    for idx, (px, py) in enumerate(points):
+        key = (int((px - minx) / cell), int((py - miny) / cell))
+        buckets.setdefault(key, []).append(idx)
+    max_ring = int(span / cell) + 1
+    out: list[list[int]] = []
+    for idx, (px, py) in enumerate(points):
+        cx = int((px - minx) / cell)
+        cy = int((py - miny) / cell)
+        found: list[tuple[float, int]] = []
+        ring = 0
+        while ring <= max_ring:
+            for bx in range(cx - ring, cx + ring + 1):
+                for by in range(cy - ring, cy + ring + 1):
+                    if ring and abs(bx - cx) != ring and abs(by - cy) != ring:
+                        continue
+                    for other in buckets.get((bx, by), ()):
+                        if other != idx:
+                            ox, oy = points[other]
+                            found.append(((ox - px) ** 2 + (oy - py) ** 2, other))
+            if len(found) >= k:
+                found.sort()
+                if found[k - 1][0] <= (ring * cell) ** 2:
+                    break
+            ring += 1
+        found.sort()
+        out.append([other for _dist, other in found[:k]])
+    return out
+
+
+def optimize_probe_order(
+    points: Sequence[tuple[float, float]],
+    start: tuple[float, float] | None = None,
+    *,
+    neighbors: int = 8,
+    max_passes: int = 50,
+) -> list[tuple[float, float]]:
+    """Order probe points into a short open tour.
+
+    Builds a nearest-neighbor tour from the point closest to `start` (the
+    first point when omitted) and improves it with 2-opt moves restricted to
+    each point's nearest neighbors. Meant for grids thinned by avoidance
+    areas, where fixed serpentine/spiral patterns waste travel.
+    """
+    pts = list(points)
+    n = len(pts)
+    if n <= 3:
+        return pts
+    if start is None:
+        first = 0
+    else:
+        sx, sy = start
+        first = min(range(n), key=lambda i: (pts[i][0] - sx) ** 2 + (pts[i][1] - sy) ** 2)
+    near = _neighbor_lists(pts, neighbors)
+
+    def dist(a: int, b: int) -> float:
+        return math.hypot(pts[a][0] - pts[b][0], pts[a][1] - pts[b][1])
+
+    # Nearest neighbor: try the precomputed neighbors first and only scan the
+    # remaining points when all of them have been visited.
+    unvisited = set(range(n))
+    unvisited.discard(first)
+    tour = [first]
+    current = first
+    while unvisited:
+        nxt = next((c for c in near[current] if c in unvisited), None)
+        if nxt is None:
+            cx, cy = pts[current]
+            nxt = min(unvisited, key=lambda i: (pts[i][0] - cx) ** 2 + (pts[i][1] - cy) ** 2)
+        unvisited.discard(nxt)
+        tour.append(nxt)
+        current = nxt
+
+    pos = [0] * n
+    for i, node in enumerate(tour):
+        pos[node] = i
+    last = n - 1
+    for _ in range(max_passes):
+        improved = False
+        for i in range(last):
+            a = tour[i]
+            b = tour[i + 1]
+            d_ab = dist(a, b)
+            for c in near[a]:
+                d_ac = dist(a, c)
+                if d_ac >= d_ab:
+                    break
+                j = pos[c]
+                if j > i + 1:
+                    # Replace (a, b) + (c, d) with (a, c) + (b, d); d is absent
+                    # when c ends the path.
+                    lo, hi = i + 1, j
+                    gain = d_ab - d_ac - (0.0 if j == last else dist(b, tour[j + 1]) - dist(c, tour[j + 1]))
+                elif j < i:
+                    # Replace (c, e) + (a, b) with (c, a) + (e, b).
+                    lo, hi = j + 1, i
+                    e = tour[j + 1]
+                    gain = d_ab + dist(c, e) - d_ac - dist(e, b)
+                else:
+                    continue
+                if gain > 1e-9:
+                    tour[lo : hi + 1] = tour[lo : hi + 1][::-1]
+                    for k in range(lo, hi + 1):
+                        pos[tour[k]] = k
+                    improved = True
+                    break
+        if not improved:
+            break
+    return [pts[i] for i in tour]
+
+
+def tour_length(points: Sequence[tuple[float, float]]) -> float:
+    return sum(
+        math.hypot(points[i + 1][0] - points[i][0], points[i + 1][1] - points[i][1])
+        for i in range(len(points) - 1)
+    )
+
+
 def _order_points(xs: list[float], ys: list[float], path_order: str | None) -> list[tuple[float, float]]:
     order = (path_order or "serpentine").strip().lower()
     if order == "spiral":
         return _spiral_points(xs, ys)
+    if order == "optimized":
+        # A serpentine is already a shortest tour of a full grid; the optimizer
+        # pays off once avoidance areas remove points (see `optimize_probe_order`).
+        return optimize_probe_order(_serpentine_points(xs, ys))
     return _serpentine_points(xs, ys)
 
 
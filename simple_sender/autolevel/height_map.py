@@ -20,7 +20,9 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from array import array
 from dataclasses import dataclass
+from typing import Sequence
 import bisect
 import math
 
@@ -38,23 +40,66 @@ class HeightMapStats:
         return self.max_z - self.min_z
 
 
+_NAN = float("nan")
+
+# Catmull-Rom basis: value(t) = [1, t, t^2, t^3] . _CR_BASIS . [p0, p1, p2, p3]
+_CR_BASIS = (
+    (0.0, 1.0, 0.0, 0.0),
+    (-0.5, 0.0, 0.5, 0.0),
+    (1.0, -2.5, 2.0, -0.5),
+    (-0.5, 1.5, -1.5, 0.5),
+)
+
+
 class HeightMap:
+    """Probed Z grid stored row-major in a contiguous `array('d')`.
+
+    Missing samples are NaN. Once every valid cell is probed, per-cell
+    bilinear and bicubic polynomial coefficients are built lazily and cached
+    until the next mutation, so each interpolation is a cell lookup plus a
+    polynomial evaluation.
+    """
+
     def __init__(self, xs: list[float], ys: list[float], *, invalid_points: list[tuple[int, int]] | None = None):
         if not xs or not ys:
             raise ValueError("HeightMap requires non-empty xs and ys")
         self.xs = list(xs)
         self.ys = list(ys)
-        self._rows: list[list[float | None]] = [[None for _ in self.xs] for _ in self.ys]
+        self._nx = len(self.xs)
+        self._ny = len(self.ys)
+        self._z = array("d", [_NAN]) * (self._nx * self._ny)
         self._x_index = {self._key(x): idx for idx, x in enumerate(self.xs)}
         self._y_index = {self._key(y): idx for idx, y in enumerate(self.ys)}
         self._invalid: set[tuple[int, int]] = set()
+        self._missing = self._nx * self._ny
+        self._coeffs: dict[str, array] = {}
+        self._x_uniform = _uniform_step(self.xs)
+        self._y_uniform = _uniform_step(self.ys)
         if invalid_points:
             for ix, iy in invalid_points:
                 self.set_invalid_index(ix, iy)
 
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_coeffs"] = {}
+        return state
+
     def _key(self, value: float) -> float:
         return round(value, 6)
 
+    def _store(self, ix: int, iy: int, z: float | None) -> None:
+        pos = iy * self._nx + ix
+        was_missing = math.isnan(self._z[pos])
+        if z is None:
+            self._z[pos] = _NAN
+            if not was_missing and (ix, iy) not in self._invalid:
+                self._missing += 1
+        else:
+            self._z[pos] = float(z)
+            if was_missing:
+                self._missing -= 1
+        self._coeffs.clear()
+
     def set_point(self, x: float, y: float, z: float) -> bool:
         ix = self._x_index.get(self._key(x))
         iy = self._y_index.get(self._key(y))
@@ -62,7 +107,7 @@ class HeightMap:
             return False
         if (ix, iy) in self._invalid:
             return False
-        self._rows[iy][ix] = float(z)
+        self._store(ix, iy, z)
         return True
 
     def index_for(self, x: float, y: float) -> tuple[int, int] | None:
@@ -75,16 +120,29 @@ class HeightMap:
     def set_index(self, ix: int, iy: int, z: float) -> None:
         if (ix, iy) in self._invalid:
             return
-        self._rows[iy][ix] = float(z)
+        self._store(ix, iy, z)
 
     def get_index(self, ix: int, iy: int) -> float | None:
-        return self._rows[iy][ix]
+        value = self._z[iy * self._nx + ix]
+        return None if math.isnan(value) else value
 
     def set_invalid_index(self, ix: int, iy: int) -> None:
-        if ix < 0 or iy < 0 or iy >= len(self._rows) or ix >= len(self._rows[iy]):
+        if ix < 0 or iy < 0 or iy >= self._ny or ix >= self._nx:
+            return
+        if (ix, iy) in self._invalid:
             return
-        self._rows[iy][ix] = None
+        pos = iy * self._nx + ix
+        if math.isnan(self._z[pos]):
+            self._missing -= 1
+        self._z[pos] = _NAN
         self._invalid.add((ix, iy))
+        self._coeffs.clear()
+
+    def is_invalid_index(self, ix: int, iy: int) -> bool:
+        return (ix, iy) in self._invalid
+
+    def invalid_indices(self) -> list[tuple[int, int]]:
+        return sorted(self._invalid)
 
     def mark_invalid(self, x: float, y: float) -> bool:
         indices = self.index_for(x, y)
@@ -95,26 +153,21 @@ class HeightMap:
         return True
 
     def _value_at(self, ix: int, iy: int) -> float | None:
-        if (ix, iy) in self._invalid:
-            return None
-        return self._rows[iy][ix]
+        value = self._z[iy * self._nx + ix]
+        return None if math.isnan(value) else value
 
     def is_complete(self) -> bool:
-        for iy, row in enumerate(self._rows):
-            for ix, val in enumerate(row):
-                if val is None and (ix, iy) not in self._invalid:
-                    return False
-        return True
+        return self._missing <= 0
 
     def stats(self) -> HeightMapStats | None:
         values: list[float] = []
         points: list[tuple[float, float, float]] = []
-        for iy, row in enumerate(self._rows):
-            for ix, val in enumerate(row):
-                if val is not None:
-                    z = float(val)
-                    values.append(z)
-                    points.append((self.xs[ix], self.ys[iy], z))
+        nx = self._nx
+        for pos, z in enumerate(self._z):
+            if math.isnan(z):
+                continue
+            values.append(z)
+            points.append((self.xs[pos % nx], self.ys[pos // nx], z))
         if not values:
             return None
         min_z = min(values)
@@ -129,7 +182,10 @@ class HeightMap:
         data = {
             "xs": list(self.xs),
             "ys": list(self.ys),
-            "z": [[v if v is None else float(v) for v in row] for row in self._rows],
+            "z": [
+                [self._value_at(ix, iy) for ix in range(self._nx)]
+                for iy in range(self._ny)
+            ],
         }
         if self._invalid:
             data["invalid"] = [[ix, iy] for ix, iy in sorted(self._invalid)]
@@ -153,10 +209,7 @@ class HeightMap:
             if not isinstance(row, list) or len(row) != len(xs):
                 raise ValueError("Height map row length does not match xs length.")
             for ix, value in enumerate(row):
-                if value is None:
-                    height_map._rows[iy][ix] = None
-                else:
-                    height_map._rows[iy][ix] = float(value)
+                height_map._store(ix, iy, None if value is None else float(value))
         invalid = data.get("invalid")
         if isinstance(invalid, list):
             for entry in invalid:
@@ -175,78 +228,135 @@ class HeightMap:
     def interpolate(self, x: float, y: float, method: str = "bilinear") -> float | None:
         if not self.is_complete():
             return None
-        x = self._clamp(x, self.xs[0], self.xs[-1])
-        y = self._clamp(y, self.ys[0], self.ys[-1])
-        ix0, ix1, tx = self._find_segment(self.xs, x)
-        iy0, iy1, ty = self._find_segment(self.ys, y)
-        if method.lower() == "bicubic":
-            value = self._interpolate_bicubic(ix0, ix1, tx, iy0, iy1, ty)
-        else:
-            value = self._interpolate_bilinear(ix0, ix1, tx, iy0, iy1, ty)
-        if value is None:
-            return self._interpolate_sparse(x, y, ix0, ix1, iy0, iy1)
-        return value
+        return self._interpolate_complete(x, y, self._coefficients(method))
 
-    def _interpolate_bilinear(
-        self,
-        ix0: int,
-        ix1: int,
-        tx: float,
-        iy0: int,
-        iy1: int,
-        ty: float,
-    ) -> float | None:
-        z00 = self._value_at(ix0, iy0)
-        z10 = self._value_at(ix1, iy0)
-        z01 = self._value_at(ix0, iy1)
-        z11 = self._value_at(ix1, iy1)
-        if None in (z00, z10, z01, z11):
-            return None
-        z00 = float(z00)  # type: ignore[arg-type]
-        z10 = float(z10)  # type: ignore[arg-type]
-        z01 = float(z01)  # type: ignore[arg-type]
-        z11 = float(z11)  # type: ignore[arg-type]
-        return (
-            (1 - tx) * (1 - ty) * z00
-            + tx * (1 - ty) * z10
-            + (1 - tx) * ty * z01
-            + tx * ty * z11
-        )
-
-    def _interpolate_bicubic(
+    def interpolate_many(
         self,
-        ix0: int,
-        ix1: int,
-        tx: float,
-        iy0: int,
-        iy1: int,
-        ty: float,
-    ) -> float | None:
-        if len(self.xs) < 2 or len(self.ys) < 2:
-            return self._interpolate_bilinear(ix0, ix1, tx, iy0, iy1, ty)
-        ixm1 = max(ix0 - 1, 0)
-        ix2 = min(ix1 + 1, len(self.xs) - 1)
-        iym1 = max(iy0 - 1, 0)
-        iy2 = min(iy1 + 1, len(self.ys) - 1)
-        rows = [iym1, iy0, iy1, iy2]
-        values = []
-        for iy in rows:
-            p0 = self._value_at(ixm1, iy)
-            p1 = self._value_at(ix0, iy)
-            p2 = self._value_at(ix1, iy)
-            p3 = self._value_at(ix2, iy)
-            if None in (p0, p1, p2, p3):
-                return self._interpolate_bilinear(ix0, ix1, tx, iy0, iy1, ty)
-            values.append(
-                self._catmull_rom(
-                    float(p0),  # type: ignore[arg-type]
-                    float(p1),  # type: ignore[arg-type]
-                    float(p2),  # type: ignore[arg-type]
-                    float(p3),  # type: ignore[arg-type]
-                    tx,
-                )
-            )
-        return self._catmull_rom(values[0], values[1], values[2], values[3], ty)
+        xs: Sequence[float],
+        ys: Sequence[float],
+        method: str = "bilinear",
+    ) -> list[float | None]:
+        """Interpolate a batch of points; returns None for every point if incomplete."""
+        if len(xs) != len(ys):
+            raise ValueError("interpolate_many requires xs and ys of equal length")
+        if not self.is_complete():
+            return [None] * len(xs)
+        coeffs = self._coefficients(method)
+        interp = self._interpolate_complete
+        return [interp(x, y, coeffs) for x, y in zip(xs, ys)]
+
+    def _interpolate_complete(self, x: float, y: float, coeffs: array) -> float | None:
+        xs = self.xs
+        ys = self.ys
+        if x < xs[0]:
+            x = xs[0]
+        elif x > xs[-1]:
+            x = xs[-1]
+        if y < ys[0]:
+            y = ys[0]
+        elif y > ys[-1]:
+            y = ys[-1]
+        cx, tx = self._locate(xs, x, self._x_uniform)
+        cy, ty = self._locate(ys, y, self._y_uniform)
+        cells_x = max(self._nx - 1, 1)
+        stride = len(coeffs) // (cells_x * max(self._ny - 1, 1))
+        base = (cy * cells_x + cx) * stride
+        c0 = coeffs[base]
+        if c0 != c0:  # NaN: a corner is invalid, fall back to sparse weighting
+            ix0, ix1 = cx, min(cx + 1, self._nx - 1)
+            iy0, iy1 = cy, min(cy + 1, self._ny - 1)
+            return self._interpolate_sparse(x, y, ix0, ix1, iy0, iy1)
+        if stride == 4:
+            return c0 + coeffs[base + 1] * tx + (coeffs[base + 2] + coeffs[base + 3] * tx) * ty
+        # Bicubic: rows are powers of ty, columns powers of tx (Horner in both).
+        total = 0.0
+        for row in (base + 12, base + 8, base + 4, base):
+            row_val = ((coeffs[row + 3] * tx + coeffs[row + 2]) * tx + coeffs[row + 1]) * tx + coeffs[row]
+            total = total * ty + row_val
+        return total
+
+    def _locate(self, axis: list[float], value: float, uniform: float | None) -> tuple[int, float]:
+        """Return (cell index, fractional offset) consistent with `_find_segment`."""
+        if uniform is not None:
+            count = len(axis)
+            if count == 1:
+                return 0, 0.0
+            pos = (value - axis[0]) / uniform
+            cell = int(pos)
+            if cell >= count - 1:
+                return count - 2, 1.0
+            if cell < 0:
+                return 0, 0.0
+            frac = pos - cell
+            if frac == 0.0 and cell > 0:
+                # _find_segment uses bisect_left: exact grid hits belong to the left cell.
+                return cell - 1, 1.0
+            return cell, frac
+        ix0, _ix1, t = self._find_segment(axis, value)
+        return ix0, t
+
+    def _coefficients(self, method: str) -> array:
+        key = "bicubic" if method.lower() == "bicubic" else "bilinear"
+        cached = self._coeffs.get(key)
+        if cached is None:
+            if key == "bicubic" and self._nx >= 2 and self._ny >= 2:
+                cached = self._build_bicubic()
+            else:
+                cached = self._build_bilinear()
+            self._coeffs[key] = cached
+        return cached
+
+    def _cell_corners(self, cx: int, cy: int) -> tuple[int, int, int, int]:
+        return cx, min(cx + 1, self._nx - 1), cy, min(cy + 1, self._ny - 1)
+
+    def _bilinear_cell(self, cx: int, cy: int) -> tuple[float, float, float, float]:
+        ix0, ix1, iy0, iy1 = self._cell_corners(cx, cy)
+        z = self._z
+        nx = self._nx
+        z00 = z[iy0 * nx + ix0]
+        z10 = z[iy0 * nx + ix1]
+        z01 = z[iy1 * nx + ix0]
+        z11 = z[iy1 * nx + ix1]
+        if math.isnan(z00) or math.isnan(z10) or math.isnan(z01) or math.isnan(z11):
+            return (_NAN, _NAN, _NAN, _NAN)
+        return (z00, z10 - z00, z01 - z00, z00 - z10 - z01 + z11)
+
+    def _build_bilinear(self) -> array:
+        coeffs = array("d")
+        for cy in range(max(self._ny - 1, 1)):
+            for cx in range(max(self._nx - 1, 1)):
+                coeffs.extend(self._bilinear_cell(cx, cy))
+        return coeffs
+
+    def _build_bicubic(self) -> array:
+        coeffs = array("d")
+        z = self._z
+        nx = self._nx
+        basis = _CR_BASIS
+        for cy in range(self._ny - 1):
+            rows = (max(cy - 1, 0), cy, cy + 1, min(cy + 2, self._ny - 1))
+            for cx in range(self._nx - 1):
+                cols = (max(cx - 1, 0), cx, cx + 1, min(cx + 2, nx - 1))
+                patch = [[z[iy * nx + ix] for ix in cols] for iy in rows]
+                if any(math.isnan(v) for row in patch for v in row):
+                    bilinear = self._bilinear_cell(cx, cy)
+                    if math.isnan(bilinear[0]):
+                        coeffs.extend([_NAN] * 16)
+                        continue
+                    a0, a1, a2, a3 = bilinear
+                    cell = [0.0] * 16
+                    cell[0], cell[1], cell[4], cell[5] = a0, a1, a2, a3
+                    coeffs.extend(cell)
+                    continue
+                # C = B . P . B^T; z(tx, ty) = sum C[a][b] * ty^a * tx^b
+                bp = [
+                    [sum(basis[a][k] * patch[k][j] for k in range(4)) for j in range(4)]
+                    for a in range(4)
+                ]
+                for a in range(4):
+                    for b in range(4):
+                        coeffs.append(sum(bp[a][j] * basis[b][j] for j in range(4)))
+        return coeffs
 
     def _interpolate_sparse(
         self,
@@ -309,16 +419,6 @@ class HeightMap:
         points.sort(key=lambda item: (item[0] - x) ** 2 + (item[1] - y) ** 2)
         return points[:max_points]
 
-    def _catmull_rom(self, p0: float, p1: float, p2: float, p3: float, t: float) -> float:
-        t2 = t * t
-        t3 = t2 * t
-        return 0.5 * (
-            (2 * p1)
-            + (-p0 + p2) * t
-            + (2 * p0 - 5 * p1 + 4 * p2 - p3) * t2
-            + (-p0 + 3 * p1 - 3 * p2 + p3) * t3
-        )
-
     def _find_segment(self, axis: list[float], value: float) -> tuple[int, int, float]:
         if len(axis) == 1:
             return 0, 0, 0.0
@@ -334,12 +434,19 @@ class HeightMap:
         t = (value - x0) / (x1 - x0)
         return idx - 1, idx, t
 
-    def _clamp(self, value: float, lo: float, hi: float) -> float:
-        if value < lo:
-            return lo
-        if value > hi:
-            return hi
-        return value
+
+def _uniform_step(axis: list[float]) -> float | None:
+    """Return the spacing if `axis` is evenly spaced and increasing, else None."""
+    if len(axis) < 2:
+        return None
+    step = (axis[-1] - axis[0]) / (len(axis) - 1)
+    if step <= 0:
+        return None
+    tol = abs(step) * 1e-9
+    for idx in range(1, len(axis)):
+        if abs((axis[idx] - axis[0]) - idx * step) > tol:
+            return None
+    return step
 
 
 def _plane_residuals(points: list[tuple[float, float, float]], mean_z: float) -> list[float]:
@@ -20,10 +20,16 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+import codecs
+import io
+import logging
 import math
+import multiprocessing
 import os
-from typing import Iterable
+from typing import BinaryIO, Iterable, Iterator, Sequence, cast
 
 from simple_sender.autolevel.height_map import HeightMap
 from simple_sender.gcode_parser import (
@@ -35,6 +41,8 @@ from simple_sender.gcode_parser import (
     clean_gcode_line,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class LevelResult:
@@ -57,6 +65,78 @@ class _LevelerError(Exception):
 
 
 LEVEL_DECIMALS = 4
+# Max deviation (mm) between the leveled surface and the emitted straight
+# segments at the grid-step sample points; 0 keeps every grid-step cut.
+LEVEL_Z_TOLERANCE = 0.005
+LEVEL_BATCH_POINTS = 4096
+LEVEL_PARALLEL_MIN_BYTES = 16 * 1024 * 1024
+LEVEL_CHUNK_BYTES = 4 * 1024 * 1024
+LEVEL_STREAM_LOOKAHEAD = 64
+LEVEL_STREAM_RETAIN = 256
+
+
+@dataclass(slots=True)
+class _LevelState:
+    """Modal state carried between lines (and across parallel chunks)."""
+
+    units: float = 1.0
+    absolute: bool = True
+    plane: str = "G17"
+    feed_mode: str = "G94"
+    arc_abs: bool = False
+    feed_raw: float | None = None
+    last_feed_out: float | None = None
+    x: float = 0.0
+    y: float = 0.0
+    z: float = 0.0
+    g92_offset: list[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    g92_enabled: bool = True
+    last_motion: int = 1
+
+    def copy(self) -> "_LevelState":
+        return _LevelState(
+            self.units,
+            self.absolute,
+            self.plane,
+            self.feed_mode,
+            self.arc_abs,
+            self.feed_raw,
+            self.last_feed_out,
+            self.x,
+            self.y,
+            self.z,
+            list(self.g92_offset),
+            self.g92_enabled,
+            self.last_motion,
+        )
+
+
+@dataclass(slots=True)
+class _PendingMove:
+    """Output move whose Z word waits for a batched height-map lookup."""
+
+    head: str
+    x: float
+    y: float
+    z: float
+    tail: str
+    units: float
+
+
+@dataclass(slots=True)
+class _PendingPath:
+    """Linear move cut at grid-step candidates, decimated once heights are known."""
+
+    prefix: str
+    motion: str
+    x0: float
+    y0: float
+    points: list[tuple[float, float, float]]
+    tail: str
+    units: float
+
+
+_Pending = _PendingMove | _PendingPath
 
 
 def _level_gcode_iter(
@@ -66,24 +146,304 @@ def _level_gcode_iter(
     arc_step_rad: float,
     apply_to_rapids: bool,
     interpolation: str,
+    state: _LevelState | None = None,
+    z_tolerance: float = LEVEL_Z_TOLERANCE,
+):
+    """Yield leveled lines, interpolating Z offsets one block of moves at a time."""
+    pending: list[str | _Pending] = []
+    xs: list[float] = []
+    ys: list[float] = []
+    for item in _level_gcode_moves(
+        lines,
+        height_map,
+        arc_step_rad=arc_step_rad,
+        apply_to_rapids=apply_to_rapids,
+        state=state,
+    ):
+        if isinstance(item, str) and not xs:
+            yield item
+            continue
+        pending.append(item)
+        if not isinstance(item, str):
+            _collect_points(item, xs, ys, z_tolerance)
+            if len(xs) >= LEVEL_BATCH_POINTS:
+                yield from _flush_pending(pending, xs, ys, height_map, interpolation, z_tolerance)
+    if pending:
+        yield from _flush_pending(pending, xs, ys, height_map, interpolation, z_tolerance)
+
+
+def _flush_pending(
+    pending: list[str | _Pending],
+    xs: list[float],
+    ys: list[float],
+    height_map: HeightMap,
+    interpolation: str,
+    z_tolerance: float,
+):
+    offsets = height_map.interpolate_many(xs, ys, interpolation)
+    if any(offset is None for offset in offsets):
+        raise _LevelerError("Height map interpolation failed.")
+    out: list[str] = []
+    offset_iter = iter(offsets)
+    for item in pending:
+        if isinstance(item, str):
+            out.append(item)
+            continue
+        _render_pending(item, offset_iter, z_tolerance, out)
+    pending.clear()
+    xs.clear()
+    ys.clear()
+    return out
+
+
+def _adaptive(item: _PendingPath, z_tolerance: float) -> bool:
+    return z_tolerance > 0 and len(item.points) > 1
+
+
+def _collect_points(item: _Pending, xs: list[float], ys: list[float], z_tolerance: float) -> None:
+    """Append the XY points whose offsets `_render_pending` will consume."""
+    if isinstance(item, _PendingMove):
+        xs.append(item.x)
+        ys.append(item.y)
+        return
+    if _adaptive(item, z_tolerance):
+        xs.append(item.x0)
+        ys.append(item.y0)
+    for sx, sy, _sz in item.points:
+        xs.append(sx)
+        ys.append(sy)
+
+
+def _render_pending(
+    item: _Pending,
+    offset_iter: Iterator[float | None],
+    z_tolerance: float,
+    out: list[str],
+) -> None:
+    if isinstance(item, _PendingMove):
+        out.append(_format_move(item, cast(float, next(offset_iter))))
+        return
+    units = item.units
+    if _adaptive(item, z_tolerance):
+        heights = [cast(float, next(offset_iter)) for _ in range(len(item.points) + 1)]
+        keep = _decimate_profile(heights, z_tolerance)
+    else:
+        heights = [0.0] + [cast(float, next(offset_iter)) for _ in item.points]
+        keep = range(1, len(heights))
+    first = True
+    for k in keep:
+        sx, sy, sz = item.points[k - 1]
+        head = f"{item.prefix}{item.motion}" if first else item.motion
+        tail = item.tail if first else ""
+        out.append(
+            f"{head}{_axis_word('X', sx, units)}{_axis_word('Y', sy, units)}"
+            f"{_axis_word('Z', sz + heights[k], units)}{tail}"
+        )
+        first = False
+
+
+def _decimate_profile(heights: list[float], z_tolerance: float) -> list[int]:
+    """Douglas-Peucker over evenly spaced height samples (index 0 is the move start).
+
+    Returns the sample indices (excluding the start, always including the end)
+    whose straight-line joins stay within `z_tolerance` of every sample.
+    """
+    last = len(heights) - 1
+    keep = [False] * (last + 1)
+    keep[last] = True
+    stack = [(0, last)]
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        ha = heights[a]
+        slope = (heights[b] - ha) / (b - a)
+        worst = -1
+        worst_err = z_tolerance
+        for k in range(a + 1, b):
+            err = abs(heights[k] - (ha + slope * (k - a)))
+            if err > worst_err:
+                worst = k
+                worst_err = err
+        if worst >= 0:
+            keep[worst] = True
+            stack.append((a, worst))
+            stack.append((worst, b))
+    return [k for k in range(1, last + 1) if keep[k]]
+
+
+def _format_move(item: _PendingMove, offset: float) -> str:
+    return f"{item.head}{_axis_word('Z', item.z + offset, item.units)}{item.tail}"
+
+
+class StreamLeveler:
+    """Apply a height map to lines as the worker reserves them for sending.
+
+    `pieces(lines, idx)` returns the leveled replacement lines for source line
+    `idx`. Lines are expanded `lookahead` source lines at a time with one
+    batched height-map lookup; modal state carries over between blocks. A
+    forward jump scans only the skipped lines; a backward one (rollback past
+    the retained window) re-derives the state from the start. Call
+    `prepare()` before resuming mid-file so that pre-scan runs up front
+    rather than on the first `pieces()` call.
+    """
+
+    def __init__(
+        self,
+        height_map: HeightMap,
+        *,
+        arc_step_rad: float = math.pi / 18,
+        apply_to_rapids: bool = False,
+        interpolation: str = "bilinear",
+        z_tolerance: float = LEVEL_Z_TOLERANCE,
+        lookahead: int = LEVEL_STREAM_LOOKAHEAD,
+    ) -> None:
+        if not height_map.is_complete():
+            raise ValueError("Height map is incomplete.")
+        self.height_map = height_map
+        self.arc_step_rad = arc_step_rad
+        self.apply_to_rapids = apply_to_rapids
+        self.interpolation = interpolation
+        self.z_tolerance = z_tolerance
+        self._lookahead = max(1, int(lookahead))
+        self._state = _LevelState()
+        self._next_idx = 0
+        self._cache: dict[int, list[str]] = {}
+        self._prepared: tuple[int, _LevelState] | None = None
+
+    def invalidate(self) -> None:
+        """Forget cached expansions; the next lookup re-derives modal state."""
+        self._cache.clear()
+        self._next_idx = -1
+
+    def prepare(self, lines: Sequence[str], idx: int) -> None:
+        """Pre-scan `lines[:idx]` so a later `pieces(lines, idx)` needs no scan.
+
+        Only builds a private state, so it can run without the worker's
+        stream lock while the previous stream is still winding down.
+        Unsupported G-code is left for `pieces()` to report.
+        """
+        state = _LevelState()
+        try:
+            self._scan(lines, 0, idx, state)
+        except _LevelerError:
+            self._prepared = None
+            return
+        self._prepared = (idx, state)
+
+    def pieces(self, lines: Sequence[str], idx: int) -> list[str]:
+        """Return the leveled lines for `lines[idx]` (raises ValueError on unsupported G-code)."""
+        cached = self._cache.get(idx)
+        if cached is not None:
+            return cached
+        try:
+            if idx != self._next_idx:
+                self._seek(lines, idx)
+            self._expand(lines, idx, min(len(lines), idx + self._lookahead))
+        except _LevelerError as exc:
+            self.invalidate()
+            raise ValueError(exc.message) from None
+        for old in [key for key in self._cache if key < idx - LEVEL_STREAM_RETAIN]:
+            del self._cache[old]
+        return self._cache[idx]
+
+    def _seek(self, lines: Sequence[str], idx: int) -> None:
+        self._cache.clear()
+        prepared = self._prepared
+        if prepared is not None and prepared[0] == idx:
+            self._state = prepared[1].copy()
+        elif 0 <= self._next_idx < idx:
+            # The state is current as of `_next_idx`; scan only the gap.
+            self._scan(lines, self._next_idx, idx, self._state)
+        else:
+            self._state = _LevelState()
+            self._scan(lines, 0, idx, self._state)
+        self._next_idx = idx
+
+    def _scan(self, lines: Sequence[str], start: int, end: int, state: _LevelState) -> None:
+        for _ in _level_gcode_moves(
+            (lines[i] for i in range(start, end)),
+            self.height_map,
+            arc_step_rad=self.arc_step_rad,
+            apply_to_rapids=self.apply_to_rapids,
+            state=state,
+            emit=False,
+        ):
+            pass
+
+    def _expand(self, lines: Sequence[str], start: int, end: int) -> None:
+        per_line: list[list[str | _Pending]] = [[] for _ in range(end - start)]
+        xs: list[float] = []
+        ys: list[float] = []
+        current = start
+
+        def feed() -> Iterator[str]:
+            nonlocal current
+            for i in range(start, end):
+                current = i
+                yield lines[i]
+
+        # The parser pulls the next line only after yielding everything for
+        # the current one, so `current` attributes each item to its source.
+        for item in _level_gcode_moves(
+            feed(),
+            self.height_map,
+            arc_step_rad=self.arc_step_rad,
+            apply_to_rapids=self.apply_to_rapids,
+            state=self._state,
+        ):
+            per_line[current - start].append(item)
+            if not isinstance(item, str):
+                _collect_points(item, xs, ys, self.z_tolerance)
+        offsets = self.height_map.interpolate_many(xs, ys, self.interpolation)
+        if any(offset is None for offset in offsets):
+            raise _LevelerError("Height map interpolation failed.")
+        offset_iter = iter(offsets)
+        for i, items in enumerate(per_line):
+            out: list[str] = []
+            for item in items:
+                if isinstance(item, str):
+                    out.append(item)
+                else:
+                    _render_pending(item, offset_iter, self.z_tolerance, out)
+            # Keep one line per source line so acks and progress stay aligned.
+            self._cache[start + i] = out or [lines[start + i].strip()]
+        self._next_idx = end
+
+
+def _level_gcode_moves(
+    lines: Iterable[str],
+    height_map: HeightMap,
+    *,
+    arc_step_rad: float,
+    apply_to_rapids: bool,
+    state: _LevelState | None = None,
+    emit: bool = True,
 ):
+    """Parse lines and yield raw text or `_PendingMove` items.
+
+    `state` seeds the modal state and receives the final state once the
+    generator is exhausted. With `emit=False` moves are tracked but not
+    subdivided or formatted (the cheap pre-scan for parallel chunks).
+    """
     if not height_map.is_complete():
         raise _LevelerError("Height map is incomplete.")
     if arc_step_rad <= 0:
         arc_step_rad = math.pi / 18
 
     max_step = _grid_step(height_map)
-    units = 1.0
-    absolute = True
-    plane = "G17"
-    feed_mode = "G94"
-    arc_abs = False
-    feed_raw = None
-    last_feed_out = None
-    x = y = z = 0.0
-    g92_offset = [0.0, 0.0, 0.0]
-    g92_enabled = True
-    last_motion = 1
+    st = state if state is not None else _LevelState()
+    units = st.units
+    absolute = st.absolute
+    plane = st.plane
+    feed_mode = st.feed_mode
+    arc_abs = st.arc_abs
+    feed_raw = st.feed_raw
+    last_feed_out = st.last_feed_out
+    x, y, z = st.x, st.y, st.z
+    g92_offset = list(st.g92_offset)
+    g92_enabled = st.g92_enabled
+    last_motion = st.last_motion
     for raw_line in lines:
         raw_line_text = raw_line.rstrip("\r\n")
         if not raw_line_text.strip():
@@ -242,11 +602,10 @@ def _level_gcode_iter(
             elif motion == 1 and dx == 0 and dy == 0:
                 if not has_z:
                     yield raw_line_text
+                elif not emit:
+                    if _feed_word(feed_raw, feed_specified, last_feed_out):
+                        last_feed_out = feed_raw
                 else:
-                    offset = height_map.interpolate(x, y, interpolation)
-                    if offset is None:
-                        raise _LevelerError("Height map interpolation failed.")
-                    z_out = nz + offset
                     parts = []
                     prefix = _prefix_words(words, motion)
                     feed_out = _feed_word(feed_raw, feed_specified, last_feed_out)
@@ -257,33 +616,29 @@ def _level_gcode_iter(
                         parts.append(_axis_word("X", nx, units))
                     if has_y:
                         parts.append(_axis_word("Y", ny, units))
-                    parts.append(_axis_word("Z", z_out, units))
                     if feed_out:
-                        parts.append(feed_out)
                         last_feed_out = feed_raw
-                    yield "".join(parts)
+                    yield _PendingMove("".join(parts), x, y, nz, feed_out or "", units)
+            elif not emit:
+                if _feed_word(feed_raw, feed_specified, last_feed_out):
+                    last_feed_out = feed_raw
             else:
                 segments = _linear_segments(x, y, z, nx, ny, nz, max_step if motion == 1 else 0.0)
                 prefix = _prefix_words(words, motion)
                 feed_out = _feed_word(feed_raw, feed_specified, last_feed_out)
-                for idx, (sx, sy, sz) in enumerate(segments, start=1):
-                    z_out = sz
-                    if motion != 0 or apply_to_rapids:
-                        offset = height_map.interpolate(sx, sy, interpolation)
-                        if offset is None:
-                            raise _LevelerError("Height map interpolation failed.")
-                        z_out = sz + offset
-                    parts = []
-                    if idx == 1 and prefix:
-                        parts.extend(prefix)
-                    parts.append("G0" if motion == 0 else "G1")
-                    parts.append(_axis_word("X", sx, units))
-                    parts.append(_axis_word("Y", sy, units))
-                    parts.append(_axis_word("Z", z_out, units))
-                    if idx == 1 and feed_out:
-                        parts.append(feed_out)
-                        last_feed_out = feed_raw
-                    yield "".join(parts)
+                tail = ""
+                if feed_out:
+                    tail = feed_out
+                    last_feed_out = feed_raw
+                yield _PendingPath(
+                    "".join(prefix),
+                    "G0" if motion == 0 else "G1",
+                    x,
+                    y,
+                    segments,
+                    tail,
+                    units,
+                )
             x, y, z = nx, ny, nz
             last_motion = motion if motion is not None else last_motion
             continue
@@ -324,6 +679,12 @@ def _level_gcode_iter(
             if sweep == 0 or r == 0:
                 raise _LevelerError("Arc sweep is zero.")
             arc_len2d = abs(sweep) * r
+            if not emit:
+                if _feed_word(feed_raw, feed_specified, last_feed_out):
+                    last_feed_out = feed_raw
+                x, y, z = nx, ny, nz
+                last_motion = motion
+                continue
             if max_step > 0:
                 steps = max(8, int(math.ceil(arc_len2d / max_step)))
             else:
@@ -337,27 +698,36 @@ def _level_gcode_iter(
                 sx = cu + r * math.cos(ang)
                 sy = cv + r * math.sin(ang)
                 sz = w0 + (w1 - w0) * t
-                offset = height_map.interpolate(sx, sy, interpolation)
-                if offset is None:
-                    raise _LevelerError("Height map interpolation failed.")
-                z_out = sz + offset
                 parts = []
                 if i == 1 and prefix:
                     parts.extend(prefix)
                 parts.append("G1")
                 parts.append(_axis_word("X", sx, units))
                 parts.append(_axis_word("Y", sy, units))
-                parts.append(_axis_word("Z", z_out, units))
+                tail = ""
                 if i == 1 and feed_out:
-                    parts.append(feed_out)
+                    tail = feed_out
                     last_feed_out = feed_raw
-                yield "".join(parts)
+                yield _PendingMove("".join(parts), sx, sy, sz, tail, units)
             x, y, z = nx, ny, nz
             last_motion = motion
             continue
 
         yield raw_line_text
 
+    if state is not None:
+        state.units = units
+        state.absolute = absolute
+        state.plane = plane
+        state.feed_mode = feed_mode
+        state.arc_abs = arc_abs
+        state.feed_raw = feed_raw
+        state.last_feed_out = last_feed_out
+        state.x, state.y, state.z = x, y, z
+        state.g92_offset = list(g92_offset)
+        state.g92_enabled = g92_enabled
+        state.last_motion = last_motion
+
 
 def level_gcode_lines(
     lines: Iterable[str],
@@ -366,6 +736,7 @@ def level_gcode_lines(
     arc_step_rad: float = math.pi / 18,
     apply_to_rapids: bool = False,
     interpolation: str = "bilinear",
+    z_tolerance: float = LEVEL_Z_TOLERANCE,
 ) -> LevelResult:
     try:
         out_lines = list(
@@ -375,6 +746,7 @@ def level_gcode_lines(
                 arc_step_rad=arc_step_rad,
                 apply_to_rapids=apply_to_rapids,
                 interpolation=interpolation,
+                z_tolerance=z_tolerance,
             )
         )
     except _LevelerError as exc:
@@ -392,27 +764,54 @@ def level_gcode_file(
     interpolation: str = "bilinear",
     input_encoding: str = "utf-8",
     header_lines: list[str] | None = None,
+    workers: int | None = None,
+    z_tolerance: float = LEVEL_Z_TOLERANCE,
 ) -> LevelFileResult:
+    """Level `input_path` into `output_path`.
+
+    Inputs of at least `LEVEL_PARALLEL_MIN_BYTES` are split into line-aligned
+    chunks of about `LEVEL_CHUNK_BYTES`; a sequential pre-scan recovers the
+    modal state at each chunk start while a process pool levels the chunks,
+    and results are written back in input order. `workers` caps the pool
+    size (default: CPU count); 1 forces the single-process path.
+    """
     try:
         lines_written = 0
-        with open(input_path, "r", encoding=input_encoding, errors="replace", newline="") as infile:
-            with open(output_path, "w", encoding="utf-8", newline="") as outfile:
-                if header_lines:
-                    for header in header_lines:
-                        header_text = header.rstrip("\r\n")
-                        outfile.write(header_text)
-                        outfile.write("\n")
-                        lines_written += 1
-                for line in _level_gcode_iter(
-                    infile,
+        with open(output_path, "w", encoding="utf-8", newline="") as outfile:
+            if header_lines:
+                for header in header_lines:
+                    header_text = header.rstrip("\r\n")
+                    outfile.write(header_text)
+                    outfile.write("\n")
+                    lines_written += 1
+            pool_size = _level_pool_size(input_path, input_encoding, workers)
+            if pool_size > 1:
+                lines_written += _level_file_parallel(
+                    input_path,
+                    outfile,
                     height_map,
+                    pool_size,
                     arc_step_rad=arc_step_rad,
                     apply_to_rapids=apply_to_rapids,
                     interpolation=interpolation,
-                ):
-                    outfile.write(line.rstrip("\n"))
-                    outfile.write("\n")
-                    lines_written += 1
+                    input_encoding=input_encoding,
+                    z_tolerance=z_tolerance,
+                )
+            else:
+                with open(
+                    input_path, "r", encoding=input_encoding, errors="replace", newline=""
+                ) as infile:
+                    for line in _level_gcode_iter(
+                        infile,
+                        height_map,
+                        arc_step_rad=arc_step_rad,
+                        apply_to_rapids=apply_to_rapids,
+                        interpolation=interpolation,
+                        z_tolerance=z_tolerance,
+                    ):
+                        outfile.write(line.rstrip("\n"))
+                        outfile.write("\n")
+                        lines_written += 1
     except _LevelerError as exc:
         try:
             os.remove(output_path)
@@ -428,6 +827,161 @@ def level_gcode_file(
     return LevelFileResult(output_path, lines_written, None, False)
 
 
+def _level_pool_size(input_path: str, input_encoding: str, workers: int | None) -> int:
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        return 1
+    try:
+        if os.path.getsize(input_path) < LEVEL_PARALLEL_MIN_BYTES:
+            return 1
+        # Chunks are cut at b"\n"; that is only a line boundary for
+        # ASCII-compatible encodings.
+        if "\r\n".encode(codecs.lookup(input_encoding).name) != b"\r\n":
+            return 1
+    except (OSError, LookupError):
+        return 1
+    return workers
+
+
+def _iter_level_chunks(
+    infile: BinaryIO,
+    height_map: HeightMap,
+    *,
+    arc_step_rad: float,
+    apply_to_rapids: bool,
+    input_encoding: str,
+) -> Iterator[tuple[bytes, _LevelState]]:
+    """Yield line-aligned byte chunks with the modal state at each chunk start."""
+    state = _LevelState()
+    while True:
+        data = infile.read(LEVEL_CHUNK_BYTES)
+        if not data:
+            return
+        if not data.endswith(b"\n"):
+            data += infile.readline()
+        start_state = state.copy()
+        for _ in _level_gcode_moves(
+            _decode_chunk(data, input_encoding),
+            height_map,
+            arc_step_rad=arc_step_rad,
+            apply_to_rapids=apply_to_rapids,
+            state=state,
+            emit=False,
+        ):
+            pass
+        yield data, start_state
+
+
+def _decode_chunk(data: bytes, input_encoding: str) -> io.StringIO:
+    # newline="" splits lines exactly like the text-mode reader in the serial path.
+    return io.StringIO(data.decode(input_encoding, errors="replace"), newline="")
+
+
+_chunk_context: tuple[HeightMap, float, bool, str, str, float] | None = None
+
+
+def _init_level_chunk_worker(
+    height_map: HeightMap,
+    arc_step_rad: float,
+    apply_to_rapids: bool,
+    interpolation: str,
+    input_encoding: str,
+    z_tolerance: float,
+) -> None:
+    global _chunk_context
+    _chunk_context = (
+        height_map,
+        arc_step_rad,
+        apply_to_rapids,
+        interpolation,
+        input_encoding,
+        z_tolerance,
+    )
+
+
+def _level_chunk(data: bytes, state: _LevelState) -> tuple[str, int]:
+    if _chunk_context is None:
+        raise RuntimeError("Leveling worker was not initialized.")
+    (
+        height_map,
+        arc_step_rad,
+        apply_to_rapids,
+        interpolation,
+        input_encoding,
+        z_tolerance,
+    ) = _chunk_context
+    out: list[str] = []
+    for line in _level_gcode_iter(
+        _decode_chunk(data, input_encoding),
+        height_map,
+        arc_step_rad=arc_step_rad,
+        apply_to_rapids=apply_to_rapids,
+        interpolation=interpolation,
+        state=state,
+        z_tolerance=z_tolerance,
+    ):
+        out.append(line.rstrip("\n"))
+        out.append("\n")
+    return "".join(out), len(out) // 2
+
+
+def _level_file_parallel(
+    input_path: str,
+    outfile,
+    height_map: HeightMap,
+    pool_size: int,
+    *,
+    arc_step_rad: float,
+    apply_to_rapids: bool,
+    interpolation: str,
+    input_encoding: str,
+    z_tolerance: float,
+) -> int:
+    if not height_map.is_complete():
+        raise _LevelerError("Height map is incomplete.")
+    lines_written = 0
+    in_flight: deque[Future] = deque()
+    # Forking while the worker and UI threads hold locks can deadlock the
+    # child, so workers are always spawned fresh.
+    pool = ProcessPoolExecutor(
+        max_workers=pool_size,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_level_chunk_worker,
+        initargs=(
+            height_map,
+            arc_step_rad,
+            apply_to_rapids,
+            interpolation,
+            input_encoding,
+            z_tolerance,
+        ),
+    )
+    try:
+        with open(input_path, "rb") as infile:
+            for data, start_state in _iter_level_chunks(
+                infile,
+                height_map,
+                arc_step_rad=arc_step_rad,
+                apply_to_rapids=apply_to_rapids,
+                input_encoding=input_encoding,
+            ):
+                in_flight.append(pool.submit(_level_chunk, data, start_state))
+                # Bound memory: keep at most two chunks per worker outstanding.
+                while len(in_flight) >= pool_size * 2:
+                    text, count = in_flight.popleft().result()
+                    outfile.write(text)
+                    lines_written += count
+        while in_flight:
+            text, count = in_flight.popleft().result()
+            outfile.write(text)
+            lines_written += count
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+    logger.info(f"Leveled {input_path} in parallel ({pool_size} workers, {lines_written} lines)")
+    return lines_written
+
+
 def write_gcode_lines(
     output_path: str,
     lines: Iterable[str],
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# Simple Sender (GRBL G-code Sender)
+# Copyright (C) 2026 Bob Kolbasowski
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Optional (not required by the license): If you make improvements, please consider
+# contributing them back upstream (e.g., via a pull request) so others can benefit.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Binary height-map files and the recent-map cache.
+
+File layout (little-endian):
+    header: magic b"SSHM", version u16, nx u32, ny u32, created f64 (epoch),
+            WCO x/y/z f64 (NaN when unknown), WCS 4s (e.g. b"G54")
+    body:   xs f64[nx], ys f64[ny], z f64[nx*ny] row-major (NaN = missing),
+            invalid count u32, invalid (ix, iy) u32 pairs
+
+Every completed probe run is stored in the cache directory together with the
+work offset it was probed under, so a later job can reuse the map when its
+bounds fall inside the probed area and the WCS/WCO have not changed.
+"""
+
+from __future__ import annotations
+
+import glob
+import math
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from dataclasses import dataclass
+
+from simple_sender.autolevel.grid import ProbeBounds
+from simple_sender.autolevel.height_map import HeightMap
+from simple_sender.utils.constants import (
+    AUTOLEVEL_MAP_CACHE_KEEP,
+    AUTOLEVEL_MAP_CACHE_MAX_AGE,
+    AUTOLEVEL_MAP_CACHE_WCO_TOLERANCE,
+)
+
+HEIGHT_MAP_EXT = ".hmap"
+
+_MAGIC = b"SSHM"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHIId3d4s")
+_COUNT = struct.Struct("<I")
+_NAN = float("nan")
+
+
+@dataclass(frozen=True)
+class HeightMapRecord:
+    height_map: HeightMap
+    created: float
+    wco: tuple[float, float, float] | None
+    wcs: str
+    path: str = ""
+
+    def covers(self, bounds: ProbeBounds, tol: float = 1e-6) -> bool:
+        xs = self.height_map.xs
+        ys = self.height_map.ys
+        return (
+            xs[0] - tol <= bounds.minx
+            and bounds.maxx <= xs[-1] + tol
+            and ys[0] - tol <= bounds.miny
+            and bounds.maxy <= ys[-1] + tol
+        )
+
+    def matches_offset(
+        self,
+        wco: tuple[float, float, float] | None,
+        wcs: str,
+        tol: float = AUTOLEVEL_MAP_CACHE_WCO_TOLERANCE,
+    ) -> bool:
+        if wco is None or self.wco is None:
+            return False
+        if self.wcs.upper() != (wcs or "").upper():
+            return False
+        return all(abs(a - b) <= tol for a, b in zip(self.wco, wco))
+
+
+def _pack_doubles(values: list[float] | array) -> bytes:
+    data = array("d", values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data.tobytes()
+
+
+def _unpack_doubles(raw: bytes) -> array:
+    data = array("d")
+    data.frombytes(raw)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data
+
+
+def write_height_map(
+    path: str,
+    height_map: HeightMap,
+    *,
+    wco: tuple[float, float, float] | None = None,
+    wcs: str = "",
+    created: float | None = None,
+) -> None:
+    """Write `height_map` atomically in the binary format."""
+    nx = len(height_map.xs)
+    ny = len(height_map.ys)
+    wco_vals = tuple(float(v) for v in wco[:3]) if wco else (_NAN, _NAN, _NAN)
+    z = [
+        _NAN if (value := height_map.get_index(ix, iy)) is None else value
+        for iy in range(ny)
+        for ix in range(nx)
+    ]
+    invalid = height_map.invalid_indices()
+    parts = [
+        _HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            nx,
+            ny,
+            time.time() if created is None else float(created),
+            *wco_vals,
+            (wcs or "").upper().encode("ascii", errors="ignore")[:4],
+        ),
+        _pack_doubles(height_map.xs),
+        _pack_doubles(height_map.ys),
+        _pack_doubles(z),
+        _COUNT.pack(len(invalid)),
+        struct.pack(f"<{2 * len(invalid)}I", *(v for pair in invalid for v in pair)),
+    ]
+    dir_name = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".hmap-", dir=dir_name)
+    try:
+        with os.fdopen(fd, "wb") as outfile:
+            outfile.write(b"".join(parts))
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def read_height_map(path: str) -> HeightMapRecord:
+    with open(path, "rb") as infile:
+        data = infile.read()
+    if len(data) < _HEADER.size:
+        raise ValueError("Height map file is truncated")
+    magic, version, nx, ny, created, wx, wy, wz, wcs_raw = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("Not a Simple Sender height map")
+    offset = _HEADER.size
+    sizes = (nx, ny, nx * ny)
+    arrays: list[array] = []
+    for count in sizes:
+        end = offset + 8 * count
+        if end > len(data):
+            raise ValueError("Height map file is truncated")
+        arrays.append(_unpack_doubles(data[offset:end]))
+        offset = end
+    xs, ys, z = arrays
+    if offset + _COUNT.size > len(data):
+        raise ValueError("Height map file is truncated")
+    (invalid_count,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    if offset + 8 * invalid_count > len(data):
+        raise ValueError("Height map file is truncated")
+    flat = struct.unpack_from(f"<{2 * invalid_count}I", data, offset)
+    invalid = list(zip(flat[0::2], flat[1::2]))
+    height_map = HeightMap(list(xs), list(ys), invalid_points=invalid)
+    for pos, value in enumerate(z):
+        if not math.isnan(value):
+            height_map.set_index(pos % nx, pos // nx, value)
+    wco = None if any(math.isnan(v) for v in (wx, wy, wz)) else (wx, wy, wz)
+    wcs = wcs_raw.rstrip(b"\0").decode("ascii", errors="ignore")
+    return HeightMapRecord(height_map, created, wco, wcs, path)
+
+
+def is_binary_height_map(path: str) -> bool:
+    try:
+        with open(path, "rb") as infile:
+            return infile.read(len(_MAGIC)) == _MAGIC
+    except OSError:
+        return False
+
+
+def store_height_map(
+    directory: str,
+    height_map: HeightMap,
+    *,
+    wco: tuple[float, float, float] | None,
+    wcs: str,
+    keep: int = AUTOLEVEL_MAP_CACHE_KEEP,
+) -> str:
+    """Add a probed map to the cache directory and prune the oldest entries."""
+    os.makedirs(directory, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(
+        directory,
+        f"map-{stamp}-{len(height_map.xs)}x{len(height_map.ys)}{HEIGHT_MAP_EXT}",
+    )
+    write_height_map(path, height_map, wco=wco, wcs=wcs)
+    for old in _cache_files(directory)[max(1, keep):]:
+        try:
+            os.remove(old)
+        except OSError:
+            pass
+    return path
+
+
+def find_reusable_map(
+    directory: str,
+    bounds: ProbeBounds,
+    *,
+    wco: tuple[float, float, float] | None,
+    wcs: str,
+    max_age: float = AUTOLEVEL_MAP_CACHE_MAX_AGE,
+    now: float | None = None,
+) -> HeightMapRecord | None:
+    """Return the newest complete cached map that covers `bounds`.
+
+    A map only qualifies when it was probed within `max_age` seconds under
+    the same WCS and work offset; with an unknown current offset nothing is
+    reused.
+    """
+    if wco is None or not os.path.isdir(directory):
+        return None
+    now = time.time() if now is None else now
+    for path in _cache_files(directory):
+        try:
+            record = read_height_map(path)
+        except Exception:
+            continue
+        if now - record.created > max_age:
+            # Files are newest first, so everything after is older still.
+            break
+        if (
+            record.matches_offset(wco, wcs)
+            and record.covers(bounds)
+            and record.height_map.is_complete()
+        ):
+            return record
+    return None
+
+
+def _cache_files(directory: str) -> list[str]:
+    paths = glob.glob(os.path.join(directory, f"*{HEIGHT_MAP_EXT}"))
+
+    def mtime(path: str) -> float:
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return 0.0
+
+    return sorted(paths, key=mtime, reverse=True)
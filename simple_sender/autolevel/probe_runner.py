@@ -20,14 +20,27 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from bisect import bisect_left, bisect_right
+from collections import deque
 from dataclasses import dataclass
+import math
+import queue
 import threading
 import time
-from typing import Any, Callable, cast
+from typing import Any, Callable, Sequence
 
-from simple_sender.autolevel.grid import ProbeGrid
+from simple_sender.autolevel.grid import ProbeGrid, tour_length
 from simple_sender.autolevel.height_map import HeightMap
 from simple_sender.autolevel.probe_controller import ProbeReport
+from simple_sender.autolevel.refine import AdaptiveProbePlan
+from simple_sender.utils.constants import (
+    AUTOLEVEL_PROBE_HALT_TIMEOUT,
+    AUTOLEVEL_PROBE_PIPELINE_DEPTH,
+)
+
+
+RETRACT_FIXED = "fixed"
+RETRACT_ADAPTIVE = "adaptive"
 
 
 @dataclass(frozen=True)
@@ -39,6 +52,135 @@ class ProbeRunSettings:
     settle_time: float = 0.0
     probe_timeout: float = 10.0
     idle_timeout: float = 30.0
+    # "adaptive" travels between points at the highest measured height near
+    # the move plus `travel_clearance` (never above safe Z) instead of safe Z.
+    # Nodes not probed yet (including the destination) are bounded by their
+    # probed neighbours. It falls back to safe Z whenever the move crosses an
+    # avoidance area, passes a skipped node, or passes a node with no probed
+    # neighbour.
+    retract_mode: str = RETRACT_FIXED
+    travel_clearance: float = 1.0
+    # Avoidance circles as (x, y, radius squared), as parsed by the dialog.
+    avoidance_areas: tuple[tuple[float, float, float], ...] = ()
+
+    def adaptive_retract(self) -> bool:
+        return self.retract_mode == RETRACT_ADAPTIVE
+
+
+def _segment_distance(px: float, py: float, ax: float, ay: float, bx: float, by: float) -> float:
+    dx = bx - ax
+    dy = by - ay
+    length2 = dx * dx + dy * dy
+    t = 0.0 if length2 <= 0 else max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length2))
+    return math.hypot(px - (ax + t * dx), py - (ay + t * dy))
+
+
+def _grid_step(axis: list[float]) -> float:
+    return max((b - a for a, b in zip(axis, axis[1:])), default=0.0)
+
+
+def _crosses_avoidance(
+    areas: Sequence[tuple[float, float, float]],
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+    margin: float = 0.0,
+) -> bool:
+    for cx, cy, r2 in areas:
+        if _segment_distance(cx, cy, ax, ay, bx, by) <= math.sqrt(r2) + margin:
+            return True
+    return False
+
+
+def _segment_node_heights(
+    height_map: HeightMap,
+    ax: float,
+    ay: float,
+    bx: float,
+    by: float,
+) -> list[float] | None:
+    """Heights that bound the surface within one grid step of the segment a-b.
+
+    Probed nodes near the segment count directly. A node that is not probed
+    yet (including the destination) is bounded by its probed neighbours;
+    without any, nothing is known there and None is returned. A skipped
+    (avoidance) node near the segment also returns None.
+    """
+    xs = height_map.xs
+    ys = height_map.ys
+    nx = len(xs)
+    ny = len(ys)
+    margin = max(_grid_step(xs), _grid_step(ys)) + 1e-9
+    ix0 = bisect_left(xs, min(ax, bx) - margin)
+    ix1 = bisect_right(xs, max(ax, bx) + margin)
+    iy0 = bisect_left(ys, min(ay, by) - margin)
+    iy1 = bisect_right(ys, max(ay, by) + margin)
+    heights: list[float] = []
+    for iy in range(iy0, iy1):
+        for ix in range(ix0, ix1):
+            if _segment_distance(xs[ix], ys[iy], ax, ay, bx, by) > margin:
+                continue
+            if height_map.is_invalid_index(ix, iy):
+                return None
+            z = height_map.get_index(ix, iy)
+            if z is not None:
+                heights.append(z)
+                continue
+            neighbours = [
+                nz
+                for jy in range(max(0, iy - 1), min(ny, iy + 2))
+                for jx in range(max(0, ix - 1), min(nx, ix + 2))
+                if (nz := height_map.get_index(jx, jy)) is not None
+            ]
+            if not neighbours:
+                return None
+            heights.extend(neighbours)
+    return heights or None
+
+
+def estimate_probe_time(
+    points: Sequence[tuple[float, float]],
+    settings: ProbeRunSettings,
+    *,
+    rapid_xy: float,
+    rapid_z: float,
+) -> float:
+    """Predict the probing time (seconds) for `points` in the given order.
+
+    Assumes the surface sits near Z0 and moves at full rapid (mm/min) without
+    acceleration, so it is a lower bound that is mainly useful for comparing
+    probe orders and settings. In adaptive mode the first point and moves that
+    pass within one grid step of an avoidance area are counted at safe Z, as
+    the run does.
+    """
+    if not points or rapid_xy <= 0 or rapid_z <= 0:
+        return 0.0
+
+    def point_time(travel_z: float) -> float:
+        descent = min(abs(settings.probe_depth), max(0.0, travel_z))
+        return (
+            max(0.0, travel_z - settings.retract_z) / rapid_z
+            + descent / max(1e-6, settings.probe_feed)
+            + max(0.0, settings.retract_z) / rapid_z
+        ) * 60.0 + max(0.0, settings.settle_time)
+
+    safe_time = point_time(settings.safe_z)
+    total = safe_time
+    if settings.adaptive_retract():
+        low_time = point_time(min(settings.safe_z, max(0.0, settings.travel_clearance)))
+        xs = sorted({x for x, _ in points})
+        ys = sorted({y for _, y in points})
+        step = max(_grid_step(xs), _grid_step(ys))
+        for (ax, ay), (bx, by) in zip(points, points[1:]):
+            if _crosses_avoidance(settings.avoidance_areas, ax, ay, bx, by, step):
+                total += safe_time
+            else:
+                total += low_time
+    else:
+        total += safe_time * (len(points) - 1)
+    travel = tour_length(points) / rapid_xy * 60.0
+    return total + travel
 
 
 class AutoLevelProbeRunner:
@@ -63,6 +205,7 @@ class AutoLevelProbeRunner:
         on_point: Callable[[int, int, float], None] | None = None,
         on_progress: Callable[[int, int], None] | None = None,
         on_done: Callable[[bool, str | None], None] | None = None,
+        plan: AdaptiveProbePlan | None = None,
     ) -> bool:
         if self._running:
             return False
@@ -79,7 +222,7 @@ class AutoLevelProbeRunner:
         self._cancel.clear()
         self._thread = threading.Thread(
             target=self._run,
-            args=(grid, height_map, settings, on_point, on_progress, on_done),
+            args=(grid, height_map, settings, on_point, on_progress, on_done, plan),
             daemon=True,
         )
         self._running = True
@@ -94,48 +237,106 @@ class AutoLevelProbeRunner:
         on_point: Callable[[int, int, float], None] | None,
         on_progress: Callable[[int, int], None] | None,
         on_done: Callable[[bool, str | None], None] | None,
+        plan: AdaptiveProbePlan | None = None,
     ) -> None:
         ok = False
         reason = None
         force_g90_on_exit = False
         prev_units, prev_distance = self._snapshot_modal_state()
+        probe_controller = self.app.probe_controller
+        reports: queue.Queue[ProbeReport] = queue.Queue()
+        probe_controller.register_callback(reports.put)
+        # Points whose commands are queued on the controller, oldest first;
+        # [PRB:] reports arrive in the same order.
+        in_flight: deque[tuple[float, float]] = deque()
         try:
-            self.app.probe_controller.clear()
+            probe_controller.clear()
             if not self._send_and_wait("G21", settings.idle_timeout):
                 reason = "Failed to set units."
                 return
             if not self._send_and_wait("G90", settings.idle_timeout):
                 reason = "Failed to set distance mode."
                 return
-            total = len(grid.points)
-            for idx, (x, y) in enumerate(grid.points):
-                if self._cancel.is_set():
-                    reason = "Cancelled."
-                    return
-                if not self._probe_point(x, y, settings, height_map):
-                    reason = "Probe failed."
-                    force_g90_on_exit = True
-                    return
-                if on_point:
-                    try:
-                        indices = height_map.index_for(x, y)
-                        if indices:
-                            ix, iy = indices
-                            z_val = height_map.get_index(ix, iy)
-                            if z_val is not None:
-                                on_point(ix, iy, z_val)
-                    except Exception:
-                        pass
-                if on_progress:
-                    try:
-                        on_progress(idx + 1, total)
-                    except Exception:
-                        pass
+            batch = list(grid.points) if plan is None else plan.next_points()
+            total = len(batch)
+            done = 0
+            # Adaptive travel heights need the previous point's result, so
+            # only one point is queued at a time in that mode.
+            window = 1 if settings.adaptive_retract() else max(1, int(AUTOLEVEL_PROBE_PIPELINE_DEPTH))
+            measured: list[tuple[float, float, float]] = []
+            report_timeout = settings.idle_timeout + settings.probe_timeout
+            while batch:
+                queued = 0
+                for _ in range(len(batch)):
+                    if self._cancel.is_set():
+                        reason = "Cancelled."
+                        return
+                    while queued < len(batch) and len(in_flight) < window:
+                        qx, qy = batch[queued]
+                        travel = self._travel_command(qx, qy, settings, measured, height_map)
+                        # Tracked before sending so a partly queued block is halted too.
+                        in_flight.append((qx, qy))
+                        if not self._queue_probe_point(qx, qy, settings, travel):
+                            reason = "Probe failed."
+                            force_g90_on_exit = True
+                            return
+                        queued += 1
+                    x, y = in_flight.popleft()
+                    hit = self._probe_point(x, y, reports, report_timeout, height_map)
+                    if hit is None:
+                        reason = "Cancelled." if self._cancel.is_set() else "Probe failed."
+                        force_g90_on_exit = True
+                        return
+                    measured.append((x, y, hit))
+                    done += 1
+                    if on_point:
+                        try:
+                            indices = height_map.index_for(x, y)
+                            if indices:
+                                ix, iy = indices
+                                z_val = height_map.get_index(ix, iy)
+                                if z_val is not None:
+                                    on_point(ix, iy, z_val)
+                        except Exception:
+                            pass
+                    if on_progress:
+                        try:
+                            on_progress(done, total)
+                        except Exception:
+                            pass
+                # Adaptive plans pick the next points from this batch's heights.
+                batch = [] if plan is None else plan.next_points()
+                total += len(batch)
+            if plan is not None:
+                filled = plan.finish()
+                self._log(
+                    f"[autolevel] Adaptive refinement: probed {done} point(s), interpolated {filled}."
+                )
+            # The last point's retract is still queued behind its report.
+            if not self._wait_for_commands(settings.idle_timeout):
+                reason = "Probe failed."
+                force_g90_on_exit = True
+                return
             ok = True
         except Exception as exc:
             reason = reason or f"Error: {exc}"
             self._log(f"[autolevel] Probe run failed: {exc}")
         finally:
+            probe_controller.unregister_callback(reports.put)
+            if not ok:
+                # Drop commands for points that were queued but not reached.
+                try:
+                    self.app.grbl.clear_manual_queue()
+                except Exception as exc:
+                    self._log(f"[autolevel] Failed to clear queued probe commands: {exc}")
+                # Commands already written sit in GRBL's RX buffer, where
+                # clearing the queue cannot reach them; without a halt the
+                # machine would still travel to and probe the next point.
+                if in_flight:
+                    try:
+                        self._halt_controller()
+                    except Exception as exc:
+                        self._log(f"[autolevel] Failed to halt queued probe moves: {exc}")
             try:
                 self._restore_modal_state(prev_units, prev_distance, settings.idle_timeout)
             except Exception as exc:
@@ -152,6 +353,30 @@ class AutoLevelProbeRunner:
                 except Exception:
                     pass
 
+    def _halt_controller(self) -> None:
+        """Stop motion and flush GRBL's planner and RX buffer.
+
+        A feed hold decelerates first so the soft reset that flushes the
+        buffer does not raise a position-loss alarm, then the runner waits for
+        the controller banner before modal state is restored.
+        """
+        grbl = self.app.grbl
+        if not grbl.is_connected() or getattr(self.app, "_alarm_locked", False):
+            # An alarm already flushed the controller's buffers.
+            return
+        self._log("[autolevel] Halting queued probe moves (feed hold + reset).")
+        grbl.hold()
+        deadline = time.monotonic() + AUTOLEVEL_PROBE_HALT_TIMEOUT
+        while time.monotonic() < deadline:
+            state = str(getattr(self.app, "_machine_state_text", "")).strip().lower()
+            if state.startswith("hold:0") or state.startswith("idle") or state.startswith("alarm"):
+                break
+            time.sleep(0.05)
+        grbl.reset()
+        deadline = time.monotonic() + AUTOLEVEL_PROBE_HALT_TIMEOUT
+        while time.monotonic() < deadline and not getattr(grbl, "_ready", True):
+            time.sleep(0.05)
+
     def _snapshot_modal_state(self) -> tuple[str | None, str | None]:
         try:
             with self.app.macro_executor.macro_vars() as macro_vars:
@@ -188,54 +413,116 @@ class AutoLevelProbeRunner:
         setattr(self.app, "_pending_force_g90", True)
         self._log(f"[autolevel] Pending G90 restore ({reason}).")
 
-    def _probe_point(
+    def _travel_command(
         self,
         x: float,
         y: float,
         settings: ProbeRunSettings,
-        height_map: HeightMap,
+        measured: list[tuple[float, float, float]],
+        height_map: HeightMap | None = None,
+    ) -> str:
+        """Return the Z move that precedes the XY move to (x, y)."""
+        fixed = f"G0 Z{settings.safe_z:.3f}"
+        if not settings.adaptive_retract() or not measured or height_map is None:
+            return fixed
+        px, py, _pz = measured[-1]
+        if _crosses_avoidance(settings.avoidance_areas, px, py, x, y):
+            return fixed
+        near = _segment_node_heights(height_map, px, py, x, y)
+        if not near:
+            return fixed
+        # Probe heights are machine coordinates, so the adaptive move uses G53.
+        target = max(near) + max(0.0, settings.travel_clearance)
+        wco = getattr(self.app, "_wco_raw", None)
+        if wco and len(wco) >= 3:
+            try:
+                if target >= settings.safe_z + float(wco[2]):
+                    return fixed
+            except (TypeError, ValueError):
+                pass
+        return f"G53 G0 Z{target:.3f}"
+
+    def _queue_probe_point(
+        self,
+        x: float,
+        y: float,
+        settings: ProbeRunSettings,
+        travel: str | None = None,
     ) -> bool:
-        if not self._send_and_wait(f"G0 Z{settings.safe_z:.3f}", settings.idle_timeout):
-            return False
-        if not self._send_and_wait(f"G0 X{x:.3f} Y{y:.3f}", settings.idle_timeout):
-            return False
-        if settings.settle_time > 0:
-            dwell = max(0.0, settings.settle_time)
-            if not self._send_and_wait(f"G4 P{dwell:.3f}", settings.idle_timeout):
-                return False
-        if not self._send_and_wait("G91", settings.idle_timeout):
-            return False
+        """Queue the full command block for one point without waiting.
+
+        The worker's manual queue paces the lines into the RX buffer, so the
+        controller runs travel-Z, XY move, probe and retract back to back.
+        """
         depth = abs(settings.probe_depth)
         if depth <= 0:
             return False
-        self.app.probe_controller.clear()
-        if not self._send_and_wait(
-            f"G38.2 Z-{depth:.3f} F{settings.probe_feed:.3f}",
-            settings.probe_timeout,
-        ):
-            return False
-        report = self._wait_for_probe_report(settings.probe_timeout)
+        commands = [
+            travel or f"G0 Z{settings.safe_z:.3f}",
+            f"G0 X{x:.3f} Y{y:.3f}",
+        ]
+        if settings.settle_time > 0:
+            commands.append(f"G4 P{max(0.0, settings.settle_time):.3f}")
+        commands.extend(
+            (
+                "G91",
+                f"G38.2 Z-{depth:.3f} F{settings.probe_feed:.3f}",
+                f"G0 Z{settings.retract_z:.3f}",
+                "G90",
+            )
+        )
+        for command in commands:
+            if self._cancel.is_set() or not self._can_send():
+                return False
+            try:
+                self.app.grbl.send_immediate(command, source="autolevel")
+            except Exception:
+                return False
+        return True
+
+    def _probe_point(
+        self,
+        x: float,
+        y: float,
+        reports: queue.Queue[ProbeReport],
+        timeout_s: float,
+        height_map: HeightMap,
+    ) -> float | None:
+        report = self._wait_for_probe_report(reports, timeout_s)
         if report is None or not report.ok:
-            return False
+            return None
         if not height_map.set_point(x, y, report.z):
-            return False
-        if not self._send_and_wait(f"G0 Z{settings.retract_z:.3f}", settings.idle_timeout):
-            return False
-        if not self._send_and_wait("G90", settings.idle_timeout):
-            return False
-        return True
+            return None
+        return report.z
 
-    def _wait_for_probe_report(self, timeout_s: float) -> ProbeReport | None:
-        start = time.time()
+    def _wait_for_probe_report(
+        self,
+        reports: queue.Queue[ProbeReport],
+        timeout_s: float,
+    ) -> ProbeReport | None:
+        deadline = time.monotonic() + timeout_s if timeout_s else None
         while True:
-            if self._cancel.is_set():
+            if self._cancel.is_set() or getattr(self.app, "_alarm_locked", False):
                 return None
-            report = self.app.probe_controller.last_report()
-            if report is not None:
-                return cast(ProbeReport, report)
-            if timeout_s and (time.time() - start) > timeout_s:
-                return None
-            time.sleep(0.02)
+            wait = 0.1
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                wait = min(wait, remaining)
+            try:
+                return reports.get(timeout=wait)
+            except queue.Empty:
+                continue
+
+    def _can_send(self) -> bool:
+        grbl = self.app.grbl
+        return bool(grbl.is_connected()) and not getattr(self.app, "_alarm_locked", False)
+
+    def _wait_for_commands(self, timeout_s: float) -> bool:
+        if not self.app.grbl.wait_for_manual_completion(timeout_s=timeout_s):
+            return False
+        return self._wait_for_idle(timeout_s)
 
     def _send_and_wait(self, command: str, timeout_s: float) -> bool:
         if self._cancel.is_set():
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# Simple Sender (GRBL G-code Sender)
+# Copyright (C) 2026 Bob Kolbasowski
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Optional (not required by the license): If you make improvements, please consider
+# contributing them back upstream (e.g., via a pull request) so others can benefit.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Adaptive refinement planning for auto-level probing.
+
+The plan works in the index space of the target `HeightMap` grid. It first
+probes every `coarse_stride`-th node, then splits only the cells whose
+surface is not explained by bilinear interpolation of their corners:
+
+* coarse cells are split when the second difference of the coarse lattice
+  (the bilinear error estimate for a quadratic surface) or the cell twist
+  exceeds `tolerance`;
+* split cells keep splitting while a newly probed midpoint deviates from the
+  parent's bilinear prediction by more than `tolerance`.
+
+Nodes that were never probed are filled from their leaf cell's bilinear
+interpolation by `finish()`. Leaf cells with a skipped (invalid) or missing
+corner cannot be interpolated, so once refinement settles, a last batch
+probes every valid node such cells leave uncovered and the resulting map is
+complete.
+"""
+
+from __future__ import annotations
+
+import math
+
+from simple_sender.autolevel.grid import optimize_probe_order
+from simple_sender.autolevel.height_map import HeightMap
+
+_Cell = tuple[int, int, int, int]
+
+
+def _coarse_axis(count: int, stride: int) -> list[int]:
+    indices = list(range(0, count, stride))
+    if indices[-1] != count - 1:
+        indices.append(count - 1)
+    return indices
+
+
+def _bilinear(cell: _Cell, corners: tuple, ix: int, iy: int) -> float:
+    i0, i1, j0, j1 = cell
+    z00, z10, z01, z11 = corners
+    tx = (ix - i0) / (i1 - i0) if i1 > i0 else 0.0
+    ty = (iy - j0) / (j1 - j0) if j1 > j0 else 0.0
+    return z00 * (1 - tx) * (1 - ty) + z10 * tx * (1 - ty) + z01 * (1 - tx) * ty + z11 * tx * ty
+
+
+class AdaptiveProbePlan:
+    """Incremental probe plan for one `HeightMap`.
+
+    Call `next_points()` after each batch has been probed into the map; it
+    returns the next batch of (x, y) points, or an empty list once the map
+    is refined to `tolerance`. Then call `finish()`.
+    """
+
+    def __init__(self, height_map: HeightMap, *, tolerance: float, coarse_stride: int = 4):
+        self.height_map = height_map
+        self.tolerance = max(0.0, float(tolerance))
+        self.coarse_stride = max(1, int(coarse_stride))
+        self._cx = _coarse_axis(len(height_map.xs), self.coarse_stride)
+        self._cy = _coarse_axis(len(height_map.ys), self.coarse_stride)
+        self._leaves: list[_Cell] = []
+        # Coarse cells waiting for the lattice check, and cells whose
+        # midpoints were requested in the last batch.
+        self._coarse: list[_Cell] = []
+        self._pending: list[_Cell] = []
+        self._requested: set[tuple[int, int]] = set()
+        self._started = False
+        self._swept = False
+        self._last: tuple[float, float] | None = None
+
+    @property
+    def requested_count(self) -> int:
+        return len(self._requested)
+
+    def next_points(self) -> list[tuple[float, float]]:
+        if not self._started:
+            self._started = True
+            if self.tolerance <= 0:
+                # Nothing to gain from refinement: probe the full grid.
+                nodes = [(ix, iy) for iy in range(len(self.height_map.ys)) for ix in range(len(self.height_map.xs))]
+                return self._emit(nodes)
+            # A single-node axis still forms (degenerate) cells along the other.
+            x_spans = list(zip(self._cx, self._cx[1:])) or [(0, 0)]
+            y_spans = list(zip(self._cy, self._cy[1:])) or [(0, 0)]
+            self._coarse = [(i0, i1, j0, j1) for j0, j1 in y_spans for i0, i1 in x_spans]
+            return self._emit([(ix, iy) for iy in self._cy for ix in self._cx])
+        candidates: list[_Cell] = []
+        for cell in self._coarse:
+            if self._coarse_error(cell) > self.tolerance:
+                candidates.append(cell)
+            else:
+                self._leaves.append(cell)
+        self._coarse = []
+        for cell in self._pending:
+            if self._residual(cell, self._midpoints(cell)) > self.tolerance:
+                candidates.extend(self._children(cell))
+            else:
+                self._leaves.extend(self._children(cell))
+        self._pending = []
+        batch: list[tuple[int, int]] = []
+        while candidates:
+            cell = candidates.pop()
+            children = self._children(cell)
+            if len(children) == 1:
+                self._leaves.append(cell)
+                continue
+            mids = self._midpoints(cell)
+            unknown = [node for node in mids if self._unknown(node)]
+            if unknown:
+                batch.extend(unknown)
+                self._pending.append(cell)
+            elif self._residual(cell, mids) > self.tolerance:
+                candidates.extend(children)
+            else:
+                self._leaves.extend(children)
+        if not batch and not self._pending and not self._swept:
+            self._swept = True
+            batch = self._uncovered_nodes()
+        return self._emit(batch)
+
+    def finish(self) -> int:
+        """Fill nodes that were not probed; return how many were filled."""
+        height_map = self.height_map
+        cells = self._leaves + self._coarse
+        for cell in self._pending:
+            cells.extend(self._children(cell))
+        filled = 0
+        for cell in cells:
+            i0, i1, j0, j1 = cell
+            corners = (
+                height_map.get_index(i0, j0),
+                height_map.get_index(i1, j0),
+                height_map.get_index(i0, j1),
+                height_map.get_index(i1, j1),
+            )
+            if any(z is None for z in corners):
+                continue
+            for iy in range(j0, j1 + 1):
+                for ix in range(i0, i1 + 1):
+                    if self._unknown((ix, iy)):
+                        height_map.set_index(ix, iy, _bilinear(cell, corners, ix, iy))
+                        filled += 1
+        return filled
+
+    def _uncovered_nodes(self) -> list[tuple[int, int]]:
+        """Unknown valid nodes that no leaf cell can interpolate."""
+        height_map = self.height_map
+        covered: set[tuple[int, int]] = set()
+        for i0, i1, j0, j1 in self._leaves:
+            corners = (
+                height_map.get_index(i0, j0),
+                height_map.get_index(i1, j0),
+                height_map.get_index(i0, j1),
+                height_map.get_index(i1, j1),
+            )
+            if any(z is None for z in corners):
+                continue
+            covered.update((ix, iy) for iy in range(j0, j1 + 1) for ix in range(i0, i1 + 1))
+        return [
+            (ix, iy)
+            for iy in range(len(height_map.ys))
+            for ix in range(len(height_map.xs))
+            if (ix, iy) not in covered and self._unknown((ix, iy))
+        ]
+
+    def _emit(self, nodes: list[tuple[int, int]]) -> list[tuple[float, float]]:
+        xs = self.height_map.xs
+        ys = self.height_map.ys
+        points: list[tuple[float, float]] = []
+        for ix, iy in nodes:
+            if (ix, iy) in self._requested or not self._unknown((ix, iy)):
+                continue
+            self._requested.add((ix, iy))
+            points.append((xs[ix], ys[iy]))
+        if not points:
+            return []
+        ordered = optimize_probe_order(points, start=self._last)
+        self._last = ordered[-1]
+        return ordered
+
+    def _unknown(self, node: tuple[int, int]) -> bool:
+        ix, iy = node
+        return self.height_map.get_index(ix, iy) is None and not self.height_map.is_invalid_index(ix, iy)
+
+    def _children(self, cell: _Cell) -> list[_Cell]:
+        i0, i1, j0, j1 = cell
+        xs = [(i0, i1)] if i1 - i0 <= 1 else [(i0, (i0 + i1) // 2), ((i0 + i1) // 2, i1)]
+        ys = [(j0, j1)] if j1 - j0 <= 1 else [(j0, (j0 + j1) // 2), ((j0 + j1) // 2, j1)]
+        return [(a, b, c, d) for c, d in ys for a, b in xs]
+
+    def _midpoints(self, cell: _Cell) -> list[tuple[int, int]]:
+        i0, i1, j0, j1 = cell
+        xs_i = [i0, i1] if i1 - i0 <= 1 else [i0, (i0 + i1) // 2, i1]
+        ys_i = [j0, j1] if j1 - j0 <= 1 else [j0, (j0 + j1) // 2, j1]
+        corners = {(i0, j0), (i1, j0), (i0, j1), (i1, j1)}
+        return [(ix, iy) for iy in ys_i for ix in xs_i if (ix, iy) not in corners]
+
+    def _residual(self, cell: _Cell, nodes: list[tuple[int, int]]) -> float:
+        """Largest deviation of `nodes` from the cell's bilinear surface."""
+        height_map = self.height_map
+        i0, i1, j0, j1 = cell
+        corners = (
+            height_map.get_index(i0, j0),
+            height_map.get_index(i1, j0),
+            height_map.get_index(i0, j1),
+            height_map.get_index(i1, j1),
+        )
+        if any(z is None for z in corners):
+            return math.inf
+        worst = 0.0
+        for ix, iy in nodes:
+            z = height_map.get_index(ix, iy)
+            if z is None:
+                if height_map.is_invalid_index(ix, iy):
+                    continue
+                return math.inf
+            worst = max(worst, abs(z - _bilinear(cell, corners, ix, iy)))
+        return worst
+
+    def _coarse_error(self, cell: _Cell) -> float:
+        """Bilinear error estimate for a coarse cell from the coarse lattice."""
+        height_map = self.height_map
+        i0, i1, j0, j1 = cell
+        corners = (
+            height_map.get_index(i0, j0),
+            height_map.get_index(i1, j0),
+            height_map.get_index(i0, j1),
+            height_map.get_index(i1, j1),
+        )
+        if any(z is None for z in corners):
+            return math.inf
+        z00, z10, z01, z11 = corners
+        worst = abs(z00 - z10 - z01 + z11) / 4.0
+        cx = self._cx
+        cy = self._cy
+        for axis, positions, fixed in ((0, cx, (j0, j1)), (1, cy, (i0, i1))):
+            lo = i0 if axis == 0 else j0
+            hi = i1 if axis == 0 else j1
+            at = positions.index(lo)
+            for other in fixed:
+                # Second differences centered on either end of the cell edge.
+                for center in (at, positions.index(hi)):
+                    if center <= 0 or center >= len(positions) - 1:
+                        continue
+                    trio = [positions[center - 1], positions[center], positions[center + 1]]
+                    if axis == 0:
+                        values = [height_map.get_index(i, other) for i in trio]
+                    else:
+                        values = [height_map.get_index(other, j) for j in trio]
+                    if any(v is None for v in values):
+                        continue
+                    a, b, c = values
+                    worst = max(worst, abs(a - 2.0 * b + c) / 8.0)
+        return worst
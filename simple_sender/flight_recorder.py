@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+# Simple Sender (GRBL G-code Sender)
+# Copyright (C) 2026 Bob Kolbasowski
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Optional (not required by the license): If you make improvements, please consider
+# contributing them back upstream (e.g., via a pull request) so others can benefit.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Binary flight recorder for serial sessions.
+
+Every TX/RX frame is captured with a monotonic timestamp, the stream send/ack
+indices and the RX-window state at the time of the frame. Frames are packed
+into an in-memory buffer on the calling thread and written to a rotating file
+by a background flush thread, so recording never blocks the RX/TX threads on
+disk I/O.
+
+Recordings can be fed back through `GrblWorker._handle_rx_line` (and from
+there the normal UI event path) with `replay_recording()`, at original or
+accelerated speed.
+
+File layout (little-endian):
+    header: magic b"SSFR", version u16, wall-clock start f64, monotonic start f64
+    frame:  kind u8, monotonic ts f64, send_index i32, ack_index i32,
+            rx_used u16, rx_window u16, piece u16, flags u8,
+            payload length u16, payload bytes
+
+`piece` and the `final` flag (bit 0 of `flags`) describe stream lines that
+were split across several writes, as in `StreamQueueItem`.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from .types import StreamQueueItem
+from .utils.constants import (
+    FLIGHT_RECORDER_BACKUPS,
+    FLIGHT_RECORDER_FLUSH_INTERVAL,
+    FLIGHT_RECORDER_MAX_BYTES,
+    FLIGHT_RECORDER_MAX_PENDING,
+)
+
+logger = logging.getLogger(__name__)
+
+FRAME_TX_STREAM = 1
+FRAME_TX_MANUAL = 2
+FRAME_TX_REALTIME = 3
+FRAME_RX = 4
+
+_MAGIC = b"SSFR"
+_VERSION = 2
+_HEADER = struct.Struct("<4sHdd")
+_FRAME = struct.Struct("<BdiiHHHBH")
+_FLAG_FINAL = 0x01
+_U16_MAX = 0xFFFF
+
+
+@dataclass(frozen=True, slots=True)
+class FlightFrame:
+    kind: int
+    ts: float
+    send_index: int
+    ack_index: int
+    rx_used: int
+    rx_window: int
+    data: bytes
+    piece: int = 0
+    final: bool = True
+
+    @property
+    def is_tx(self) -> bool:
+        return self.kind != FRAME_RX
+
+
+def _clamp_u16(value: int) -> int:
+    return max(0, min(_U16_MAX, int(value)))
+
+
+class FlightRecorder:
+    """Rotating binary recorder for serial TX/RX frames."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_bytes: int = FLIGHT_RECORDER_MAX_BYTES,
+        backup_count: int = FLIGHT_RECORDER_BACKUPS,
+        flush_interval: float = FLIGHT_RECORDER_FLUSH_INTERVAL,
+        max_pending: int = FLIGHT_RECORDER_MAX_PENDING,
+    ) -> None:
+        self.path = os.path.abspath(path)
+        self._max_bytes = max(_HEADER.size + _FRAME.size, int(max_bytes))
+        self._backup_count = max(0, int(backup_count))
+        self._flush_interval = max(0.01, float(flush_interval))
+        self._max_pending = max(_FRAME.size, int(max_pending))
+        self._lock = threading.Lock()
+        self._pending = bytearray()
+        self._dropped = 0
+        self._file: Any = None
+        self._file_size = 0
+        self._stop_evt = threading.Event()
+        self._wake_evt = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def dropped_frames(self) -> int:
+        return self._dropped
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        dir_name = os.path.dirname(self.path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+        self._open_file()
+        self._thread = threading.Thread(
+            target=self._flush_loop,
+            name="simple_sender-flight-recorder",
+            daemon=True,
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self._thread = None
+        self._stop_evt.set()
+        self._wake_evt.set()
+        thread.join(timeout=2.0)
+        self._flush()
+        try:
+            if self._file is not None:
+                self._file.close()
+        except Exception as exc:
+            logger.warning("Failed to close flight recording: %s", exc)
+        self._file = None
+        try:
+            atexit.unregister(self.close)
+        except Exception:
+            pass
+
+    def record(
+        self,
+        kind: int,
+        data: bytes,
+        *,
+        send_index: int = -1,
+        ack_index: int = -1,
+        rx_used: int = 0,
+        rx_window: int = 0,
+        piece: int = 0,
+        final: bool = True,
+    ) -> None:
+        """Append one frame (safe to call from any thread)."""
+        if self._thread is None:
+            return
+        data = bytes(data[:_U16_MAX])
+        header = _FRAME.pack(
+            kind,
+            time.monotonic(),
+            int(send_index),
+            int(ack_index),
+            _clamp_u16(rx_used),
+            _clamp_u16(rx_window),
+            _clamp_u16(piece),
+            _FLAG_FINAL if final else 0,
+            len(data),
+        )
+        with self._lock:
+            if len(self._pending) + len(header) + len(data) > self._max_pending:
+                self._dropped += 1
+                self._wake_evt.set()
+                return
+            self._pending += header
+            self._pending += data
+
+    def _open_file(self) -> None:
+        self._file = open(self.path, "wb")
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, time.time(), time.monotonic()))
+        self._file_size = _HEADER.size
+
+    def _rotate(self) -> None:
+        try:
+            self._file.close()
+        except Exception:
+            pass
+        if self._backup_count > 0:
+            for idx in range(self._backup_count - 1, 0, -1):
+                src = f"{self.path}.{idx}"
+                if os.path.exists(src):
+                    os.replace(src, f"{self.path}.{idx + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        self._open_file()
+
+    def _flush(self) -> None:
+        with self._lock:
+            if not self._pending:
+                return
+            chunk = bytes(self._pending)
+            self._pending.clear()
+        if self._file is None:
+            return
+        try:
+            # Rotate on frame boundaries so every file replays on its own.
+            offset = 0
+            while offset < len(chunk):
+                end = offset
+                while end < len(chunk):
+                    size = _FRAME.size + _FRAME.unpack_from(chunk, end)[-1]
+                    if self._file_size + (end - offset) + size > self._max_bytes and end > offset:
+                        break
+                    end += size
+                self._file.write(chunk[offset:end])
+                self._file_size += end - offset
+                offset = end
+                if offset < len(chunk):
+                    self._rotate()
+            self._file.flush()
+        except Exception as exc:
+            logger.warning("Flight recorder write failed: %s", exc)
+
+    def _flush_loop(self) -> None:
+        while not self._stop_evt.is_set():
+            self._wake_evt.wait(self._flush_interval)
+            self._wake_evt.clear()
+            self._flush()
+
+
+def iter_frames(path: str) -> Iterator[FlightFrame]:
+    """Yield frames from a flight recording file."""
+    with open(path, "rb") as infile:
+        header = infile.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError("Flight recording is truncated")
+        magic, version, _wall_start, _mono_start = _HEADER.unpack(header)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a Simple Sender flight recording")
+        while True:
+            raw = infile.read(_FRAME.size)
+            if len(raw) < _FRAME.size:
+                return
+            (
+                kind,
+                ts,
+                send_index,
+                ack_index,
+                rx_used,
+                rx_window,
+                piece,
+                flags,
+                length,
+            ) = _FRAME.unpack(raw)
+            data = infile.read(length)
+            if len(data) < length:
+                return
+            yield FlightFrame(
+                kind,
+                ts,
+                send_index,
+                ack_index,
+                rx_used,
+                rx_window,
+                data,
+                piece,
+                bool(flags & _FLAG_FINAL),
+            )
+
+
+def replay_recording(
+    worker: Any,
+    path: str,
+    *,
+    speed: float = 1.0,
+    stop_evt: threading.Event | None = None,
+) -> int:
+    """Feed a recording back through the worker RX path.
+
+    Stream TX frames re-create the worker's character-counting queue so the
+    recorded `ok`/`error` responses acknowledge the same lines and emit the
+    same progress events to `worker.ui_q`. Queue items keep the recorded
+    piece/final split and a send time mapped onto the replay clock, so
+    send-to-ack latency is replayed too. RX frames go through
+    `worker._handle_rx_line`.
+
+    Args:
+        worker: GrblWorker (not connected) to replay into
+        path: Flight recording path
+        speed: Playback speed multiplier; <= 0 replays as fast as possible
+        stop_evt: Optional event to abort the replay
+
+    Returns:
+        Number of RX frames replayed
+    """
+    frames = list(iter_frames(path))
+    stream_lines = max(
+        (f.send_index for f in frames if f.kind == FRAME_TX_STREAM),
+        default=-1,
+    ) + 1
+    if stream_lines > 0:
+        worker.load_gcode([""] * stream_lines, name=os.path.basename(path))
+        with worker._stream_lock:
+            worker._streaming = True
+    replayed = 0
+    base_ts: float | None = None
+    start = time.monotonic()
+    for frame in frames:
+        if stop_evt is not None and stop_evt.is_set():
+            break
+        if base_ts is None:
+            base_ts = frame.ts
+        due = time.monotonic()
+        if speed > 0:
+            due = start + (frame.ts - base_ts) / speed
+            delay = due - time.monotonic()
+            if delay > 0:
+                if stop_evt is not None:
+                    if stop_evt.wait(delay):
+                        break
+                else:
+                    time.sleep(delay)
+        if frame.kind in (FRAME_TX_STREAM, FRAME_TX_MANUAL):
+            line = frame.data.decode("ascii", errors="replace").strip()
+            is_gcode = frame.kind == FRAME_TX_STREAM
+            with worker._stream_lock:
+                worker._stream_line_queue.append(
+                    StreamQueueItem(
+                        line_len=len(frame.data),
+                        is_gcode=is_gcode,
+                        idx=frame.send_index if is_gcode else None,
+                        line=line,
+                        sent_ts=due,
+                        piece=frame.piece,
+                        final=frame.final,
+                    )
+                )
+                worker._stream_buf_used += len(frame.data)
+                if frame.rx_window:
+                    worker._rx_window = frame.rx_window
+        elif frame.kind == FRAME_RX:
+            line = frame.data.decode("utf-8", errors="replace").strip()
+            if line:
+                worker._handle_rx_line(line)
+                replayed += 1
+    return replayed
@@ -36,6 +36,9 @@ from logging.handlers import RotatingFileHandler
 from collections import deque
 from typing import Any, Callable, Optional, Sequence, Tuple, TYPE_CHECKING, TypeAlias
 
+from .flight_recorder import FRAME_TX_REALTIME, FlightRecorder
+from .metrics import METRICS
+from .stream_telemetry import StreamTelemetry
 from .types import ManualPendingItem, StreamPendingItem, StreamQueueItem
 from .grbl_worker_commands import GrblWorkerCommandMixin
 from .grbl_worker_connection import (
@@ -46,6 +49,7 @@ from .grbl_worker_connection import (
 from .grbl_worker_status import GrblWorkerStatusMixin
 from .grbl_worker_streaming import GrblWorkerStreamingMixin
 from .utils.grbl_errors import annotate_grbl_alarm, annotate_grbl_error
+from .utils.logging_config import add_async_handler
 
 try:
     import serial
@@ -76,12 +80,15 @@ from .utils.constants import (
     STATUS_POLL_DEFAULT,
     RT_RESUME,
     RT_JOG_CANCEL,
+    SERIAL_READ_MAX,
     THREAD_JOIN_TIMEOUT,
     WATCHDOG_HOMING_TIMEOUT,
 )
 from .utils.exceptions import SerialWriteError
 
 logger = logging.getLogger(__name__)
+_TX_BYTES = METRICS.counter("grbl_tx_bytes_total", "Bytes written to the controller")
+_RX_BUFFER_USED = METRICS.gauge("grbl_rx_buffer_used_bytes", "Bytes outstanding in the controller RX buffer")
 _RX_LOGGER = None
 _RX_LOGGER_LOCK = threading.Lock()
 
@@ -108,8 +115,9 @@ def _get_rx_logger():
                 handler_path = os.path.abspath(path)
                 has_handler = False
                 for handler in rx_logger.handlers:
-                    if isinstance(handler, RotatingFileHandler):
-                        if os.path.abspath(handler.baseFilename) == handler_path:
+                    target = getattr(handler, "target", handler)
+                    if isinstance(target, RotatingFileHandler):
+                        if os.path.abspath(target.baseFilename) == handler_path:
                             has_handler = True
                             break
                 if not has_handler:
@@ -122,7 +130,7 @@ def _get_rx_logger():
                     handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
                     handler.setLevel(logging.INFO)
                     handler.set_name("simple_sender_rx_override")
-                    rx_logger.addHandler(handler)
+                    add_async_handler(rx_logger, handler)
             except Exception as exc:
                 logger.warning("Failed to initialize RX log file: %s", exc)
         _RX_LOGGER = rx_logger
@@ -178,6 +186,7 @@ class GrblWorker(
         self.ui_q = ui_event_q
         self.ser: Optional[SerialType] = None
         self._rx_logger = _get_rx_logger()
+        self._flight_recorder: FlightRecorder | None = None
         
         # Worker threads
         self._rx_thread: Optional[threading.Thread] = None
@@ -198,6 +207,8 @@ class GrblWorker(
         self._stream_buf_used = 0
         self._stream_line_queue: deque[StreamQueueItem] = deque()
         self._stream_pending_item: StreamPendingItem | None = None
+        self._stream_leveler: Any = None  # StreamLeveler applied at send time
+        self._stream_piece = 0  # next leveled piece of the line at _send_index
         self._manual_pending_item: ManualPendingItem | None = None
         self._last_manual_source: str | None = None
         self._settings_dump_active = False
@@ -212,7 +223,11 @@ class GrblWorker(
         
         # Throughput tracking
         self._tx_bytes_window: deque[Tuple[float, int]] = deque()
+        self._tx_bytes_window_total = 0
         self._last_tx_emit_ts = 0.0
+
+        # Ack latency / RX occupancy / planner telemetry
+        self._telemetry = StreamTelemetry()
         
         # Command queue
         self._outgoing_q: queue.Queue[str] = queue.Queue()
@@ -241,6 +256,13 @@ class GrblWorker(
         self._homing_watchdog_timeout = WATCHDOG_HOMING_TIMEOUT
         self._connect_started_ts = 0.0
 
+        recorder_path = os.getenv("SIMPLE_SENDER_FLIGHT_RECORDER_PATH")
+        if recorder_path:
+            try:
+                self.start_flight_recorder(recorder_path)
+            except Exception as exc:
+                logger.warning("Failed to start flight recorder: %s", exc)
+
     def _serial_module(self):
         return serial
 
@@ -281,6 +303,68 @@ class GrblWorker(
         except Exception:
             pass
     
+    # ========================================================================
+    # TELEMETRY
+    # ========================================================================
+
+    def telemetry_snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return ack-latency, RX-occupancy and planner summaries/histograms."""
+        return self._telemetry.snapshot()
+
+    def clear_telemetry(self) -> None:
+        """Discard collected telemetry samples."""
+        self._telemetry.clear()
+
+    # ========================================================================
+    # FLIGHT RECORDER
+    # ========================================================================
+
+    def start_flight_recorder(self, path: str) -> None:
+        """Record every serial TX/RX frame to a rotating binary file.
+
+        Args:
+            path: Recording file path (rotated copies get .1, .2, ... suffixes)
+        """
+        self.stop_flight_recorder()
+        recorder = FlightRecorder(path)
+        recorder.start()
+        self._flight_recorder = recorder
+        logger.info(f"Flight recorder started: {recorder.path}")
+
+    def stop_flight_recorder(self) -> None:
+        """Flush and close the active flight recording, if any."""
+        recorder = self._flight_recorder
+        self._flight_recorder = None
+        if recorder is not None:
+            recorder.close()
+            if recorder.dropped_frames:
+                logger.warning(
+                    f"Flight recorder dropped {recorder.dropped_frames} frame(s)"
+                )
+
+    def _record_flight_frame(
+        self,
+        kind: int,
+        data: bytes,
+        idx: int | None = None,
+        *,
+        piece: int = 0,
+        final: bool = True,
+    ) -> None:
+        recorder = self._flight_recorder
+        if recorder is None:
+            return
+        recorder.record(
+            kind,
+            data,
+            send_index=self._send_index if idx is None else idx,
+            ack_index=self._ack_index,
+            rx_used=self._stream_buf_used,
+            rx_window=self._rx_window,
+            piece=piece,
+            final=final,
+        )
+
     # ========================================================================
     # CONTEXT MANAGER SUPPORT
     # ========================================================================
@@ -329,6 +413,7 @@ class GrblWorker(
                     if written <= 0:
                         raise timeout_exc("Write returned 0 bytes")
                     total += written
+            self._record_flight_frame(FRAME_TX_REALTIME, command)
         except timeout_exc as e:
             raise SerialWriteError(f"Write timeout: {e}")
         except serial_exc as e:
@@ -357,10 +442,12 @@ class GrblWorker(
             self._resume_preamble.clear()
             self._rx_window = RX_BUFFER_SIZE
             self._send_index = 0
+            self._stream_piece = 0
             self._ack_index = -1
             self._pause_after_idx = None
             self._pause_after_reason = None
             self._tx_bytes_window.clear()
+            self._tx_bytes_window_total = 0
             self._last_tx_emit_ts = 0.0
     
     def _encode_line_payload(self, line: str) -> bytes:
@@ -448,6 +535,8 @@ class GrblWorker(
         
         if used > window:
             used = window
+        self._telemetry.rx_occupancy.append(used)
+        _RX_BUFFER_USED.set(used)
         
         pct = int(round((used / window) * 100))
         payload = (pct, used, window)
@@ -470,14 +559,16 @@ class GrblWorker(
         """
         if count <= 0:
             return
+        _TX_BYTES.inc(count)
         
         now = time.time()
         self._tx_bytes_window.append((now, count))
+        self._tx_bytes_window_total += count
         
         # Remove old samples
         cutoff = now - TX_THROUGHPUT_WINDOW
         while self._tx_bytes_window and self._tx_bytes_window[0][0] < cutoff:
-            self._tx_bytes_window.popleft()
+            self._tx_bytes_window_total -= self._tx_bytes_window.popleft()[1]
         
         if not self._tx_bytes_window:
             return
@@ -488,8 +579,7 @@ class GrblWorker(
         
         # Calculate throughput
         span = max(0.1, now - self._tx_bytes_window[0][0])
-        total = sum(b for _, b in self._tx_bytes_window)
-        bps = total / span
+        bps = self._tx_bytes_window_total / span
         
         self._last_tx_emit_ts = now
         self.ui_q.put(("throughput", bps))
@@ -505,7 +595,9 @@ class GrblWorker(
             stop_evt: Event to signal thread shutdown
         """
         logger.debug("RX thread started")
-        buf = b""
+        # Reused across reads; complete lines are consumed by offset and the
+        # consumed prefix is dropped once per read instead of once per line.
+        buf = bytearray()
         serial_module = self._serial_module()
         timeout_exc = _serial_timeout_exception_type(serial_module)
         serial_exc = _serial_exception_type(serial_module)
@@ -530,7 +622,9 @@ class GrblWorker(
                         stop_evt.set()
                     break
                 try:
-                    chunk = ser.read(256)
+                    # Block for the first byte, then drain whatever has queued up.
+                    waiting = int(getattr(ser, "in_waiting", 0) or 0)
+                    chunk = ser.read(min(max(waiting, 1), SERIAL_READ_MAX))
                 except timeout_exc:
                     # Normal timeout - just continue
                     continue
@@ -554,11 +648,18 @@ class GrblWorker(
                 buf += chunk
                 
                 # Process complete lines
-                while b"\n" in buf:
-                    line, buf = buf.split(b"\n", 1)
-                    line_str = line.decode("utf-8", errors="replace").strip()
-                    if line_str:
-                        self._handle_rx_line(line_str)
+                start = 0
+                with memoryview(buf) as view:
+                    while True:
+                        end = buf.find(b"\n", start)
+                        if end < 0:
+                            break
+                        line_str = str(view[start:end], "utf-8", "replace").strip()
+                        start = end + 1
+                        if line_str:
+                            self._handle_rx_line(line_str)
+                if start:
+                    del buf[:start]
         
         except Exception as e:
             logger.error(f"RX thread error: {e}", exc_info=True)
@@ -168,6 +168,10 @@ class GrblWorkerCommandMixin(GrblWorkerState):
         self._purge_jog_queue.set()
         self._emit_buffer_fill()
 
+    def clear_manual_queue(self) -> None:
+        """Drop manual commands that have not been written to the controller yet."""
+        self._clear_outgoing()
+
     def manual_queue_busy(self) -> bool:
         """Return True when manual commands are still queued/pending."""
         with self._stream_lock:
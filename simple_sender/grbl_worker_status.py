@@ -25,7 +25,10 @@ import threading
 import time
 from typing import cast
 
-from simple_sender.types import GrblWorkerState
+from simple_sender.flight_recorder import FRAME_RX
+from simple_sender.metrics import METRICS
+from simple_sender.stream_telemetry import ACK_LATENCY_EDGES_MS
+from simple_sender.types import GrblStatusReport, GrblWorkerState
 
 from .utils.constants import (
     EVENT_QUEUE_TIMEOUT,
@@ -43,6 +46,91 @@ from .utils.validation import validate_interval
 
 logger = logging.getLogger(__name__)
 
+_RX_LINES = METRICS.counter("grbl_rx_lines_total", "Lines received from the controller")
+_STATUS_REPORTS = METRICS.counter("grbl_status_reports_total", "Status reports received")
+_ACKS_OK = METRICS.counter("grbl_acks_total", "Command acknowledgements received", result="ok")
+_ACKS_ERROR = METRICS.counter("grbl_acks_total", "Command acknowledgements received", result="error")
+_ACK_LATENCY = METRICS.histogram(
+    "grbl_ack_latency_ms",
+    ACK_LATENCY_EDGES_MS,
+    "Time from writing a queued line to its ok/error",
+)
+_PLANNER_FREE = METRICS.gauge("grbl_planner_blocks_free", "Planner blocks free in the last status report")
+
+
+def _parse_triplet(text: str) -> tuple[float, float, float] | None:
+    parts = text.split(",")
+    if len(parts) < 3:
+        return None
+    try:
+        return (float(parts[0]), float(parts[1]), float(parts[2]))
+    except ValueError:
+        return None
+
+
+def parse_status_report(line: str) -> GrblStatusReport:
+    """Parse a GRBL `<...>` status report into a typed record.
+
+    Malformed fields are skipped so a single bad field does not discard
+    the rest of the report.
+
+    Args:
+        line: Raw status report line (with or without angle brackets)
+
+    Returns:
+        Parsed status report
+    """
+    parts = line.strip().strip("<>").split("|")
+    state = parts[0]
+    mpos = wpos = wco = None
+    planner = rx_free = line_number = None
+    feed = spindle = None
+    ov = None
+    pins = None
+    for part in parts[1:]:
+        key, sep, value = part.partition(":")
+        if not sep:
+            continue
+        try:
+            if key == "MPos":
+                mpos = _parse_triplet(value)
+            elif key == "WPos":
+                wpos = _parse_triplet(value)
+            elif key == "WCO":
+                wco = _parse_triplet(value)
+            elif key == "Bf":
+                planner_text, rx_text = value.split(",", 1)
+                planner = int(planner_text)
+                rx_free = int(rx_text)
+            elif key == "FS":
+                feed_text, spindle_text = value.split(",", 1)
+                feed = float(feed_text)
+                spindle = float(spindle_text)
+            elif key == "Ov":
+                ov_parts = [int(float(v)) for v in value.split(",")]
+                if len(ov_parts) >= 3:
+                    ov = (ov_parts[0], ov_parts[1], ov_parts[2])
+            elif key == "Pn":
+                pins = value
+            elif key == "Ln":
+                line_number = int(value)
+        except (ValueError, IndexError) as exc:
+            logger.debug("Failed to parse %s status field: %s", key, exc)
+    return GrblStatusReport(
+        raw=line,
+        state=state,
+        mpos=mpos,
+        wpos=wpos,
+        wco=wco,
+        planner=planner,
+        rx_free=rx_free,
+        feed=feed,
+        spindle=spindle,
+        ov=ov,
+        pins=pins,
+        line_number=line_number,
+    )
+
 
 def _annotate_alarm(message: str) -> str:
     from . import grbl_worker as grbl_worker_mod
@@ -234,12 +322,15 @@ class GrblWorkerStatusMixin(GrblWorkerState):
         self._last_rx_ts = now
         self._watchdog_paused = False
         self._watchdog_trip_ts = 0.0
+        _RX_LINES.inc()
 
         # Parse status reports
         is_status = line.startswith("<") and line.endswith(">")
 
         line_lower = line.lower()
         self._log_rx_line(line)
+        if getattr(self, "_flight_recorder", None) is not None:
+            self._record_flight_frame(FRAME_RX, line.encode("utf-8", errors="replace"))
         if self._settings_dump_active and line.startswith("$") and "=" in line:
             self._settings_dump_seen = True
         if line_lower == "ok":
@@ -274,9 +365,13 @@ class GrblWorkerStatusMixin(GrblWorkerState):
         
         # Command acknowledgment
         if line_lower == "ok" or line_lower.startswith("error"):
-            if line_lower.startswith("error") and getattr(self, "_settings_dump_active", False):
-                self._settings_dump_active = False
-                self._settings_dump_seen = False
+            if line_lower.startswith("error"):
+                _ACKS_ERROR.inc()
+                if getattr(self, "_settings_dump_active", False):
+                    self._settings_dump_active = False
+                    self._settings_dump_seen = False
+            else:
+                _ACKS_OK.inc()
             ack_index = None
             ack_line_idx = None
             ack_line_text = None
@@ -287,12 +382,20 @@ class GrblWorkerStatusMixin(GrblWorkerState):
                 if self._stream_line_queue:
                     queued_item = self._stream_line_queue.popleft()
                     self._stream_buf_used = max(0, self._stream_buf_used - queued_item.line_len)
+                    telemetry = getattr(self, "_telemetry", None)
+                    if queued_item.sent_ts > 0:
+                        latency_ms = (time.monotonic() - queued_item.sent_ts) * 1000.0
+                        _ACK_LATENCY.observe(latency_ms)
+                        if telemetry is not None:
+                            telemetry.ack_latency_ms.append(latency_ms)
                     
                     if queued_item.is_gcode and self._streaming:
-                        self._ack_index += 1
-                        ack_index = self._ack_index
-                        ack_line_idx = queued_item.idx
-                        ack_line_text = queued_item.line
+                        # A leveled source line is acknowledged with its last piece.
+                        if queued_item.final:
+                            self._ack_index += 1
+                            ack_index = self._ack_index
+                            ack_line_idx = queued_item.idx
+                            ack_line_text = queued_item.line
                         if line_lower.startswith("error"):
                             err_idx = queued_item.idx
                             err_line = queued_item.line
@@ -324,10 +427,11 @@ class GrblWorkerStatusMixin(GrblWorkerState):
         
         # Status report
         if is_status:
+            _STATUS_REPORTS.inc()
             self._mark_ready()
-            parts = line.strip("<>").split("|")
-            state = parts[0] if parts else ""
-            
+            report = parse_status_report(line)
+            state = report.state
+
             # Check for alarm in status
             if state.lower().startswith("alarm"):
                 if not self._alarm_active:
@@ -335,34 +439,33 @@ class GrblWorkerStatusMixin(GrblWorkerState):
             elif self._alarm_active:
                 self._alarm_active = False
                 self._abort_writes.clear()
-            
-            # Parse buffer info
-            for part in parts:
-                if part.startswith("Bf:"):
-                    try:
-                        _, rx_free_text = part[3:].split(",", 1)
-                        rx_free = int(rx_free_text.strip())
-                        if rx_free < 0:
-                            rx_free = 0
-                        with self._stream_lock:
-                            busy = (
-                                self._stream_buf_used > 0
-                                or self._stream_line_queue
-                                or self._stream_pending_item is not None
-                                or self._manual_pending_item is not None
-                                or self._resume_preamble
-                            )
-                            if busy:
-                                continue
-                            capacity = rx_free + self._stream_buf_used
-                            if capacity < RX_BUFFER_SIZE:
-                                capacity = RX_BUFFER_SIZE
-                            self._rx_window = capacity
-                        self._emit_buffer_fill()
-                    except (ValueError, IndexError) as e:
-                        logger.warning(f"Failed to parse Bf field: {e}")
-            
-            self.ui_q.put(("status", line))
+
+            telemetry = getattr(self, "_telemetry", None)
+            if report.planner is not None:
+                _PLANNER_FREE.set(report.planner)
+                if telemetry is not None:
+                    telemetry.planner_free.append(report.planner)
+
+            # Track RX buffer capacity from Bf
+            if report.rx_free is not None:
+                rx_free = max(0, report.rx_free)
+                with self._stream_lock:
+                    busy = (
+                        self._stream_buf_used > 0
+                        or self._stream_line_queue
+                        or self._stream_pending_item is not None
+                        or self._manual_pending_item is not None
+                        or self._resume_preamble
+                    )
+                    if not busy:
+                        capacity = rx_free + self._stream_buf_used
+                        if capacity < RX_BUFFER_SIZE:
+                            capacity = RX_BUFFER_SIZE
+                        self._rx_window = capacity
+                if not busy:
+                    self._emit_buffer_fill()
+
+            self.ui_q.put(("status", line, report))
     
     def _status_loop(self, stop_evt: threading.Event) -> None:
         """Status polling thread - periodically requests status.
@@ -26,7 +26,7 @@ import re
 import threading
 import time
 from collections import deque
-from typing import Sequence, cast
+from typing import Any, Sequence, cast
 
 from simple_sender.types import (
     GrblWorkerState,
@@ -35,6 +35,7 @@ from simple_sender.types import (
     StreamQueueItem,
 )
 
+from .flight_recorder import FRAME_TX_MANUAL, FRAME_TX_STREAM
 from .utils.constants import EVENT_QUEUE_TIMEOUT, MAX_LINE_LENGTH, RX_BUFFER_SAFETY
 from .utils.exceptions import SerialWriteError
 logger = logging.getLogger(__name__)
@@ -69,6 +70,27 @@ class GrblWorkerStreamingMixin(GrblWorkerState):
     def set_dry_run_sanitize(self, enabled: bool) -> None:
         """Enable or disable dry-run sanitization for streamed G-code."""
         self._dry_run_sanitize = bool(enabled)
+
+    def set_stream_leveler(self, leveler: Any) -> bool:
+        """Apply a height map to streamed lines as they are sent.
+
+        Args:
+            leveler: StreamLeveler for the loaded job, or None to stream lines unchanged
+
+        Returns:
+            False if a stream is active (the leveler is not changed mid-job)
+        """
+        with self._stream_lock:
+            if self._streaming:
+                logger.warning("Cannot change stream leveler while streaming")
+                return False
+            self._stream_leveler = leveler
+            self._stream_piece = 0
+        logger.info(f"Stream-time auto-level {'enabled' if leveler is not None else 'disabled'}")
+        return True
+
+    def has_stream_leveler(self) -> bool:
+        return self._stream_leveler is not None
     
     # ========================================================================
     # COMMAND EXECUTION
@@ -106,6 +128,8 @@ class GrblWorkerStreamingMixin(GrblWorkerState):
             self._stream_token += 1
             self._streaming = True
             self._paused = False
+            if self._stream_leveler is not None:
+                self._stream_leveler.invalidate()
         self._abort_writes.clear()
         self._reset_stream_buffer()
         self._emit_buffer_fill()
@@ -134,12 +158,19 @@ class GrblWorkerStreamingMixin(GrblWorkerState):
             return
         
         start_index = max(0, min(start_index, len(self._gcode) - 1))
+        # Re-deriving auto-level modal state reads every earlier line; do it
+        # here rather than under the stream lock on the first send.
+        leveler = self._stream_leveler
+        if leveler is not None:
+            leveler.prepare(self._gcode, start_index)
         
         self._clear_outgoing()
         with self._stream_lock:
             self._stream_token += 1
             self._streaming = True
             self._paused = False
+            if self._stream_leveler is not None:
+                self._stream_leveler.invalidate()
         self._abort_writes.clear()
         self._reset_stream_buffer()
         
@@ -312,10 +343,28 @@ class GrblWorkerStreamingMixin(GrblWorkerState):
             return StreamPendingItem(line=self._resume_preamble[0], is_gcode=False, idx=None)
         if self._send_index >= len(self._gcode):
             return None
+        if self._stream_leveler is None:
+            return StreamPendingItem(
+                line=self._gcode[self._send_index].strip(),
+                is_gcode=True,
+                idx=self._send_index,
+            )
+        try:
+            pieces = self._stream_leveler.pieces(self._gcode, self._send_index)
+        except ValueError as exc:
+            line = self._gcode[self._send_index].strip()
+            msg = self._format_stream_error(f"Auto-level: {exc}", self._send_index, line)
+            self._pause_stream(reason="auto-level")
+            self.ui_q.put(("stream_error", msg, self._send_index, line, self._gcode_name))
+            self.ui_q.put(("log", f"[stream error] {msg}"))
+            return None
+        piece = min(self._stream_piece, len(pieces) - 1)
         return StreamPendingItem(
-            line=self._gcode[self._send_index].strip(),
+            line=pieces[piece].strip(),
             is_gcode=True,
             idx=self._send_index,
+            piece=piece,
+            final=piece == len(pieces) - 1,
         )
 
     def _validate_stream_item_locked(
@@ -323,7 +372,13 @@ class GrblWorkerStreamingMixin(GrblWorkerState):
         item: StreamPendingItem,
     ) -> tuple[StreamPendingItem, bytes, int] | None:
         line = self._sanitize_stream_line(item.line)
-        item = StreamPendingItem(line=line, is_gcode=item.is_gcode, idx=item.idx)
+        item = StreamPendingItem(
+            line=line,
+            is_gcode=item.is_gcode,
+            idx=item.idx,
+            piece=item.piece,
+            final=item.final,
+        )
         if item.is_gcode and item.idx is not None and self._pause_after_idx is None:
             reason = self._pause_reason_for_line(line)
             if reason:
@@ -367,29 +422,42 @@ class GrblWorkerStreamingMixin(GrblWorkerState):
         self._stream_pending_item = None
         if item.is_gcode:
             idx = self._send_index
-            self._send_index += 1
+            if item.final:
+                self._send_index += 1
+                self._stream_piece = 0
+            else:
+                self._stream_piece = item.piece + 1
 
         queue_item = StreamQueueItem(
             line_len=line_len,
             is_gcode=item.is_gcode,
             idx=idx,
             line=item.line,
+            sent_ts=time.monotonic(),
+            piece=item.piece,
+            final=item.final,
         )
         self._stream_buf_used += line_len
         self._stream_line_queue.append(queue_item)
         return queue_item
 
     def _rollback_reserved_stream_locked(self, *, is_gcode: bool, line_len: int) -> None:
-        if is_gcode and self._send_index > 0:
-            self._send_index -= 1
+        last: StreamQueueItem | None = None
         if self._stream_line_queue:
             try:
-                last_len = self._stream_line_queue.pop().line_len
+                last = self._stream_line_queue.pop()
             except Exception:
-                last_len = line_len
-            self._stream_buf_used = max(0, self._stream_buf_used - last_len)
-        else:
-            self._stream_buf_used = max(0, self._stream_buf_used - line_len)
+                last = None
+        if is_gcode:
+            if last is not None and last.is_gcode and last.idx is not None:
+                # Rewind to the exact line/piece (leveled lines span several pieces).
+                self._send_index = last.idx
+                self._stream_piece = last.piece
+            elif self._send_index > 0:
+                self._send_index -= 1
+                self._stream_piece = 0
+        last_len = last.line_len if last is not None else line_len
+        self._stream_buf_used = max(0, self._stream_buf_used - last_len)
 
     def _stream_send_invalidated(self, stream_token: int) -> bool:
         return (
@@ -447,9 +515,17 @@ class GrblWorkerStreamingMixin(GrblWorkerState):
 
             if not queue_item.is_gcode and self._resume_preamble:
                 self._resume_preamble.popleft()
+            if getattr(self, "_flight_recorder", None) is not None:
+                self._record_flight_frame(
+                    FRAME_TX_STREAM if queue_item.is_gcode else FRAME_TX_MANUAL,
+                    payload,
+                    queue_item.idx if queue_item.is_gcode else -1,
+                    piece=queue_item.piece,
+                    final=queue_item.final,
+                )
             self._record_tx_bytes(line_len)
             self._emit_buffer_fill()
-            if queue_item.is_gcode:
+            if queue_item.is_gcode and queue_item.piece == 0:
                 self.ui_q.put(("gcode_sent", queue_item.idx, queue_item.line))
 
         with self._stream_lock:
@@ -556,6 +632,7 @@ class GrblWorkerStreamingMixin(GrblWorkerState):
                 is_gcode=False,
                 idx=None,
                 line=line,
+                sent_ts=time.monotonic(),
             )
         )
         return False, False, usable
@@ -648,6 +725,8 @@ class GrblWorkerStreamingMixin(GrblWorkerState):
                 break
 
             self.ui_q.put(("log_tx", line))
+            if getattr(self, "_flight_recorder", None) is not None:
+                self._record_flight_frame(FRAME_TX_MANUAL, payload, -1)
             self._record_tx_bytes(line_len)
             self._emit_buffer_fill()
 
@@ -657,7 +736,7 @@ class GrblWorkerStreamingMixin(GrblWorkerState):
         while True:
             with self._stream_lock:
                 pending = bool(self._stream_line_queue) or self._manual_pending_item is not None or bool(self._resume_preamble)
-            if not pending:
+            if not pending and self._outgoing_q.empty():
                 return True
             if timeout_s and (time.time() - start) > timeout_s:
                 return False
@@ -25,6 +25,7 @@ from __future__ import annotations
 
 import logging
 import queue
+import re
 import types
 from typing import Any, Callable
 from tkinter import messagebox
@@ -33,6 +34,45 @@ from simple_sender.utils.constants import MACRO_GPAT, RT_STATUS
 
 logger = logging.getLogger(__name__)
 
+_WORD_PAT = re.compile(r"([GM])\s*(\d+(?:\.\d+)?)", re.IGNORECASE)
+# Program-flow, tool-change, and unit words keep the blocking send path:
+# they prompt, stop the program, or update the app's unit mode. G10 (L2/L20),
+# G28.1 and G30.1 write GRBL's EEPROM, which can drop received characters,
+# so they must not be character-counted into the RX buffer either.
+_NON_STREAMABLE_WORDS = {
+    ("M", 0.0),
+    ("M", 1.0),
+    ("M", 2.0),
+    ("M", 6.0),
+    ("M", 30.0),
+    ("G", 10.0),
+    ("G", 20.0),
+    ("G", 21.0),
+    ("G", 28.1),
+    ("G", 30.1),
+}
+
+
+def is_streamable_gcode(line: Any) -> bool:
+    """Return True for a plain G-code line that can be sent without waiting.
+
+    Such lines carry no expressions, macro commands, prompts, or real-time
+    characters, so the macro runner can queue a run of them back to back.
+    """
+    if not isinstance(line, str):
+        return False
+    s = line.strip()
+    if not s or not MACRO_GPAT.match(s):
+        return False
+    for letter, number in _WORD_PAT.findall(s.split(";", 1)[0]):
+        try:
+            value = float(number)
+        except ValueError:
+            return False
+        if (letter.upper(), value) in _NON_STREAMABLE_WORDS:
+            return False
+    return True
+
 
 def _maybe_set_unit_mode(app, unit_mode: str | None) -> None:
     if not unit_mode:
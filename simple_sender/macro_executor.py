@@ -34,6 +34,8 @@ from simple_sender.macro_executor_commands import MacroCommandMixin
 from simple_sender.macro_executor_prompting import MacroPromptMixin
 from simple_sender.macro_executor_runtime import MacroRunnerMixin
 from simple_sender.macro_executor_state import MacroStateMixin
+from simple_sender.macro_profiler import MacroProfiler
+from simple_sender.macro_program import MacroProgramCache
 
 
 class MacroExecutor(MacroPromptMixin, MacroStateMixin, MacroCommandMixin, MacroRunnerMixin):
@@ -43,7 +45,12 @@ class MacroExecutor(MacroPromptMixin, MacroStateMixin, MacroCommandMixin, MacroR
         self.grbl = app.grbl
         self._macro_lock = threading.Lock()
         self._macro_vars_lock = threading.Lock()
+        # Signalled whenever macro vars are updated through `macro_vars()`,
+        # which is how the status and $G handlers bump _status_seq/_modal_seq.
+        self._macro_state_cond = threading.Condition(self._macro_vars_lock)
         self._macro_search_dirs = macro_search_dirs or ()
+        self._macro_programs = MacroProgramCache()
+        self._macro_profiler = MacroProfiler()
         self._macro_local_vars = {"app": app, "os": os}
         self._current_macro_line: str = ""
         self._alarm_event = threading.Event()
@@ -132,8 +139,13 @@ class MacroExecutor(MacroPromptMixin, MacroStateMixin, MacroCommandMixin, MacroR
 
     @contextmanager
     def macro_vars(self):
-        with self._macro_vars_lock:
+        with self._macro_state_cond:
             yield self._macro_vars
+            self._macro_state_cond.notify_all()
+
+    def macro_profiles(self):
+        """Return the profiled macro runs kept for diagnostics, oldest first."""
+        return self._macro_profiler.runs()
 
     def macro_path(self, index: int) -> str | None:
         for macro_dir in self._macro_search_dirs:
@@ -30,11 +30,14 @@ import threading
 import time
 from tkinter import messagebox
 
+from simple_sender.macro_commands import is_streamable_gcode
 from simple_sender.utils.constants import (
     MACRO_LINE_TIMEOUT,
+    MACRO_STREAM_CHECK_INTERVAL,
+    MACRO_STREAM_MIN_LINES,
     MACRO_TOTAL_TIMEOUT,
 )
-from simple_sender.utils.macro_headers import parse_macro_header
+from simple_sender.macro_program import MacroProgram
 from simple_sender.types import MacroExecutorState
 logger = logging.getLogger(__name__)
 
@@ -77,6 +80,15 @@ class MacroRunnerMixin(MacroExecutorState):
         except Exception:
             return True
 
+    def _macro_profiling_enabled(self) -> bool:
+        enabled = getattr(self.app, "macro_profiling", False)
+        try:
+            if hasattr(enabled, "get"):
+                enabled = enabled.get()
+            return bool(enabled)
+        except Exception:
+            return False
+
     def _macro_audit(self, message: str, *, force: bool = False) -> None:
         if not force and not self._macro_audit_enabled():
             return
@@ -99,16 +111,19 @@ class MacroRunnerMixin(MacroExecutorState):
             messagebox.showwarning("Macro busy", "Another macro is running.")
             return
         try:
-            with open(path, "r", encoding="utf-8", errors="replace") as f:
-                lines = f.readlines()
+            program = self._macro_programs.load(
+                path,
+                allow_python=bool(self.app.macros_allow_python.get()),
+                color_validator=self._validate_macro_color,
+            )
         except Exception as exc:
             messagebox.showerror("Macro error", str(exc))
             self._macro_lock.release()
             return
-        name, tip, _color, _text_color, body_start = parse_macro_header(
-            lines,
-            color_validator=self._validate_macro_color,
-        )
+        lines = program.lines
+        name = program.name
+        tip = program.tip
+        body_start = program.body_start
         if not name:
             name = f"Macro {index}"
         ts = time.strftime("%H:%M:%S")
@@ -123,11 +138,19 @@ class MacroRunnerMixin(MacroExecutorState):
         t = threading.Thread(
             target=self._run_macro_worker,
             args=(lines, path, body_start),
+            kwargs={"program": program},
             daemon=True,
         )
         t.start()
 
-    def _run_macro_worker(self, lines: list[str], path: str | None, body_start: int = 2):
+    def _run_macro_worker(
+        self,
+        lines: list[str],
+        path: str | None,
+        body_start: int = 2,
+        *,
+        program: MacroProgram | None = None,
+    ):
         start = time.perf_counter()
         executed = 0
         line_timeout_s = self._macro_line_timeout_s()
@@ -142,6 +165,10 @@ class MacroRunnerMixin(MacroExecutorState):
             ),
             force=True,
         )
+        profiler = self._macro_profiler
+        if self._macro_profiling_enabled():
+            profiler.begin_run(name, path)
+            profiler.start_line("setup", "$G/status snapshot")
         post_ui = getattr(self.app, "_post_ui_thread", None)
         if callable(post_ui) and hasattr(self.app, "_start_macro_status"):
             post_ui(self.app._start_macro_status, name)
@@ -169,7 +196,10 @@ class MacroRunnerMixin(MacroExecutorState):
             self._macro_saved_state = self._snapshot_macro_state()
             if self.grbl.is_connected():
                 self._macro_force_mm()
+            stream_end = body_start
             for idx in range(body_start, len(lines)):
+                if idx < stream_end:
+                    continue
                 now = time.perf_counter()
                 if total_timeout_s > 0 and (now - start) > total_timeout_s:
                     self.ui_q.put(
@@ -193,8 +223,10 @@ class MacroRunnerMixin(MacroExecutorState):
                 line_no = idx + 1
                 self._macro_audit(f"L{line_no} raw: {raw_line}")
                 line_start = time.perf_counter()
+                profiler.start_line(f"L{line_no}", line)
                 try:
-                    compiled = self._bcnc_compile_line(self._strip_prompt_tokens(line))
+                    with profiler.timed("expr"):
+                        compiled = self._compile_macro_line(program, idx, line)
                     if isinstance(compiled, tuple) and compiled and compiled[0] == "COMPILE_ERROR":
                         self.ui_q.put(("log", f"[macro] Compile error: {compiled[1]}"))
                         self._macro_audit(f"L{line_no} compile_error: {compiled[1]}", force=True)
@@ -203,12 +235,30 @@ class MacroRunnerMixin(MacroExecutorState):
                     if compiled is None:
                         self._macro_audit(f"L{line_no} skipped")
                         continue
+                    if is_streamable_gcode(compiled):
+                        with profiler.timed("expr"):
+                            run = self._collect_macro_stream_run(lines, idx, compiled, program)
+                        if len(run) >= MACRO_STREAM_MIN_LINES:
+                            stream_end = run[-1][0] + 1
+                            profiler.relabel_line(
+                                f"L{line_no}-L{stream_end}",
+                                f"{len(run)} streamed line(s)",
+                            )
+                            executed += sum(1 for raw in lines[idx + 1:stream_end] if raw.strip())
+                            if not self._stream_macro_run(
+                                run,
+                                line_timeout_s=line_timeout_s,
+                                deadline=(start + total_timeout_s) if total_timeout_s > 0 else None,
+                            ):
+                                break
+                            continue
                     if isinstance(compiled, tuple):
                         kind = compiled[0]
                         self._macro_audit(f"L{line_no} directive: {kind}")
                         if kind == "WAIT":
                             wait_timeout_s = line_timeout_s if line_timeout_s > 0 else 30.0
-                            self._macro_wait_for_idle(timeout_s=wait_timeout_s)
+                            with profiler.timed("idle"):
+                                self._macro_wait_for_idle(timeout_s=wait_timeout_s)
                         elif kind == "MSG":
                             msg = compiled[1] if len(compiled) > 1 else ""
                             if msg:
@@ -216,10 +266,12 @@ class MacroRunnerMixin(MacroExecutorState):
                                 self.ui_q.put(("log", f"[macro] {msg}"))
                         elif kind == "UPDATE":
                             update_timeout_s = min(5.0, line_timeout_s) if line_timeout_s > 0 else 1.0
-                            self._macro_wait_for_status(timeout_s=max(update_timeout_s, 0.1))
+                            with profiler.timed("idle"):
+                                self._macro_wait_for_status(timeout_s=max(update_timeout_s, 0.1))
                         self._macro_audit(f"L{line_no} ok")
                         continue
-                    evaluated = self._bcnc_evaluate_line(compiled)
+                    with profiler.timed("expr"):
+                        evaluated = self._bcnc_evaluate_line(compiled)
                     if evaluated is None:
                         self._macro_audit(f"L{line_no} python_exec_ok")
                         continue
@@ -256,6 +308,7 @@ class MacroRunnerMixin(MacroExecutorState):
             self._macro_audit(f"Runtime error: {exc}", force=True)
             self.app._log_exception("Macro error", exc, show_dialog=True, dialog_title="Macro error")
         finally:
+            profiler.start_line("restore", "unit restore")
             try:
                 if not self._macro_state_restored:
                     self._macro_restore_units()
@@ -275,6 +328,14 @@ class MacroRunnerMixin(MacroExecutorState):
                     self.app._stop_macro_status()
                 except Exception:
                     pass
+            profile = profiler.end_run()
+            if profile is not None:
+                totals = profile.totals()
+                self.ui_q.put((
+                    "log",
+                    f"[macro] Profile: {profile.duration_s:.2f}s "
+                    + " ".join(f"{bucket}={value:.2f}s" for bucket, value in totals.items()),
+                ))
             duration = time.perf_counter() - start
             if duration >= 0.2:
                 avg = duration / executed if executed else duration
@@ -287,6 +348,99 @@ class MacroRunnerMixin(MacroExecutorState):
                 force=True,
             )
 
+    def _compile_macro_line(self, program: MacroProgram | None, idx: int, line: str):
+        stripped = self._strip_prompt_tokens(line)
+        if program is not None:
+            return program.compiled_line(idx, stripped, self._bcnc_compile_line)
+        return self._bcnc_compile_line(stripped)
+
+    def _collect_macro_stream_run(
+        self,
+        lines: list[str],
+        idx: int,
+        first: str,
+        program: MacroProgram | None,
+    ) -> list[tuple[int, str]]:
+        """Return the run of plain G-code lines starting at `idx`.
+
+        Blank and comment-only lines inside the run are skipped; any line
+        that needs evaluation, a wait, or a macro command ends it.
+        """
+        run = [(idx, first.strip())]
+        for next_idx in range(idx + 1, len(lines)):
+            line = lines[next_idx].strip()
+            if not line:
+                continue
+            if line[0] in ";(":
+                if self._compile_macro_line(program, next_idx, line) is None:
+                    continue
+                break
+            compiled = self._compile_macro_line(program, next_idx, line)
+            if not is_streamable_gcode(compiled):
+                break
+            run.append((next_idx, compiled.strip()))
+        return run
+
+    def _stream_macro_run(
+        self,
+        run: list[tuple[int, str]],
+        *,
+        line_timeout_s: float,
+        deadline: float | None,
+    ) -> bool:
+        """Send plain G-code lines without a round trip per line.
+
+        Lines go to the worker's manual queue back to back; the worker paces
+        them against the controller RX buffer by character counting. Returns
+        False when the run was aborted.
+        """
+        first_no = run[0][0] + 1
+        last_no = run[-1][0] + 1
+        self._macro_audit(f"L{first_no}-L{last_no} streaming {len(run)} line(s)")
+        # The controller may be on any queued line when an alarm lands, so
+        # alarms name the whole run rather than the last line queued.
+        self._current_macro_line = f"L{first_no}-L{last_no}"
+        run_start = time.perf_counter()
+        for idx, command in run:
+            self._macro_audit(f"L{idx + 1} streamed: {command}")
+            self._macro_send(command, wait_for_idle=False)
+        if line_timeout_s > 0:
+            run_deadline = run_start + line_timeout_s * len(run)
+            deadline = run_deadline if deadline is None else min(deadline, run_deadline)
+        while True:
+            with self._macro_profiler.timed("ok"):
+                drained = self.grbl.wait_for_manual_completion(timeout_s=MACRO_STREAM_CHECK_INTERVAL)
+            if drained:
+                break
+            reason = None
+            if self._alarm_event.is_set() or getattr(self.app, "_alarm_locked", False):
+                reason = "alarm"
+            elif not self.grbl.is_connected():
+                reason = "disconnected"
+            elif deadline is not None and time.perf_counter() > deadline:
+                reason = "timeout"
+            if reason is None:
+                continue
+            self.grbl.clear_manual_queue()
+            if reason == "timeout":
+                self.ui_q.put((
+                    "log",
+                    f"[macro] Lines {first_no}-{last_no} timed out after "
+                    f"{time.perf_counter() - run_start:.2f}s; aborted.",
+                ))
+            elif reason == "alarm":
+                self.ui_q.put(("log", "[macro] Alarm detected; aborting macro."))
+            self._macro_audit(f"L{first_no}-L{last_no} abort: {reason}", force=True)
+            return False
+        with self._macro_profiler.timed("idle"):
+            self._macro_wait_for_idle()
+        if getattr(self.app, "_alarm_locked", False):
+            self.ui_q.put(("log", "[macro] Alarm detected; aborting macro."))
+            self._macro_audit(f"L{first_no}-L{last_no} abort: alarm lock active", force=True)
+            return False
+        self._macro_audit(f"L{first_no}-L{last_no} ok")
+        return True
+
     def _notify_macro_compile_error(
         self,
         path: str | None,
@@ -315,12 +469,16 @@ class MacroRunnerMixin(MacroExecutorState):
         self._alarm_notified = False
 
     def _macro_send(self, command: str, *, wait_for_idle: bool = True):
-        if hasattr(self.app, "_send_manual"):
-            self.app._send_manual(command, "macro")
-        else:
-            self.grbl.send_immediate(command)
+        profiler = self._macro_profiler
+        with profiler.timed("send"):
+            if hasattr(self.app, "_send_manual"):
+                self.app._send_manual(command, "macro")
+            else:
+                self.grbl.send_immediate(command)
         if wait_for_idle:
-            completed = self.grbl.wait_for_manual_completion()
+            with profiler.timed("ok"):
+                completed = self.grbl.wait_for_manual_completion()
             if not completed:
                 self.ui_q.put(("log", "[macro] Command completion timed out"))
-            self._macro_wait_for_idle()
+            with profiler.timed("idle"):
+                self._macro_wait_for_idle()
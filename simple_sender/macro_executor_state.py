@@ -44,6 +44,8 @@ class MacroStateMixin(MacroExecutorState):
             app=self.app,
             grbl=self.grbl,
             ui_q=self.ui_q,
+            state_cond=self._macro_state_cond,
+            macro_vars=self._macro_vars,
             timeout_s=timeout_s,
         )
 
@@ -51,16 +53,16 @@ class MacroStateMixin(MacroExecutorState):
         return macro_wait_for_status(
             grbl=self.grbl,
             ui_q=self.ui_q,
+            state_cond=self._macro_state_cond,
             macro_vars=self._macro_vars,
-            macro_vars_lock=self._macro_vars_lock,
             timeout_s=timeout_s,
         )
 
     def _macro_wait_for_modal(self, seq: int | None = None, timeout_s: float = 1.0) -> bool:
         return macro_wait_for_modal(
             ui_q=self.ui_q,
+            state_cond=self._macro_state_cond,
             macro_vars=self._macro_vars,
-            macro_vars_lock=self._macro_vars_lock,
             seq=seq,
             timeout_s=timeout_s,
         )
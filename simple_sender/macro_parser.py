@@ -211,16 +211,20 @@ def bcnc_evaluate_line(
     if isinstance(compiled, str):
         return compiled
     if isinstance(compiled, list):
-        for i, expr in enumerate(compiled):
+        # Build a new list: compiled lines are cached and reused across runs.
+        parts: list[str] = []
+        for expr in compiled:
             if isinstance(expr, types.CodeType):
                 with macro_vars_lock:
                     globals_ctx = eval_globals()
                     result = eval(expr, globals_ctx, macro_local_vars)
                 if isinstance(result, float):
-                    compiled[i] = str(round(result, 4))
+                    parts.append(str(round(result, 4)))
                 else:
-                    compiled[i] = str(result)
-        return "".join(compiled)
+                    parts.append(str(result))
+            else:
+                parts.append(expr)
+        return "".join(parts)
     if isinstance(compiled, types.CodeType):
         with macro_vars_lock:
             globals_ctx = exec_globals()
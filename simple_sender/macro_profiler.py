@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# Simple Sender (GRBL G-code Sender)
+# Copyright (C) 2026 Bob Kolbasowski
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Optional (not required by the license): If you make improvements, please consider
+# contributing them back upstream (e.g., via a pull request) so others can benefit.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Per-line timing of macro runs for the diagnostics export.
+
+Each executed line records where its wall time went:
+
+* ``send``: handing commands to the worker queue
+* ``ok``: waiting for the controller to acknowledge them
+* ``idle``: waiting for Idle or a status report (``%wait``/``%update``)
+* ``expr``: compiling and evaluating macro expressions and Python lines
+
+The macro runner only calls into the profiler from its worker thread; the
+finished runs are read from the UI thread when diagnostics are exported.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from simple_sender.utils.constants import MACRO_PROFILE_HISTORY
+
+PROFILE_BUCKETS = ("send", "ok", "idle", "expr")
+
+
+@dataclass
+class MacroLineProfile:
+    line: str
+    text: str
+    total_s: float = 0.0
+    send_s: float = 0.0
+    ok_s: float = 0.0
+    idle_s: float = 0.0
+    expr_s: float = 0.0
+
+    @property
+    def other_s(self) -> float:
+        return max(0.0, self.total_s - self.send_s - self.ok_s - self.idle_s - self.expr_s)
+
+
+@dataclass
+class MacroRunProfile:
+    name: str
+    path: str
+    started: float
+    duration_s: float = 0.0
+    lines: list[MacroLineProfile] = field(default_factory=list)
+
+    def totals(self) -> dict[str, float]:
+        out = {bucket: 0.0 for bucket in PROFILE_BUCKETS}
+        for entry in self.lines:
+            for bucket in PROFILE_BUCKETS:
+                out[bucket] += getattr(entry, f"{bucket}_s")
+        return out
+
+
+class MacroProfiler:
+    """Collects `MacroRunProfile`s, keeping the last `history` runs.
+
+    A line's total runs from `start_line()` until the next `start_line()` or
+    `end_run()`; `timed()` splits that total into buckets.
+    """
+
+    def __init__(self, history: int = MACRO_PROFILE_HISTORY):
+        self._runs: deque[MacroRunProfile] = deque(maxlen=max(1, int(history)))
+        self._lock = threading.Lock()
+        self._run: MacroRunProfile | None = None
+        self._run_start = 0.0
+        self._line: MacroLineProfile | None = None
+        self._line_start = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._run is not None
+
+    def begin_run(self, name: str, path: str | None) -> None:
+        self._run = MacroRunProfile(name=name, path=path or "", started=time.time())
+        self._run_start = time.perf_counter()
+        self._line = None
+
+    def end_run(self) -> MacroRunProfile | None:
+        run = self._run
+        if run is None:
+            return None
+        self._close_line()
+        run.duration_s = time.perf_counter() - self._run_start
+        self._run = None
+        with self._lock:
+            self._runs.append(run)
+        return run
+
+    def start_line(self, label: str, text: str) -> None:
+        """Start timing a macro line (or streamed run); closes the previous one."""
+        if self._run is None:
+            return
+        self._close_line()
+        self._line = MacroLineProfile(line=label, text=text)
+        self._line_start = time.perf_counter()
+
+    def relabel_line(self, label: str, text: str) -> None:
+        """Rename the current entry, e.g. when a line turns out to start a streamed run."""
+        if self._line is not None:
+            self._line.line = label
+            self._line.text = text
+
+    def _close_line(self) -> None:
+        entry = self._line
+        if entry is None or self._run is None:
+            return
+        entry.total_s = time.perf_counter() - self._line_start
+        self._run.lines.append(entry)
+        self._line = None
+
+    @contextmanager
+    def timed(self, bucket: str) -> Iterator[None]:
+        """Add the block's duration to `bucket` of the current line, if any."""
+        entry = self._line
+        if entry is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            attr = f"{bucket}_s"
+            setattr(entry, attr, getattr(entry, attr) + time.perf_counter() - start)
+
+    def runs(self) -> list[MacroRunProfile]:
+        with self._lock:
+            return list(self._runs)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._runs.clear()
+
+
+def format_macro_profiles(runs: list[MacroRunProfile], *, top: int = 10) -> list[str]:
+    """Render profiled runs as report lines, slowest lines first."""
+    lines: list[str] = []
+    for run in runs:
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(run.started))
+        totals = run.totals()
+        lines.append(
+            f"{stamp} {run.name} ({run.path or 'unknown path'}): {run.duration_s:.3f}s, "
+            f"{len(run.lines)} line(s) | "
+            + " ".join(f"{bucket}={totals[bucket]:.3f}s" for bucket in PROFILE_BUCKETS)
+        )
+        slowest = sorted(run.lines, key=lambda entry: entry.total_s, reverse=True)[:top]
+        for entry in slowest:
+            lines.append(
+                f"  {entry.line:>9} {entry.total_s:7.3f}s send={entry.send_s:.3f} "
+                f"ok={entry.ok_s:.3f} idle={entry.idle_s:.3f} expr={entry.expr_s:.3f} "
+                f"other={entry.other_s:.3f}  {entry.text}"
+            )
+    return lines
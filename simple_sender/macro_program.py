@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# Simple Sender (GRBL G-code Sender)
+# Copyright (C) 2026 Bob Kolbasowski
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Optional (not required by the license): If you make improvements, please consider
+# contributing them back upstream (e.g., via a pull request) so others can benefit.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Compiled macro programs cached by path and file stamp."""
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from simple_sender.utils.constants import MACRO_PROGRAM_CACHE_SIZE
+from simple_sender.utils.macro_headers import parse_macro_header
+
+# Lines whose compiled form depends on macro vars at compile time
+# (`%if running` and friends) and therefore cannot be reused.
+_RUNTIME_PREFIXES = ("%if ",)
+
+
+@dataclass
+class MacroProgram:
+    """One macro file: its lines, header fields, and memoized compiled lines."""
+
+    path: str
+    stamp: tuple[int, int, bool]
+    lines: list[str]
+    name: str
+    tip: str
+    body_start: int
+    _compiled: dict[int, Any] = field(default_factory=dict, repr=False)
+
+    def compiled_line(self, idx: int, line: str, compile_line: Callable[[str], Any]) -> Any:
+        """Return the compiled form of body line `idx`, compiling it on first use.
+
+        `line` is the prompt-stripped text of `lines[idx]`. Results are shared
+        between runs, so evaluation must not mutate them.
+        """
+        if idx in self._compiled:
+            return self._compiled[idx]
+        compiled = compile_line(line)
+        if not line.startswith(_RUNTIME_PREFIXES):
+            self._compiled[idx] = compiled
+        return compiled
+
+
+class MacroProgramCache:
+    """LRU of `MacroProgram`s keyed by path, invalidated on mtime/size change.
+
+    The macro-scripting setting is part of the stamp because it changes how
+    lines compile.
+    """
+
+    def __init__(self, max_entries: int = MACRO_PROGRAM_CACHE_SIZE):
+        self._max_entries = max(1, int(max_entries))
+        self._programs: OrderedDict[str, MacroProgram] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(
+        self,
+        path: str,
+        *,
+        allow_python: bool,
+        color_validator: Callable[[str], bool] | None = None,
+    ) -> MacroProgram:
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size, bool(allow_python))
+        with self._lock:
+            program = self._programs.get(path)
+            if program is not None and program.stamp == stamp:
+                self._programs.move_to_end(path)
+                return program
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            lines = f.readlines()
+        name, tip, _color, _text_color, body_start = parse_macro_header(
+            lines,
+            color_validator=color_validator,
+        )
+        program = MacroProgram(path, stamp, lines, name, tip, body_start)
+        with self._lock:
+            self._programs[path] = program
+            self._programs.move_to_end(path)
+            while len(self._programs) > self._max_entries:
+                self._programs.popitem(last=False)
+        return program
+
+    def invalidate(self, path: str | None = None) -> None:
+        with self._lock:
+            if path is None:
+                self._programs.clear()
+            else:
+                self._programs.pop(path, None)
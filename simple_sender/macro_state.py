@@ -23,10 +23,19 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from typing import Any, Callable
 
-from simple_sender.utils.constants import RT_STATUS
+from simple_sender.utils.constants import (
+    MACRO_IDLE_SETTLE_S,
+    MACRO_WAIT_RECHECK_INTERVAL,
+    RT_STATUS,
+)
+
+
+def _seq(macro_vars: dict[str, Any], key: str) -> int:
+    return int(macro_vars.get(key, 0) or 0)
 
 
 def macro_wait_for_idle(
@@ -34,74 +43,88 @@ def macro_wait_for_idle(
     app,
     grbl,
     ui_q,
+    state_cond: threading.Condition,
+    macro_vars: dict[str, Any],
     timeout_s: float = 30.0,
 ) -> None:
+    """Block until the controller reports Idle after any motion.
+
+    Wakes on every status report (signalled through `state_cond`) and
+    re-checks at most every MACRO_WAIT_RECHECK_INTERVAL for state that is
+    not carried by status reports (disconnects, stream start/stop).
+    """
     if not grbl.is_connected():
         return
-    start = time.time()
+    start = time.monotonic()
     seen_busy = False
-    while True:
-        if not grbl.is_connected():
-            return
-        state = str(app._machine_state_text).strip()
-        is_idle = state.upper().startswith("IDLE")
-        if getattr(app, "_homing_in_progress", False):
-            is_idle = False
-        if not grbl.is_streaming():
-            if not is_idle:
-                seen_busy = True
-            elif is_idle and (seen_busy or (time.time() - start) > 0.2):
+    with state_cond:
+        while True:
+            if not grbl.is_connected():
                 return
-        if timeout_s and (time.time() - start) > timeout_s:
-            ui_q.put(("log", "[macro] %wait timeout"))
-            return
-        time.sleep(0.1)
+            seq = _seq(macro_vars, "_status_seq")
+            state = str(app._machine_state_text).strip()
+            is_idle = state.upper().startswith("IDLE")
+            if getattr(app, "_homing_in_progress", False):
+                is_idle = False
+            elapsed = time.monotonic() - start
+            wait_s = MACRO_WAIT_RECHECK_INTERVAL
+            if not grbl.is_streaming():
+                if not is_idle:
+                    seen_busy = True
+                elif seen_busy or elapsed > MACRO_IDLE_SETTLE_S:
+                    return
+                else:
+                    wait_s = min(wait_s, MACRO_IDLE_SETTLE_S - elapsed + 0.001)
+            if timeout_s:
+                if elapsed > timeout_s:
+                    ui_q.put(("log", "[macro] %wait timeout"))
+                    return
+                wait_s = min(wait_s, timeout_s - elapsed + 0.001)
+            state_cond.wait_for(
+                lambda: _seq(macro_vars, "_status_seq") != seq,
+                timeout=max(0.0, wait_s),
+            )
 
 
 def macro_wait_for_status(
     *,
     grbl,
     ui_q,
+    state_cond: threading.Condition,
     macro_vars: dict[str, Any],
-    macro_vars_lock,
     timeout_s: float = 1.0,
 ) -> bool:
-    start = time.time()
-    with macro_vars_lock:
-        seq = int(macro_vars.get("_status_seq", 0) or 0)
+    with state_cond:
+        seq = _seq(macro_vars, "_status_seq")
     grbl.send_realtime(RT_STATUS)
-    while True:
-        with macro_vars_lock:
-            now_seq = int(macro_vars.get("_status_seq", 0) or 0)
-        if now_seq != seq:
+    with state_cond:
+        if state_cond.wait_for(
+            lambda: _seq(macro_vars, "_status_seq") != seq,
+            timeout=timeout_s or None,
+        ):
             return True
-        if timeout_s and (time.time() - start) > timeout_s:
-            ui_q.put(("log", "[macro] %update timeout"))
-            return False
-        time.sleep(0.05)
+    ui_q.put(("log", "[macro] %update timeout"))
+    return False
 
 
 def macro_wait_for_modal(
     *,
     ui_q,
+    state_cond: threading.Condition,
     macro_vars: dict[str, Any],
-    macro_vars_lock,
     seq: int | None = None,
     timeout_s: float = 1.0,
 ) -> bool:
-    start = time.time()
-    if seq is None:
-        with macro_vars_lock:
-            seq = int(macro_vars.get("_modal_seq", 0) or 0)
-    while True:
-        with macro_vars_lock:
-            now_seq = int(macro_vars.get("_modal_seq", 0) or 0)
-        if now_seq != seq:
+    with state_cond:
+        if seq is None:
+            seq = _seq(macro_vars, "_modal_seq")
+        if state_cond.wait_for(
+            lambda: _seq(macro_vars, "_modal_seq") != seq,
+            timeout=timeout_s or None,
+        ):
             return True
-        if timeout_s and (time.time() - start) > timeout_s:
-            ui_q.put(("log", "[macro] $G modal update timeout"))
-            return False
-        time.sleep(0.05)
+    ui_q.put(("log", "[macro] $G modal update timeout"))
+    return False
 
 
 def snapshot_macro_state(
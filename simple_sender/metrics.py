@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# Simple Sender (GRBL G-code Sender)
+# Copyright (C) 2026 Bob Kolbasowski
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Optional (not required by the license): If you make improvements, please consider
+# contributing them back upstream (e.g., via a pull request) so others can benefit.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""In-process metrics registry: counters, gauges and fixed-bucket histograms.
+
+Metrics are created once (usually at import time) and updated from any
+thread; each update takes one small lock. `MetricsRegistry.exposition()`
+renders everything in the Prometheus text format, which is what Export
+diagnostics includes and what the optional file dump writes.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Sequence, TypeVar
+
+from .utils.constants import METRICS_DUMP_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+METRICS_PATH_ENV = "SIMPLE_SENDER_METRICS_PATH"
+
+DURATION_MS_EDGES: tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+LOAD_SECONDS_EDGES: tuple[float, ...] = (0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60, 120)
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Counter:
+    """Monotonic count."""
+
+    kind = "counter"
+    __slots__ = ("name", "labels", "_value", "_lock")
+
+    def __init__(self, name: str, labels: Labels = ()) -> None:
+        self.name = name
+        self.labels = labels
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def samples(self) -> list[tuple[str, Labels, float]]:
+        return [(self.name, self.labels, self._value)]
+
+
+class Gauge:
+    """Value that can go up and down."""
+
+    kind = "gauge"
+    __slots__ = ("name", "labels", "_value", "_lock")
+
+    def __init__(self, name: str, labels: Labels = ()) -> None:
+        self.name = name
+        self.labels = labels
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def samples(self) -> list[tuple[str, Labels, float]]:
+        return [(self.name, self.labels, self._value)]
+
+
+class Histogram:
+    """Observation counts in fixed buckets, plus their sum and count.
+
+    `edges` are inclusive upper bounds; values above the last edge land in
+    the implicit +Inf bucket.
+    """
+
+    kind = "histogram"
+    __slots__ = ("name", "labels", "edges", "_counts", "_sum", "_count", "_lock")
+
+    def __init__(self, name: str, edges: Sequence[float], labels: Labels = ()) -> None:
+        self.name = name
+        self.labels = labels
+        self.edges = tuple(sorted(float(edge) for edge in edges))
+        self._counts = [0] * (len(self.edges) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        idx = bisect_left(self.edges, value)
+        with self._lock:
+            self._counts[idx] += 1
+            self._sum += value
+            self._count += 1
+
+    @contextmanager
+    def time(self, scale: float = 1000.0) -> Iterator[None]:
+        """Observe the duration of the block (milliseconds by default)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe((time.perf_counter() - start) * scale)
+
+    def timed(self, func: _F) -> _F:
+        """Decorator form of `time()`."""
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.observe((time.perf_counter() - start) * 1000.0)
+
+        return wrapper  # type: ignore[return-value]
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def snapshot(self) -> tuple[list[int], float, int]:
+        with self._lock:
+            return list(self._counts), self._sum, self._count
+
+    def samples(self) -> list[tuple[str, Labels, float]]:
+        counts, total, count = self.snapshot()
+        out: list[tuple[str, Labels, float]] = []
+        running = 0
+        for edge, hits in zip(self.edges + (math.inf,), counts):
+            running += hits
+            le = "+Inf" if math.isinf(edge) else f"{edge:g}"
+            out.append((f"{self.name}_bucket", self.labels + (("le", le),), float(running)))
+        out.append((f"{self.name}_sum", self.labels, total))
+        out.append((f"{self.name}_count", self.labels, float(count)))
+        return out
+
+
+Metric = Counter | Gauge | Histogram
+
+
+class MetricsRegistry:
+    """Named metrics, each optionally split by labels.
+
+    `counter()`, `gauge()` and `histogram()` return the existing metric for a
+    name and label set, creating it on first use, so call sites can hold on
+    to the returned object instead of looking it up per update.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: dict[tuple[str, Labels], Metric] = {}
+        self._families: dict[str, tuple[str, str]] = {}
+        self._dump_stop: threading.Event | None = None
+        self._dump_thread: threading.Thread | None = None
+        self._dump_path: str | None = None
+
+    def counter(self, name: str, help: str = "", **labels: Any) -> Counter:
+        return self._get(Counter, name, help, labels)
+
+    def gauge(self, name: str, help: str = "", **labels: Any) -> Gauge:
+        return self._get(Gauge, name, help, labels)
+
+    def histogram(
+        self,
+        name: str,
+        edges: Sequence[float] = DURATION_MS_EDGES,
+        help: str = "",
+        **labels: Any,
+    ) -> Histogram:
+        return self._get(Histogram, name, help, labels, edges)
+
+    def _get(self, cls, name: str, help: str, labels: dict[str, Any], edges=None):
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is not None:
+                if not isinstance(metric, cls):
+                    raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+                return metric
+            family = self._families.get(name)
+            if family is not None and family[0] != cls.kind:
+                raise ValueError(f"Metric {name} is already registered as a {family[0]}")
+            if family is None or (help and not family[1]):
+                self._families[name] = (cls.kind, help)
+            metric = cls(name, edges, key[1]) if edges is not None else cls(name, key[1])
+            self._metrics[key] = metric
+            return metric
+
+    def reset(self) -> None:
+        """Forget every metric (objects already handed out keep working unregistered)."""
+        with self._lock:
+            self._metrics.clear()
+            self._families.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Plain-data view: {name: {"type", "help", "samples": [(sample, labels, value)]}}."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            families = dict(self._families)
+        out: dict[str, Any] = {}
+        for metric in sorted(metrics, key=lambda m: (m.name, m.labels)):
+            kind, help_text = families.get(metric.name, (metric.kind, ""))
+            entry = out.setdefault(metric.name, {"type": kind, "help": help_text, "samples": []})
+            entry["samples"].extend(
+                (sample, dict(labels), value) for sample, labels, value in metric.samples()
+            )
+        return out
+
+    def exposition(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for name, entry in self.snapshot().items():
+            if entry["help"]:
+                lines.append(f"# HELP {name} {_escape_help(entry['help'])}")
+            lines.append(f"# TYPE {name} {entry['type']}")
+            for sample, labels, value in entry["samples"]:
+                lines.append(f"{sample}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def write_exposition(self, path: str) -> None:
+        """Atomically replace `path` with the current exposition text."""
+        text = self.exposition()
+        dir_name = os.path.dirname(os.path.abspath(path))
+        os.makedirs(dir_name, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".metrics-", dir=dir_name)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as outfile:
+                outfile.write(text)
+            os.replace(tmp_path, path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def start_file_dump(self, path: str, interval: float = METRICS_DUMP_INTERVAL) -> None:
+        """Rewrite `path` every `interval` seconds until `stop_file_dump()`."""
+        self.stop_file_dump()
+        stop = threading.Event()
+        self._dump_stop = stop
+        self._dump_path = path
+
+        def run() -> None:
+            while not stop.wait(max(0.5, interval)):
+                self._dump_quietly(path)
+
+        self._dump_thread = threading.Thread(target=run, name="metrics-dump", daemon=True)
+        self._dump_thread.start()
+        logger.info(f"Writing metrics to {path} every {interval:g}s")
+
+    def start_file_dump_from_env(self) -> None:
+        path = os.getenv(METRICS_PATH_ENV)
+        if path:
+            self.start_file_dump(path)
+
+    def stop_file_dump(self) -> None:
+        """Stop the periodic dump and write the file one last time."""
+        stop, thread, path = self._dump_stop, self._dump_thread, self._dump_path
+        self._dump_stop = self._dump_thread = self._dump_path = None
+        if stop is None:
+            return
+        stop.set()
+        if thread is not None:
+            thread.join(timeout=1.0)
+        if path:
+            self._dump_quietly(path)
+
+    def _dump_quietly(self, path: str) -> None:
+        try:
+            self.write_exposition(path)
+        except Exception as exc:
+            logger.warning(f"Failed to write metrics to {path}: {exc}")
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels.items():
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{key}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+METRICS = MetricsRegistry()
+"""Process-wide registry used by the worker, loaders, renderers and UI queue."""
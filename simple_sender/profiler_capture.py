@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# Simple Sender (GRBL G-code Sender)
+# Copyright (C) 2026 Bob Kolbasowski
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Optional (not required by the license): If you make improvements, please consider
+# contributing them back upstream (e.g., via a pull request) so others can benefit.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""On-demand sampling profiler covering every Python thread.
+
+cProfile only sees the thread that enabled it, so a live job (Tk thread,
+worker RX/TX threads, loaders) is profiled by sampling
+`sys._current_frames()` from a background thread instead. The samples are
+folded into a pstats-compatible table: `tottime`/`cumtime` are sampled wall
+time, and the call columns count samples rather than calls. The result can
+be printed with `pstats` or saved as a `.prof` file for external viewers.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from .utils.constants import (
+    PROFILE_CAPTURE_MAX_SECONDS,
+    PROFILE_SAMPLE_INTERVAL,
+)
+
+logger = logging.getLogger(__name__)
+
+FuncKey = tuple[str, int, str]
+
+
+def _func_key(code: Any) -> FuncKey:
+    return (code.co_filename, code.co_firstlineno, code.co_name)
+
+
+@dataclass
+class ProfileCapture:
+    """Samples collected by one `SamplingProfiler` run."""
+
+    started: float
+    duration: float = 0.0
+    samples: int = 0
+    self_time: dict[FuncKey, float] = field(default_factory=dict)
+    total_time: dict[FuncKey, float] = field(default_factory=dict)
+    hits: Counter[FuncKey] = field(default_factory=Counter)
+    callers: dict[FuncKey, Counter[FuncKey]] = field(default_factory=dict)
+    caller_time: dict[tuple[FuncKey, FuncKey], float] = field(default_factory=dict)
+    thread_samples: Counter[str] = field(default_factory=Counter)
+    thread_leaves: dict[str, Counter[FuncKey]] = field(default_factory=dict)
+
+    def create_stats(self) -> None:
+        """Build `self.stats` in the layout `pstats.Stats` loads from a profiler."""
+        stats: dict[FuncKey, tuple] = {}
+        for key, count in self.hits.items():
+            callers = {
+                caller: (n, n, 0.0, self.caller_time.get((caller, key), 0.0))
+                for caller, n in self.callers.get(key, Counter()).items()
+            }
+            stats[key] = (
+                count,
+                count,
+                self.self_time.get(key, 0.0),
+                self.total_time.get(key, 0.0),
+                callers,
+            )
+        self.stats = stats
+
+    def to_pstats(self) -> pstats.Stats:
+        return pstats.Stats(self)
+
+    def dump_stats(self, path: str) -> None:
+        self.to_pstats().dump_stats(path)
+
+    def summary(self) -> str:
+        return (
+            f"{self.samples} samples over {self.duration:.1f} s "
+            f"across {len(self.thread_samples)} thread(s)"
+        )
+
+    def report_lines(self, limit: int = 30) -> list[str]:
+        started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started))
+        lines = [f"Started {started}; {self.summary()}"]
+        lines.append("Samples per thread (top functions by self time):")
+        for name, count in self.thread_samples.most_common():
+            leaves = self.thread_leaves.get(name, Counter()).most_common(3)
+            tops = ", ".join(f"{pstats.func_std_string(key)} {n}" for key, n in leaves)
+            lines.append(f"- {name}: {count}" + (f" [{tops}]" if tops else ""))
+        for sort_key, title in (("tottime", "By self time"), ("cumulative", "By cumulative time")):
+            stream = io.StringIO()
+            stats = pstats.Stats(self, stream=stream)
+            stats.sort_stats(sort_key).print_stats(limit)
+            lines.append(f"{title} (calls = samples):")
+            body = stream.getvalue().strip("\n").splitlines()
+            # Drop pstats' own header lines (totals and ordering) up to the column titles.
+            for idx, text in enumerate(body):
+                if text.lstrip().startswith("ncalls"):
+                    body = body[idx:]
+                    break
+            lines.extend(body)
+        return lines
+
+
+class SamplingProfiler:
+    """Sample every thread's Python stack for `seconds` on a daemon thread."""
+
+    def __init__(self, seconds: float, *, interval: float = PROFILE_SAMPLE_INTERVAL) -> None:
+        self.seconds = min(max(0.5, float(seconds)), PROFILE_CAPTURE_MAX_SECONDS)
+        self.interval = max(0.001, float(interval))
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, on_done: Callable[[ProfileCapture], Any]) -> None:
+        """Begin sampling; `on_done` is called on the sampler thread with the result."""
+        if self.running:
+            raise RuntimeError("Profile capture already running")
+        self._stop.clear()
+
+        def run() -> None:
+            capture = self.capture()
+            try:
+                on_done(capture)
+            except Exception:
+                logger.exception("Profile capture callback failed")
+
+        self._thread = threading.Thread(target=run, name="profile-capture", daemon=True)
+        self._thread.start()
+
+    def cancel(self) -> None:
+        self._stop.set()
+
+    def capture(self) -> ProfileCapture:
+        """Sample on the calling thread until the duration elapses or `cancel()`."""
+        own = threading.get_ident()
+        result = ProfileCapture(started=time.time())
+        start = last = time.perf_counter()
+        deadline = start + self.seconds
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            weight = min(now - last, self.interval * 4)
+            last = now
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                self._record(result, names.get(ident, f"thread-{ident}"), frame, weight)
+            result.samples += 1
+            if now >= deadline:
+                break
+        result.duration = time.perf_counter() - start
+        return result
+
+    @staticmethod
+    def _record(result: ProfileCapture, thread_name: str, frame: Any, weight: float) -> None:
+        stack: list[FuncKey] = []
+        while frame is not None:
+            stack.append(_func_key(frame.f_code))
+            frame = frame.f_back
+        if not stack:
+            return
+        leaf = stack[0]
+        result.thread_samples[thread_name] += 1
+        result.thread_leaves.setdefault(thread_name, Counter())[leaf] += 1
+        result.self_time[leaf] = result.self_time.get(leaf, 0.0) + weight
+        seen: set[FuncKey] = set()
+        seen_edges: set[tuple[FuncKey, FuncKey]] = set()
+        for depth, key in enumerate(stack):
+            if key not in seen:
+                seen.add(key)
+                result.hits[key] += 1
+                result.total_time[key] = result.total_time.get(key, 0.0) + weight
+            if depth + 1 < len(stack):
+                edge = (stack[depth + 1], key)
+                if edge not in seen_edges:
+                    seen_edges.add(edge)
+                    result.callers.setdefault(key, Counter())[edge[0]] += 1
+                    result.caller_time[edge] = result.caller_time.get(edge, 0.0) + weight
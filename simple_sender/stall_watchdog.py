@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# Simple Sender (GRBL G-code Sender)
+# Copyright (C) 2026 Bob Kolbasowski
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Optional (not required by the license): If you make improvements, please consider
+# contributing them back upstream (e.g., via a pull request) so others can benefit.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Main-loop stall detection.
+
+The Tk thread reschedules a heartbeat every `heartbeat_ms`. A daemon thread
+watches the time since the last beat; once it exceeds the threshold it
+captures the Tk thread's stack with `sys._current_frames()` while the stall
+is still in progress, so the log shows what the main thread was blocked in
+rather than where it ended up. The stall is recorded with its full duration
+when the next heartbeat runs.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from .metrics import METRICS
+from .utils.constants import (
+    UI_STALL_HEARTBEAT_MS,
+    UI_STALL_HISTORY,
+    UI_STALL_THRESHOLD_MS,
+)
+
+logger = logging.getLogger(__name__)
+
+UI_STALL_ENV = "SIMPLE_SENDER_UI_STALL_MS"
+
+_LOOP_LAG_MS = METRICS.histogram(
+    "ui_loop_lag_ms",
+    (5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000),
+    "Tk heartbeat delay beyond its scheduled interval",
+)
+_STALL_MS = METRICS.histogram(
+    "ui_stall_ms",
+    (250, 500, 1000, 2000, 5000, 10000, 30000),
+    "Duration of main-loop stalls over the threshold",
+)
+_STALLS = METRICS.counter("ui_stalls_total", "Main-loop stalls over the threshold")
+
+
+@dataclass(frozen=True, slots=True)
+class StallRecord:
+    started: float
+    duration_ms: float
+    stack: tuple[str, ...]
+
+
+def stall_threshold_from_env(default: float = UI_STALL_THRESHOLD_MS) -> float:
+    """Threshold from `SIMPLE_SENDER_UI_STALL_MS`; 0 or less disables detection."""
+    raw = os.getenv(UI_STALL_ENV, "").strip()
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {UI_STALL_ENV}={raw!r}")
+        return default
+
+
+class MainLoopStallWatchdog:
+    """Heartbeat on the Tk thread plus a watcher thread that samples stalls.
+
+    `schedule` is the Tk `after` method (or anything with the same
+    signature). `start()` must be called on the Tk thread; `on_stall` is
+    called there with each finished `StallRecord`.
+    """
+
+    def __init__(
+        self,
+        schedule: Callable[[int, Callable[[], Any]], Any],
+        *,
+        threshold_ms: float = UI_STALL_THRESHOLD_MS,
+        heartbeat_ms: int = UI_STALL_HEARTBEAT_MS,
+        history: int = UI_STALL_HISTORY,
+        on_stall: Callable[[StallRecord], Any] | None = None,
+    ) -> None:
+        self._schedule = schedule
+        self.threshold_ms = float(threshold_ms)
+        self.heartbeat_ms = max(10, int(heartbeat_ms))
+        self._on_stall = on_stall
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._main_ident: int | None = None
+        self._last_beat = 0.0
+        self._stall_started = 0.0
+        self._stall_stack: tuple[str, ...] | None = None
+        self._records: deque[StallRecord] = deque(maxlen=max(1, int(history)))
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running or self.threshold_ms <= 0:
+            return
+        self._stop.clear()
+        self._main_ident = threading.get_ident()
+        with self._lock:
+            self._last_beat = time.monotonic()
+            self._stall_stack = None
+        self._schedule(self.heartbeat_ms, self._beat)
+        self._thread = threading.Thread(target=self._watch, name="ui-stall-watchdog", daemon=True)
+        self._thread.start()
+        logger.info(f"Main-loop stall watchdog started (threshold {self.threshold_ms:g} ms)")
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    def recent_stalls(self) -> list[StallRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def _beat(self) -> None:
+        if self._stop.is_set():
+            return
+        now = time.monotonic()
+        with self._lock:
+            lag_ms = max(0.0, (now - self._last_beat) * 1000.0 - self.heartbeat_ms)
+            self._last_beat = now
+            stack = self._stall_stack
+            self._stall_stack = None
+            record = None
+            if stack is not None:
+                record = StallRecord(self._stall_started, lag_ms, stack)
+                self._records.append(record)
+        _LOOP_LAG_MS.observe(lag_ms)
+        if record is not None:
+            _STALLS.inc()
+            _STALL_MS.observe(lag_ms)
+            logger.warning(f"Main loop stalled for {lag_ms:.0f} ms")
+            if self._on_stall is not None:
+                try:
+                    self._on_stall(record)
+                except Exception:
+                    logger.exception("Stall callback failed")
+        self._schedule(self.heartbeat_ms, self._beat)
+
+    def _watch(self) -> None:
+        poll = min(self.heartbeat_ms, self.threshold_ms / 4.0) / 1000.0
+        while not self._stop.wait(max(0.01, poll)):
+            now = time.monotonic()
+            with self._lock:
+                if self._stall_stack is not None:
+                    continue
+                overdue_ms = (now - self._last_beat) * 1000.0 - self.heartbeat_ms
+                if overdue_ms < self.threshold_ms:
+                    continue
+                stack = self._capture_main_stack()
+                self._stall_stack = stack
+                self._stall_started = time.time() - overdue_ms / 1000.0
+            # Logged right away so a hang that never recovers still leaves a trace.
+            logger.warning(
+                f"Main loop unresponsive for {overdue_ms:.0f} ms; main thread stack:\n"
+                + "".join(stack)
+            )
+
+    def _capture_main_stack(self) -> tuple[str, ...]:
+        frame = sys._current_frames().get(self._main_ident) if self._main_ident else None
+        if frame is None:
+            return ("<main thread stack unavailable>\n",)
+        return tuple(traceback.format_stack(frame))
+
+
+def format_stall_records(records: list[StallRecord], *, stack_limit: int = 12) -> list[str]:
+    """Diagnostics lines for recent stalls, newest first, with the innermost frames."""
+    lines: list[str] = []
+    for record in reversed(records):
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(record.started))
+        lines.append(f"- {stamp} stalled {record.duration_ms:.0f} ms")
+        for entry in record.stack[-stack_limit:]:
+            lines.extend(f"    {part}" for part in entry.rstrip("\n").splitlines())
+    return lines
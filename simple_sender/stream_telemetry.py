@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# Simple Sender (GRBL G-code Sender)
+# Copyright (C) 2026 Bob Kolbasowski
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Optional (not required by the license): If you make improvements, please consider
+# contributing them back upstream (e.g., via a pull request) so others can benefit.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Fixed-size numeric ring buffers for streaming telemetry.
+
+Samples are appended from the worker RX/TX threads in O(1) with no
+allocation; histogram and percentile queries copy the filled window and are
+meant for diagnostics, not the hot path.
+"""
+
+from __future__ import annotations
+
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Any, Sequence
+
+from .utils.constants import TELEMETRY_RING_SIZE
+
+ACK_LATENCY_EDGES_MS: tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000)
+RX_OCCUPANCY_EDGES: tuple[float, ...] = (0, 16, 32, 48, 64, 80, 96, 112, 128)
+PLANNER_EDGES: tuple[float, ...] = (0, 1, 2, 4, 8, 12, 15)
+
+
+class RingBuffer:
+    """Fixed-capacity ring of doubles backed by `array('d')`."""
+
+    __slots__ = ("_data", "_capacity", "_next", "_count", "_lock")
+
+    def __init__(self, capacity: int = TELEMETRY_RING_SIZE) -> None:
+        self._capacity = max(1, int(capacity))
+        self._data = array("d", bytes(8 * self._capacity))
+        self._next = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def append(self, value: float) -> None:
+        with self._lock:
+            self._data[self._next] = value
+            self._next = (self._next + 1) % self._capacity
+            if self._count < self._capacity:
+                self._count += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._next = 0
+            self._count = 0
+
+    def values(self) -> array:
+        """Return the stored samples, oldest first."""
+        with self._lock:
+            if self._count < self._capacity:
+                return self._data[: self._count]
+            return self._data[self._next :] + self._data[: self._next]
+
+    def percentiles(self, qs: Sequence[float]) -> list[float | None]:
+        """Return nearest-rank percentiles (0-100) of the stored samples."""
+        data = sorted(self.values())
+        if not data:
+            return [None for _ in qs]
+        last = len(data) - 1
+        out: list[float | None] = []
+        for q in qs:
+            q = min(100.0, max(0.0, float(q)))
+            out.append(data[min(last, int(round(q / 100.0 * last)))])
+        return out
+
+    def percentile(self, q: float) -> float | None:
+        return self.percentiles((q,))[0]
+
+    def histogram(self, edges: Sequence[float]) -> list[int]:
+        """Count samples per bucket; bucket i holds values <= edges[i].
+
+        The final bucket (index len(edges)) holds values above the last edge.
+        """
+        counts = [0] * (len(edges) + 1)
+        for value in self.values():
+            counts[bisect_left(edges, value)] += 1
+        return counts
+
+    def summary(self) -> dict[str, Any]:
+        data = self.values()
+        if not data:
+            return {"count": 0}
+        p50, p90, p99 = self.percentiles((50, 90, 99))
+        return {
+            "count": len(data),
+            "min": min(data),
+            "max": max(data),
+            "mean": sum(data) / len(data),
+            "p50": p50,
+            "p90": p90,
+            "p99": p99,
+        }
+
+
+class StreamTelemetry:
+    """Per-worker ring buffers for ack latency, RX occupancy and planner Bf."""
+
+    def __init__(self, capacity: int = TELEMETRY_RING_SIZE) -> None:
+        self.ack_latency_ms = RingBuffer(capacity)
+        self.rx_occupancy = RingBuffer(capacity)
+        self.planner_free = RingBuffer(capacity)
+
+    def clear(self) -> None:
+        self.ack_latency_ms.clear()
+        self.rx_occupancy.clear()
+        self.planner_free.clear()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Summaries and histograms for diagnostics."""
+        out: dict[str, dict[str, Any]] = {}
+        for name, ring, edges in (
+            ("ack_latency_ms", self.ack_latency_ms, ACK_LATENCY_EDGES_MS),
+            ("rx_occupancy_bytes", self.rx_occupancy, RX_OCCUPANCY_EDGES),
+            ("planner_blocks_free", self.planner_free, PLANNER_EDGES),
+        ):
+            entry = ring.summary()
+            if entry["count"]:
+                entry["histogram"] = list(zip(_bucket_labels(edges), ring.histogram(edges)))
+            out[name] = entry
+        return out
+
+
+def _bucket_labels(edges: Sequence[float]) -> list[str]:
+    labels = [f"<={edge:g}" for edge in edges]
+    labels.append(f">{edges[-1]:g}")
+    return labels
+
+
+def format_telemetry_snapshot(snapshot: dict[str, dict[str, Any]]) -> list[str]:
+    """Render `StreamTelemetry.snapshot()` as report lines."""
+    lines: list[str] = []
+    for name, entry in snapshot.items():
+        count = int(entry.get("count", 0))
+        if not count:
+            lines.append(f"{name}: no samples")
+            continue
+        lines.append(
+            f"{name}: n={count} min={entry['min']:.1f} p50={entry['p50']:.1f} "
+            f"p90={entry['p90']:.1f} p99={entry['p99']:.1f} max={entry['max']:.1f} "
+            f"mean={entry['mean']:.1f}"
+        )
+        buckets = [f"{label}:{hits}" for label, hits in entry.get("histogram", []) if hits]
+        if buckets:
+            lines.append("  " + " ".join(buckets))
+    return lines
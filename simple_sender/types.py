@@ -93,6 +93,9 @@ class StreamQueueItem:
     is_gcode: bool
     idx: int | None
     line: str
+    sent_ts: float = 0.0
+    piece: int = 0
+    final: bool = True
 
 
 @dataclass(frozen=True, slots=True)
@@ -100,6 +103,8 @@ class StreamPendingItem:
     line: str
     is_gcode: bool
     idx: int | None
+    piece: int = 0
+    final: bool = True
 
 
 @dataclass(frozen=True, slots=True)
@@ -109,6 +114,24 @@ class ManualPendingItem:
     line_len: int
 
 
+@dataclass(frozen=True, slots=True)
+class GrblStatusReport:
+    """Parsed `<...>` status report published by the worker."""
+
+    raw: str
+    state: str
+    mpos: tuple[float, float, float] | None = None
+    wpos: tuple[float, float, float] | None = None
+    wco: tuple[float, float, float] | None = None
+    planner: int | None = None
+    rx_free: int | None = None
+    feed: float | None = None
+    spindle: float | None = None
+    ov: tuple[int, int, int] | None = None
+    pins: str | None = None
+    line_number: int | None = None
+
+
 class GrblWorkerState:
     ui_q: Any
 
@@ -126,6 +149,8 @@ class GrblWorkerState:
     _ack_index: int
     _stream_buf_used: int
     _rx_window: int
+    _stream_leveler: Any
+    _stream_piece: int
 
     _outgoing_q: queue.Queue[str]
     _purge_jog_queue: threading.Event
@@ -146,6 +171,8 @@ class GrblWorkerState:
 
     _dry_run_sanitize: bool
     _last_rx_ts: float
+    _flight_recorder: Any
+    _telemetry: Any
 
     _status_interval_lock: threading.Lock
     _status_poll_interval: float
@@ -214,6 +241,9 @@ class GrblWorkerState:
     def _record_tx_bytes(self, count: int) -> None:
         raise NotImplementedError
 
+    def _record_flight_frame(self, kind: int, data: bytes, idx: int | None = None) -> None:
+        raise NotImplementedError
+
     def _encode_line_payload(self, line: str) -> bytes:
         raise NotImplementedError
 
@@ -229,8 +259,11 @@ class MacroExecutorState:
     _current_macro_line: str
 
     _macro_vars_lock: threading.Lock
+    _macro_state_cond: threading.Condition
     _macro_vars: dict[str, Any]
     _macro_local_vars: dict[str, Any]
+    _macro_programs: Any
+    _macro_profiler: Any
 
     _macro_state_restored: bool
     _macro_saved_state: dict[str, str] | None
@@ -338,6 +371,7 @@ UiEvent = (
     | tuple[Literal["ready"], bool]
     | tuple[Literal["alarm"], str]
     | tuple[Literal["status"], str]
+    | tuple[Literal["status"], str, GrblStatusReport]
     | tuple[Literal["buffer_fill"], int, int, int]
     | tuple[Literal["throughput"], float]
     | tuple[Literal["stream_state"], str, Any | None]
@@ -45,6 +45,7 @@ def _init_behavior_preferences(
         value=setting("grbl_popup_dedupe_sec", 3.0)
     )
     app.macros_allow_python = tk.BooleanVar(value=setting("macros_allow_python", False))
+    app.macro_profiling = tk.BooleanVar(value=setting("macro_profiling", False))
     app.macro_line_timeout_sec = tk.DoubleVar(
         value=setting(
             "macro_line_timeout_sec",
@@ -279,6 +279,7 @@ def _init_gcode_and_autolevel_state(app, *, copy_module, tk, default_settings: d
     app._auto_level_leveled_temp = False
     app._auto_level_leveled_name = None
     app._auto_level_restore = None
+    app._auto_level_live = False
     app.auto_level_settings = dict(
         app.settings.get("auto_level_settings", default_settings.get("auto_level_settings", {}))
         or {}
@@ -25,6 +25,7 @@ import threading
 import traceback
 from tkinter import messagebox
 
+from simple_sender.metrics import METRICS
 from simple_sender.ui.dialogs.error_dialogs_ui import close_grbl_code_popup
 
 def format_exception(exc: BaseException) -> str:
@@ -78,12 +79,18 @@ def tk_report_callback_exception(app, exc, val, tb):
 
 def on_close(app):
     app._closing = True
+    watchdog = getattr(app, "stall_watchdog", None)
+    if watchdog is not None:
+        watchdog.stop()
+    profiler = getattr(app, "_profile_capture_running", None)
+    if profiler is not None:
+        profiler.cancel()
     try:
         close_grbl_code_popup(app)
     except Exception:
         pass
     try:
-        app._save_settings()
+        app._save_settings(immediate=True)
         app.grbl.disconnect()
     except Exception as exc:
         app._log_exception("Shutdown failed", exc)
@@ -108,4 +115,5 @@ def on_close(app):
             py.quit()
         except Exception:
             pass
+    METRICS.stop_file_dump()
     app.destroy()
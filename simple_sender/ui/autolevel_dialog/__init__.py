@@ -28,6 +28,7 @@ from tkinter import ttk, messagebox, simpledialog
 
 from simple_sender.autolevel.height_map import HeightMap
 from simple_sender.autolevel.leveler import (
+    LEVEL_Z_TOLERANCE,
     LevelFileResult,
     level_gcode_file,
     level_gcode_lines,
@@ -56,6 +57,7 @@ def _apply_auto_level_to_path(
     header_lines: list[str] | None,
     streaming_mode: bool,
     log_fn: Callable[[str], None] | None = None,
+    z_tolerance: float = LEVEL_Z_TOLERANCE,
 ) -> tuple[LevelFileResult, bool, str | None]:
     return cast(
         tuple[LevelFileResult, bool, str | None],
@@ -70,6 +72,7 @@ def _apply_auto_level_to_path(
             header_lines=header_lines,
             streaming_mode=streaming_mode,
             log_fn=log_fn,
+            z_tolerance=z_tolerance,
             level_gcode_lines_fn=level_gcode_lines,
             level_gcode_file_fn=level_gcode_file,
             write_gcode_lines_fn=write_gcode_lines,
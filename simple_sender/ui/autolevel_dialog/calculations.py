@@ -26,7 +26,7 @@ import math
 from collections.abc import Callable
 from typing import Any
 
-from simple_sender.autolevel.grid import ProbeGrid
+from simple_sender.autolevel.grid import ProbeGrid, optimize_probe_order
 from simple_sender.utils.constants import MAX_LINE_LENGTH
 
 
@@ -158,7 +158,10 @@ def _point_in_avoidance(px: float, py: float, areas: list[tuple[float, float, fl
 
 
 def _apply_avoidance(
-    grid: ProbeGrid, areas: list[tuple[float, float, float]]
+    grid: ProbeGrid,
+    areas: list[tuple[float, float, float]],
+    *,
+    path_order: str | None = None,
 ) -> tuple[ProbeGrid, list[tuple[float, float]]]:
     if not areas:
         return grid, []
@@ -171,6 +174,9 @@ def _apply_avoidance(
             points.append((px, py))
     if not skipped:
         return grid, []
+    if points and (path_order or "").strip().lower() == "optimized":
+        # Re-plan the tour around the holes instead of skipping through them.
+        points = optimize_probe_order(points, start=grid.points[0])
     filtered = ProbeGrid(
         bounds=grid.bounds,
         xs=grid.xs,
@@ -35,11 +35,20 @@ from typing import Any, cast
 
 from simple_sender.autolevel.grid import AdaptiveGridSpec, ProbeBounds, ProbeGrid, build_adaptive_grid
 from simple_sender.autolevel.height_map import HeightMap
-from simple_sender.autolevel.leveler import LevelFileResult
-from simple_sender.autolevel.probe_runner import ProbeRunSettings
+from simple_sender.autolevel.leveler import LEVEL_Z_TOLERANCE, LevelFileResult, StreamLeveler
+from simple_sender.autolevel.map_cache import HeightMapRecord, find_reusable_map, store_height_map
+from simple_sender.autolevel.probe_runner import (
+    RETRACT_ADAPTIVE,
+    RETRACT_FIXED,
+    ProbeRunSettings,
+    estimate_probe_time,
+)
+from simple_sender.autolevel.refine import AdaptiveProbePlan
 from simple_sender.ui.dro import convert_units
+from simple_sender.ui.gcode.stats import format_duration, get_rapid_rates_for_estimate
 from simple_sender.utils.config import DEFAULT_SETTINGS
 from simple_sender.utils.constants import (
+    AUTOLEVEL_REFINE_COARSE_STRIDE,
     AUTOLEVEL_SPACING_MIN,
     AUTOLEVEL_START_STATE_POLL_MS,
 )
@@ -59,6 +68,9 @@ from .helpers import (
     validate_probe_settings_vars,
 )
 from .io import (
+    current_offsets,
+    height_map_cache_dir,
+    install_height_map,
     load_height_map as load_height_map_file,
     save_height_map as save_height_map_file,
     save_leveled as save_leveled_job,
@@ -100,6 +112,8 @@ class AutoLevelDialogController:
         self.defaults: AdaptiveGridSpec | None = None
         self.run_defaults: ProbeRunSettings | None = None
         self.interp_saved = "bicubic"
+        self.z_tolerance_saved = LEVEL_Z_TOLERANCE
+        self.refine_tolerance_saved = 0.0
         self.path_order_default = "serpentine"
         self.base_spacing_saved = 5.0
         self._interp_default = "bicubic"
@@ -122,6 +136,10 @@ class AutoLevelDialogController:
         self.retract_var: tk.StringVar = cast(tk.StringVar, None)
         self.settle_var: tk.StringVar = cast(tk.StringVar, None)
         self.interp_var: tk.StringVar = cast(tk.StringVar, None)
+        self.z_tolerance_var: tk.StringVar = cast(tk.StringVar, None)
+        self.refine_tolerance_var: tk.StringVar = cast(tk.StringVar, None)
+        self.retract_mode_var: tk.StringVar = cast(tk.StringVar, None)
+        self.clearance_var: tk.StringVar = cast(tk.StringVar, None)
         self.preview_var: tk.StringVar = cast(tk.StringVar, None)
         self.bounds_var: tk.StringVar = cast(tk.StringVar, None)
         self.status_var: tk.StringVar = cast(tk.StringVar, None)
@@ -134,6 +152,11 @@ class AutoLevelDialogController:
         self.path_order_options: dict[str, str] = {
             "Serpentine (bottom-left)": "serpentine",
             "Spiral (center)": "spiral",
+            "Optimized (shortest travel)": "optimized",
+        }
+        self.retract_mode_options: dict[str, str] = {
+            "Fixed (safe Z)": RETRACT_FIXED,
+            "Adaptive (measured + clearance)": RETRACT_ADAPTIVE,
         }
         self.profile_labels: list[str] = []
         self.job_info_text = ""
@@ -160,11 +183,18 @@ class AutoLevelDialogController:
         self.retract_entry: ttk.Entry = cast(ttk.Entry, None)
         self.settle_entry: ttk.Entry = cast(ttk.Entry, None)
         self.interp_combo: ttk.Combobox = cast(ttk.Combobox, None)
+        self.z_tolerance_entry: ttk.Entry = cast(ttk.Entry, None)
+        self.refine_tolerance_entry: ttk.Entry = cast(ttk.Entry, None)
+        self.retract_mode_combo: ttk.Combobox = cast(ttk.Combobox, None)
+        self.clearance_entry: ttk.Entry = cast(ttk.Entry, None)
         self.start_btn: ttk.Button = cast(ttk.Button, None)
         self.apply_btn: ttk.Button = cast(ttk.Button, None)
+        self.apply_live_btn: ttk.Button = cast(ttk.Button, None)
         self.save_btn: ttk.Button = cast(ttk.Button, None)
         self.save_map_btn: ttk.Button = cast(ttk.Button, None)
         self.load_map_btn: ttk.Button = cast(ttk.Button, None)
+        self.reuse_map_btn: ttk.Button = cast(ttk.Button, None)
+        self.cached_map: HeightMapRecord | None = None
         self.revert_btn: ttk.Button = cast(ttk.Button, None)
         self.close_btn: ttk.Button = cast(ttk.Button, None)
         self.progress_bar: ttk.Progressbar = cast(ttk.Progressbar, None)
@@ -177,6 +207,7 @@ class AutoLevelDialogController:
         self._init_variables()
         self._build_ui()
         self._hydrate_existing_state()
+        self._offer_cached_map()
         self.update_preview()
         self._poll_start_state()
         if self.dlg is not None:
@@ -263,6 +294,16 @@ class AutoLevelDialogController:
         max_spacing_default = float(self.saved.get("max_spacing", 12.0) or 12.0)
         max_points_default = self.saved.get("max_points", None)
         self.interp_saved = pref_interp(self.saved.get("interpolation", "bicubic"), "bicubic")
+        try:
+            # 0 is meaningful here (uniform grid-step cuts), so pref_float does not apply.
+            self.z_tolerance_saved = max(0.0, float(self.saved.get("z_tolerance", LEVEL_Z_TOLERANCE)))
+        except (TypeError, ValueError):
+            self.z_tolerance_saved = LEVEL_Z_TOLERANCE
+        try:
+            # 0 disables adaptive refinement (probe the full grid).
+            self.refine_tolerance_saved = max(0.0, float(self.saved.get("refine_tolerance", 0.0) or 0.0))
+        except (TypeError, ValueError):
+            self.refine_tolerance_saved = 0.0
         self.path_order_default = str(self.saved.get("path_order", "serpentine") or "serpentine")
         self.run_defaults = ProbeRunSettings(
             safe_z=float(self.saved.get("safe_z", 5.0) or 0.0),
@@ -270,6 +311,8 @@ class AutoLevelDialogController:
             probe_feed=float(self.saved.get("probe_feed", 100.0) or 0.0),
             retract_z=float(self.saved.get("retract_z", 2.0) or 0.0),
             settle_time=float(self.saved.get("settle_time", 0.0) or 0.0),
+            retract_mode=str(self.saved.get("retract_mode", RETRACT_FIXED) or RETRACT_FIXED),
+            travel_clearance=float(self.saved.get("travel_clearance", 1.0) or 0.0),
         )
 
         profile = self.job_prefs.get(self.profile_name, {})
@@ -309,7 +352,11 @@ class AutoLevelDialogController:
         self.probe_feed_var = tk.StringVar(value=f"{run_defaults.probe_feed:.1f}")
         self.retract_var = tk.StringVar(value=f"{run_defaults.retract_z:.2f}")
         self.settle_var = tk.StringVar(value=f"{run_defaults.settle_time:.2f}")
+        self.retract_mode_var = tk.StringVar(value=self._retract_mode_label(run_defaults.retract_mode))
+        self.clearance_var = tk.StringVar(value=f"{run_defaults.travel_clearance:.2f}")
         self.interp_var = tk.StringVar(value=self._interp_default)
+        self.z_tolerance_var = tk.StringVar(value=f"{self.z_tolerance_saved:.3f}")
+        self.refine_tolerance_var = tk.StringVar(value=f"{self.refine_tolerance_saved:.3f}")
         self.preview_var = tk.StringVar(value="")
         self.bounds_var = tk.StringVar(value="")
         self.status_var = tk.StringVar(value="")
@@ -358,6 +405,15 @@ class AutoLevelDialogController:
     def _path_order_value(self, label: str) -> str:
         return self.path_order_options.get(label, "serpentine")
 
+    def _retract_mode_label(self, mode: str) -> str:
+        for label, value in self.retract_mode_options.items():
+            if value == mode:
+                return label
+        return next(iter(self.retract_mode_options))
+
+    def _retract_mode_value(self, label: str) -> str:
+        return self.retract_mode_options.get(label, RETRACT_FIXED)
+
     def apply_profile_choice(self, name: str) -> None:
         if not name:
             return
@@ -599,8 +655,12 @@ class AutoLevelDialogController:
             "probe_feed": safe_float_text(self.probe_feed_var),
             "retract_z": safe_float_text(self.retract_var),
             "settle_time": safe_float_text(self.settle_var),
+            "retract_mode": self._retract_mode_value(self.retract_mode_var.get()),
+            "travel_clearance": safe_float_text(self.clearance_var),
             "path_order": path_order,
             "interpolation": self.interp_var.get().strip().lower(),
+            "z_tolerance": safe_float_text(self.z_tolerance_var),
+            "refine_tolerance": safe_float_text(self.refine_tolerance_var),
             "avoidance_areas": self._avoidance_snapshot(),
         }
         try:
@@ -616,7 +676,7 @@ class AutoLevelDialogController:
             max_points=max_points,
         )
         grid = build_adaptive_grid(self.base_bounds, spec, path_order=path_order)
-        grid, skipped_points = _apply_avoidance(grid, avoidance_areas)
+        grid, skipped_points = _apply_avoidance(grid, avoidance_areas, path_order=path_order)
         if grid.point_count() == 0:
             self.preview_var.set("Avoidance areas exclude all probe points.")
             self.bounds_var.set("")
@@ -628,10 +688,14 @@ class AutoLevelDialogController:
 
         self.grid_state["grid"] = grid
         self.grid_state["skipped_points"] = skipped_points
-        self.preview_var.set(
+        preview = (
             f"Grid: {len(grid.xs)} x {len(grid.ys)} ({grid.point_count()} points) "
             f"Spacing: {grid.spacing_x:.2f} x {grid.spacing_y:.2f} mm"
         )
+        estimate = self._estimate_probe_seconds(grid)
+        if estimate is not None:
+            preview += f"\nEst. probe time: {format_duration(int(estimate))} (hh:mm)"
+        self.preview_var.set(preview)
         self.bounds_var.set(
             f"Probe area: {grid.bounds.width():.2f} x {grid.bounds.height():.2f} mm "
             f"(margin {grid.margin:.2f} mm)"
@@ -641,6 +705,33 @@ class AutoLevelDialogController:
         )
         self.set_start_state()
 
+    def _probe_run_settings(self) -> ProbeRunSettings:
+        return ProbeRunSettings(
+            safe_z=parse_float_var(self.safe_z_var, "safe Z"),
+            probe_depth=parse_float_var(self.probe_depth_var, "probe depth"),
+            probe_feed=parse_float_var(self.probe_feed_var, "probe feed"),
+            retract_z=parse_float_var(self.retract_var, "retract Z"),
+            settle_time=parse_float_var(self.settle_var, "settle time"),
+            retract_mode=self._retract_mode_value(self.retract_mode_var.get()),
+            travel_clearance=max(0.0, parse_float_var(self.clearance_var, "adaptive clearance")),
+            avoidance_areas=tuple(_parse_avoidance_areas(self.avoidance_vars)),
+        )
+
+    def _estimate_probe_seconds(self, grid: ProbeGrid) -> float | None:
+        try:
+            settings = self._probe_run_settings()
+            rates, _source = get_rapid_rates_for_estimate(self.app)
+        except Exception:
+            return None
+        if not rates:
+            return None
+        return estimate_probe_time(
+            grid.points,
+            settings,
+            rapid_xy=min(rates[0], rates[1]),
+            rapid_z=rates[2],
+        )
+
     def start_probe(self) -> None:
         self.update_preview()
         try:
@@ -687,13 +778,7 @@ class AutoLevelDialogController:
             for px, py in skipped_points:
                 height_map.mark_invalid(px, py)
         try:
-            settings = ProbeRunSettings(
-                safe_z=parse_float_var(self.safe_z_var, "safe Z"),
-                probe_depth=parse_float_var(self.probe_depth_var, "probe depth"),
-                probe_feed=parse_float_var(self.probe_feed_var, "probe feed"),
-                retract_z=parse_float_var(self.retract_var, "retract Z"),
-                settle_time=parse_float_var(self.settle_var, "settle time"),
-            )
+            settings = self._probe_run_settings()
         except ValueError as exc:
             self.deps.messagebox.showwarning("Auto-Level", str(exc))
             return
@@ -702,12 +787,22 @@ class AutoLevelDialogController:
         self.status_var.set("Probing...")
         self._set_controls_enabled(False)
         self.apply_btn.config(state="disabled")
+        self.apply_live_btn.config(state="disabled")
         if self.save_map_btn is not None:
             self.save_map_btn.config(state="disabled")
 
+        refine_tolerance = self._refine_tolerance()
+        plan = None
+        if refine_tolerance > 0:
+            plan = AdaptiveProbePlan(
+                height_map,
+                tolerance=refine_tolerance,
+                coarse_stride=AUTOLEVEL_REFINE_COARSE_STRIDE,
+            )
+
         def on_progress(done: int, total: int) -> None:
             def update() -> None:
-                self.progress_bar.configure(value=done)
+                self.progress_bar.configure(maximum=max(1, total), value=done)
                 self.status_var.set(f"Probing {done}/{total}")
 
             self.app.after(0, update)
@@ -745,8 +840,13 @@ class AutoLevelDialogController:
                     except Exception:
                         pass
                     self.apply_btn.config(state="normal")
+                    self.apply_live_btn.config(state="normal")
                     if self.save_map_btn is not None:
                         self.save_map_btn.config(state="normal")
+                    self._cache_probed_map(height_map)
+                    self.cached_map = None
+                    if self.reuse_map_btn is not None:
+                        self.reuse_map_btn.config(state="disabled")
                 else:
                     message = f"Probe stopped: {reason or 'failed'}"
                     if getattr(self.app, "_pending_force_g90", False):
@@ -761,6 +861,7 @@ class AutoLevelDialogController:
             settings,
             on_progress=on_progress,
             on_done=on_done,
+            plan=plan,
         )
         if not started:
             self._set_controls_enabled(True)
@@ -798,6 +899,20 @@ class AutoLevelDialogController:
             source_name = f"{source_name[: max_len - 3]}..."
         return [f"(Auto-Level from {source_name})"]
 
+    def _refine_tolerance(self) -> float:
+        try:
+            value = float(self.refine_tolerance_var.get())
+        except (TypeError, ValueError):
+            return 0.0
+        return max(0.0, value)
+
+    def _level_z_tolerance(self) -> float:
+        try:
+            value = float(self.z_tolerance_var.get())
+        except (TypeError, ValueError):
+            return LEVEL_Z_TOLERANCE
+        return max(0.0, value)
+
     def apply_level(self) -> None:
         height_map = getattr(self.app, "_auto_level_height_map", None)
         if height_map is None or not height_map.is_complete():
@@ -822,6 +937,7 @@ class AutoLevelDialogController:
         except Exception:
             arc_step = math.pi / 18
         method = self.interp_var.get().strip().lower()
+        z_tolerance = self._level_z_tolerance()
 
         self.status_var.set("Applying height map to file...")
         self._set_controls_enabled(False)
@@ -852,6 +968,7 @@ class AutoLevelDialogController:
                 header_lines=header_lines,
                 streaming_mode=self.streaming_mode,
                 log_fn=log_fn,
+                z_tolerance=z_tolerance,
             )
 
             def on_done() -> None:
@@ -899,7 +1016,49 @@ class AutoLevelDialogController:
 
         threading.Thread(target=worker, daemon=True).start()
 
+    def apply_live_level(self) -> None:
+        """Level lines in the sender as they stream instead of writing a leveled copy."""
+        height_map = getattr(self.app, "_auto_level_height_map", None)
+        if height_map is None or not height_map.is_complete():
+            self.deps.messagebox.showwarning("Auto-Level", "Probe a complete grid before applying.")
+            return
+        path = getattr(self.app, "_last_gcode_path", None)
+        if not path:
+            self.deps.messagebox.showwarning("Auto-Level", "Load a G-code file first.")
+            return
+        if self._is_al_path(path):
+            self.deps.messagebox.showwarning(
+                "Auto-Level",
+                "Auto-Level is already applied to this file. Load the original file to re-level.",
+            )
+            return
+        line_count = getattr(self.app, "_gcode_total_lines", None) or 0
+        try:
+            arc_step = self.app.toolpath_panel.get_arc_step_rad(int(line_count or 0))
+        except Exception:
+            arc_step = math.pi / 18
+        leveler = StreamLeveler(
+            height_map,
+            arc_step_rad=arc_step,
+            interpolation=self.interp_var.get().strip().lower(),
+            z_tolerance=self._level_z_tolerance(),
+        )
+        if not self.app.grbl.set_stream_leveler(leveler):
+            self.deps.messagebox.showwarning("Auto-Level", "Stop the current job before applying Auto-Level.")
+            return
+        self.app._auto_level_live = True
+        if self.revert_btn is not None:
+            self.revert_btn.config(state="normal")
+        self.status_var.set("Height map will be applied to lines as they are streamed.")
+
     def revert_job(self) -> None:
+        if getattr(self.app, "_auto_level_live", False):
+            if not self.app.grbl.set_stream_leveler(None):
+                self.deps.messagebox.showwarning("Auto-Level", "Stop the current job before reverting.")
+                return
+            self.app._auto_level_live = False
+            self.status_var.set("Live Auto-Level disabled.")
+            return
         orig_lines = getattr(self.app, "_auto_level_original_lines", None)
         path = getattr(self.app, "_auto_level_original_path", None)
         if not orig_lines and not path:
@@ -927,6 +1086,63 @@ class AutoLevelDialogController:
             self.save_map_btn,
             self.save_btn,
         )
+        self.apply_live_btn.config(state=str(self.apply_btn.cget("state")))
+
+    def _cache_probed_map(self, height_map: HeightMap) -> None:
+        if not height_map.is_complete():
+            return
+        wco, wcs = current_offsets(self.app)
+        try:
+            store_height_map(height_map_cache_dir(), height_map, wco=wco, wcs=wcs)
+        except Exception as exc:
+            try:
+                self.app.ui_q.put(("log", f"[autolevel] Failed to cache height map: {exc}"))
+            except Exception:
+                pass
+
+    def _offer_cached_map(self) -> None:
+        """Enable Reuse Map when a recent map probed under this offset covers the job."""
+        self.cached_map = None
+        current = getattr(self.app, "_auto_level_height_map", None)
+        if current is not None and current.is_complete():
+            return
+        wco, wcs = current_offsets(self.app)
+        try:
+            record = find_reusable_map(height_map_cache_dir(), self.base_bounds, wco=wco, wcs=wcs)
+        except Exception:
+            record = None
+        if record is None:
+            return
+        self.cached_map = record
+        if self.reuse_map_btn is not None:
+            self.reuse_map_btn.config(state="normal")
+        height_map = record.height_map
+        probed_at = time.strftime("%H:%M", time.localtime(record.created))
+        self.status_var.set(
+            f"A {len(height_map.xs)} x {len(height_map.ys)} map probed at {probed_at} ({record.wcs}) "
+            "covers this job. Reuse Map skips probing."
+        )
+
+    def reuse_cached_map(self) -> None:
+        record = self.cached_map
+        if record is None:
+            return
+        install_height_map(
+            self.app,
+            record.height_map,
+            self.status_var,
+            self.stats_var,
+            self.map_summary_var,
+            self.apply_btn,
+            self.save_map_btn,
+            self.save_btn,
+        )
+        self.apply_live_btn.config(state=str(self.apply_btn.cget("state")))
+        probed_at = time.strftime("%H:%M", time.localtime(record.created))
+        self.status_var.set(f"Reusing height map probed at {probed_at}. {self.status_var.get()}")
+        self.cached_map = None
+        if self.reuse_map_btn is not None:
+            self.reuse_map_btn.config(state="disabled")
 
     def cancel_probe(self) -> None:
         if self.app.auto_level_runner.is_running():
@@ -953,13 +1169,19 @@ class AutoLevelDialogController:
             self.probe_feed_entry,
             self.retract_entry,
             self.settle_entry,
+            self.retract_mode_combo,
+            self.clearance_entry,
             self.interp_combo,
+            self.z_tolerance_entry,
+            self.refine_tolerance_entry,
             *self.avoidance_controls,
             self.start_btn,
             self.apply_btn,
+            self.apply_live_btn,
             self.save_btn,
             self.save_map_btn,
             self.load_map_btn,
+            self.reuse_map_btn,
             self.revert_btn,
         )
         for widget in widgets:
@@ -969,6 +1191,8 @@ class AutoLevelDialogController:
                 widget.config(state=state)
             except Exception:
                 pass
+        if self.reuse_map_btn is not None and self.cached_map is None:
+            self.reuse_map_btn.config(state="disabled")
         if self.close_btn is not None:
             self.close_btn.config(text="Cancel" if not enabled else "Close")
 
@@ -1101,12 +1325,28 @@ class AutoLevelDialogController:
         self.probe_feed_entry = grid_row(settings_tab, "Probe feed (mm/min)", self.probe_feed_var, 12)
         self.retract_entry = grid_row(settings_tab, "Retract Z (mm)", self.retract_var, 13)
         self.settle_entry = grid_row(settings_tab, "Settle time (sec)", self.settle_var, 14)
-        ttk.Label(settings_tab, text="Interpolation").grid(
+        ttk.Label(settings_tab, text="Retract mode").grid(
             row=15,
             column=0,
             sticky="w",
             pady=(4, 2),
         )
+        self.retract_mode_combo = ttk.Combobox(
+            settings_tab,
+            textvariable=self.retract_mode_var,
+            values=tuple(self.retract_mode_options.keys()),
+            state="readonly",
+            width=20,
+        )
+        self.retract_mode_combo.grid(row=15, column=1, sticky="w", pady=(4, 2))
+        self.retract_mode_combo.bind("<<ComboboxSelected>>", lambda _evt: self.update_preview())
+        self.clearance_entry = grid_row(settings_tab, "Adaptive clearance (mm)", self.clearance_var, 16)
+        ttk.Label(settings_tab, text="Interpolation").grid(
+            row=17,
+            column=0,
+            sticky="w",
+            pady=(4, 2),
+        )
         self.interp_combo = ttk.Combobox(
             settings_tab,
             textvariable=self.interp_var,
@@ -1114,8 +1354,15 @@ class AutoLevelDialogController:
             state="readonly",
             width=10,
         )
-        self.interp_combo.grid(row=15, column=1, sticky="w", pady=(4, 2))
+        self.interp_combo.grid(row=17, column=1, sticky="w", pady=(4, 2))
         self.interp_combo.bind("<<ComboboxSelected>>", lambda _evt: self.update_preview())
+        self.z_tolerance_entry = grid_row(settings_tab, "Level Z tolerance (mm)", self.z_tolerance_var, 18)
+        self.refine_tolerance_entry = grid_row(
+            settings_tab,
+            "Refine tolerance (mm, 0 = full grid)",
+            self.refine_tolerance_var,
+            19,
+        )
         self.avoidance_controls = build_avoidance_tab(
             avoidance_tab,
             self.avoidance_vars,
@@ -1124,26 +1371,26 @@ class AutoLevelDialogController:
         )
 
         ttk.Label(settings_tab, textvariable=self.preview_var, wraplength=460, justify="left").grid(
-            row=16,
+            row=20,
             column=0,
             columnspan=2,
             sticky="w",
             pady=(6, 0),
         )
         ttk.Label(settings_tab, textvariable=self.bounds_var, wraplength=460, justify="left").grid(
-            row=17,
+            row=21,
             column=0,
             columnspan=2,
             sticky="w",
         )
         ttk.Label(settings_tab, textvariable=self.map_summary_var, wraplength=460, justify="left").grid(
-            row=18,
+            row=22,
             column=0,
             columnspan=2,
             sticky="w",
         )
         ttk.Label(settings_tab, textvariable=self.stats_var, wraplength=460, justify="left").grid(
-            row=19,
+            row=23,
             column=0,
             columnspan=2,
             sticky="w",
@@ -1165,12 +1412,26 @@ class AutoLevelDialogController:
         self.start_btn.pack(side="left", padx=(0, 6))
         self.apply_btn = ttk.Button(btn_row, text="Apply to Job", command=self.apply_level, state="disabled")
         self.apply_btn.pack(side="left", padx=(0, 6))
+        self.apply_live_btn = ttk.Button(
+            btn_row,
+            text="Apply Live",
+            command=self.apply_live_level,
+            state="disabled",
+        )
+        self.apply_live_btn.pack(side="left", padx=(0, 6))
         self.save_btn = ttk.Button(btn_row, text="Save Leveled", command=self.save_leveled, state="disabled")
         self.save_btn.pack(side="left", padx=(0, 6))
         self.save_map_btn = ttk.Button(btn_row, text="Save Map", command=self.save_height_map, state="disabled")
         self.save_map_btn.pack(side="left", padx=(0, 6))
         self.load_map_btn = ttk.Button(btn_row, text="Load Map", command=self.load_height_map)
         self.load_map_btn.pack(side="left", padx=(0, 6))
+        self.reuse_map_btn = ttk.Button(
+            btn_row,
+            text="Reuse Map",
+            command=self.reuse_cached_map,
+            state="disabled",
+        )
+        self.reuse_map_btn.pack(side="left", padx=(0, 6))
         self.revert_btn = ttk.Button(btn_row, text="Revert Job", command=self.revert_job, state="disabled")
         self.revert_btn.pack(side="left", padx=(0, 6))
         self.close_btn = ttk.Button(btn_row, text="Close", command=self.cancel_probe)
@@ -1188,6 +1449,9 @@ class AutoLevelDialogController:
             self.probe_feed_entry,
             self.retract_entry,
             self.settle_entry,
+            self.clearance_entry,
+            self.z_tolerance_entry,
+            self.refine_tolerance_entry,
         ):
             entry.bind("<KeyRelease>", lambda _evt: self.update_preview())
 
@@ -1196,9 +1460,14 @@ class AutoLevelDialogController:
             try:
                 if self.app._auto_level_height_map.is_complete():
                     self.apply_btn.config(state="normal")
+                    self.apply_live_btn.config(state="normal")
             except Exception:
                 pass
-        if (isinstance(self.original_lines, list) and self.original_lines) or self.original_path:
+        if (
+            (isinstance(self.original_lines, list) and self.original_lines)
+            or self.original_path
+            or getattr(self.app, "_auto_level_live", False)
+        ):
             self.revert_btn.config(state="normal")
         if isinstance(getattr(self.app, "_auto_level_leveled_lines", None), list) or getattr(
             self.app, "_auto_level_leveled_path", None
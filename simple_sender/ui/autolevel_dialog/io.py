@@ -26,9 +26,37 @@ import shutil
 from tkinter import filedialog, messagebox
 
 from simple_sender.autolevel.height_map import HeightMap
+from simple_sender.autolevel.map_cache import (
+    HEIGHT_MAP_EXT,
+    is_binary_height_map,
+    read_height_map,
+    write_height_map,
+)
+from simple_sender.utils.config import get_settings_path
+from simple_sender.utils.constants import AUTOLEVEL_MAP_CACHE_DIRNAME
 from .helpers import update_stats_summary
 
 
+def height_map_cache_dir() -> str:
+    return os.path.join(os.path.dirname(get_settings_path()), AUTOLEVEL_MAP_CACHE_DIRNAME)
+
+
+def current_offsets(app) -> tuple[tuple[float, float, float] | None, str]:
+    """Return the last reported WCO and the active WCS (G54 when unknown)."""
+    wco = getattr(app, "_wco_raw", None)
+    try:
+        wco_vals = (float(wco[0]), float(wco[1]), float(wco[2])) if wco and len(wco) >= 3 else None
+    except (TypeError, ValueError):
+        wco_vals = None
+    wcs = ""
+    try:
+        with app.macro_executor.macro_vars() as macro_vars:
+            wcs = str(macro_vars.get("WCS") or "")
+    except Exception:
+        wcs = ""
+    return wco_vals, (wcs.strip().upper() or "G54")
+
+
 def save_leveled(app, status_var) -> None:
     leveled = getattr(app, "_auto_level_leveled_lines", None)
     leveled_path = getattr(app, "_auto_level_leveled_path", None)
@@ -87,13 +115,21 @@ def save_height_map(app, status_var) -> None:
         initialdir=initial_dir or None,
         initialfile=default_name,
         defaultextension=".json",
-        filetypes=[("Height map", "*.json"), ("All files", "*.*")],
+        filetypes=[
+            ("Height map", "*.json"),
+            ("Height map (binary)", f"*{HEIGHT_MAP_EXT}"),
+            ("All files", "*.*"),
+        ],
     )
     if not save_path:
         return
     try:
-        with open(save_path, "w", encoding="utf-8") as f:
-            json.dump(height_map.to_dict(), f, indent=2, ensure_ascii=True)
+        if save_path.lower().endswith(HEIGHT_MAP_EXT):
+            wco, wcs = current_offsets(app)
+            write_height_map(save_path, height_map, wco=wco, wcs=wcs)
+        else:
+            with open(save_path, "w", encoding="utf-8") as f:
+                json.dump(height_map.to_dict(), f, indent=2, ensure_ascii=True)
     except Exception as exc:
         messagebox.showerror("Save height map", str(exc))
         return
@@ -117,17 +153,47 @@ def load_height_map(
     load_path = filedialog.askopenfilename(
         title="Load height map",
         initialdir=initial_dir or None,
-        filetypes=[("Height map", "*.json"), ("All files", "*.*")],
+        filetypes=[("Height map", f"*.json *{HEIGHT_MAP_EXT}"), ("All files", "*.*")],
     )
     if not load_path:
         return
     try:
-        with open(load_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        height_map = HeightMap.from_dict(data)
+        if is_binary_height_map(load_path):
+            height_map = read_height_map(load_path).height_map
+        else:
+            with open(load_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            height_map = HeightMap.from_dict(data)
     except Exception as exc:
         messagebox.showerror("Load height map", str(exc))
         return
+    install_height_map(
+        app,
+        height_map,
+        status_var,
+        stats_var,
+        map_summary_var,
+        apply_btn,
+        save_map_btn,
+        save_btn,
+    )
+    try:
+        app.settings["last_gcode_dir"] = os.path.dirname(load_path)
+    except Exception:
+        pass
+
+
+def install_height_map(
+    app,
+    height_map: HeightMap,
+    status_var,
+    stats_var,
+    map_summary_var,
+    apply_btn,
+    save_map_btn,
+    save_btn,
+) -> None:
+    """Make a loaded or cached map the active auto-level map."""
     app._auto_level_height_map = height_map
     app._auto_level_grid = None
     app._auto_level_bounds = None
@@ -163,7 +229,3 @@ def load_height_map(
         f"Loaded map: {len(height_map.xs)} x {len(height_map.ys)} "
         f"({len(height_map.xs) * len(height_map.ys)} points)"
     )
-    try:
-        app.settings["last_gcode_dir"] = os.path.dirname(load_path)
-    except Exception:
-        pass
@@ -30,6 +30,7 @@ from typing import Any, cast
 
 from simple_sender.autolevel.height_map import HeightMap
 from simple_sender.autolevel.leveler import (
+    LEVEL_Z_TOLERANCE,
     LevelFileResult,
     LevelResult,
     level_gcode_file,
@@ -55,12 +56,14 @@ def _level_from_source_lines(
     level_gcode_lines_fn: Callable[..., LevelResult],
     write_gcode_lines_fn: Callable[..., LevelFileResult],
     split_gcode_lines_fn: Callable[..., GcodeSplitResult],
+    z_tolerance: float = LEVEL_Z_TOLERANCE,
 ) -> LevelFileResult:
     level_result = level_gcode_lines_fn(
         source_lines,
         height_map,
         arc_step_rad=arc_step_rad,
         interpolation=interpolation,
+        z_tolerance=z_tolerance,
     )
     if level_result.error:
         return LevelFileResult(None, 0, level_result.error, False)
@@ -92,6 +95,7 @@ def _level_and_write_auto_level_output(
     header_lines: list[str] | None,
     streaming_mode: bool,
     log_fn: Callable[[str], None] | None = None,
+    z_tolerance: float = LEVEL_Z_TOLERANCE,
     level_gcode_lines_fn: Callable[..., LevelResult] = level_gcode_lines,
     level_gcode_file_fn: Callable[..., LevelFileResult] = level_gcode_file,
     write_gcode_lines_fn: Callable[..., LevelFileResult] = write_gcode_lines,
@@ -115,6 +119,7 @@ def _level_and_write_auto_level_output(
             level_gcode_lines_fn=level_gcode_lines_fn,
             write_gcode_lines_fn=write_gcode_lines_fn,
             split_gcode_lines_fn=split_gcode_lines_fn,
+            z_tolerance=z_tolerance,
         )
 
     result = level_gcode_file_fn(
@@ -124,6 +129,7 @@ def _level_and_write_auto_level_output(
         arc_step_rad=arc_step_rad,
         interpolation=interpolation,
         header_lines=header_lines,
+        z_tolerance=z_tolerance,
     )
     if result.error:
         return result
@@ -291,6 +297,7 @@ def _apply_auto_level_to_path(
     header_lines: list[str] | None,
     streaming_mode: bool,
     log_fn: Callable[[str], None] | None = None,
+    z_tolerance: float = LEVEL_Z_TOLERANCE,
     level_gcode_lines_fn: Callable[..., LevelResult] = level_gcode_lines,
     level_gcode_file_fn: Callable[..., LevelFileResult] = level_gcode_file,
     write_gcode_lines_fn: Callable[..., LevelFileResult] = write_gcode_lines,
@@ -309,6 +316,7 @@ def _apply_auto_level_to_path(
         header_lines=header_lines,
         streaming_mode=streaming_mode,
         log_fn=log_fn,
+        z_tolerance=z_tolerance,
         level_gcode_lines_fn=level_gcode_lines_fn,
         level_gcode_file_fn=level_gcode_file_fn,
         write_gcode_lines_fn=write_gcode_lines_fn,
@@ -331,6 +339,7 @@ def _apply_auto_level_to_path(
             header_lines=header_lines,
             streaming_mode=streaming_mode,
             log_fn=log_fn,
+            z_tolerance=z_tolerance,
             level_gcode_lines_fn=level_gcode_lines_fn,
             level_gcode_file_fn=level_gcode_file_fn,
             write_gcode_lines_fn=write_gcode_lines_fn,
@@ -20,6 +20,7 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import importlib.util
 import logging
 import time
 from tkinter import messagebox
@@ -74,15 +75,28 @@ logger = logging.getLogger(__name__)
 
 PYGAME_IMPORT_ERROR = ""
 pygame: ModuleType | None = None
-PYGAME_AVAILABLE = False
+# Only look pygame up here; importing it initializes SDL and is deferred to
+# the first `get_pygame_module()` call so it does not slow down startup.
 try:
-    import pygame as _pygame_module
-except ImportError as exc:
-    pygame = None
+    PYGAME_AVAILABLE = importlib.util.find_spec("pygame") is not None
+except (ImportError, ValueError) as exc:
+    PYGAME_AVAILABLE = False
     PYGAME_IMPORT_ERROR = str(exc)
-else:
-    pygame = _pygame_module
-    PYGAME_AVAILABLE = True
+if not PYGAME_AVAILABLE and not PYGAME_IMPORT_ERROR:
+    PYGAME_IMPORT_ERROR = "No module named 'pygame'"
+
+
+def _load_pygame() -> ModuleType | None:
+    global pygame, PYGAME_IMPORT_ERROR
+    if pygame is None and not PYGAME_IMPORT_ERROR:
+        try:
+            import pygame as _pygame_module
+        except ImportError as exc:
+            PYGAME_IMPORT_ERROR = str(exc)
+            logger.warning(f"pygame import failed: {exc}")
+        else:
+            pygame = _pygame_module
+    return pygame
 
 def toggle_keyboard_bindings(app):
     current = bool(app.keyboard_bindings_enabled.get())
@@ -147,9 +161,6 @@ def update_joystick_polling_state(app):
 def restore_joystick_bindings_on_start(app):
     if not getattr(app, "_joystick_auto_enable_requested", False):
         return
-    if not hasattr(app, "btn_toggle_joystick_bindings"):
-        app.after(100, app._restore_joystick_bindings_on_start)
-        return
     app._joystick_auto_enable_requested = False
     if not app.joystick_bindings_enabled.get():
         return
@@ -157,9 +168,9 @@ def restore_joystick_bindings_on_start(app):
     app._update_joystick_polling_state()
 
 def get_pygame_module(app) -> ModuleType | None:
-    if not PYGAME_AVAILABLE or pygame is None:
+    if not PYGAME_AVAILABLE:
         return None
-    return pygame
+    return _load_pygame()
 
 def discover_joysticks(app, py, count: int) -> list[str]:
     names: list[str] = []
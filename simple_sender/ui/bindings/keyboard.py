@@ -96,14 +96,23 @@ def apply_keyboard_bindings(app):
     app.bind_all("<KeyRelease>", app._on_key_modifier_release, add="+")
 
 def refresh_keyboard_table(app):
-    if not hasattr(app, "kb_table"):
-        return
-    app.kb_table.delete(*app.kb_table.get_children())
-    app.kb_table.tag_configure("conflict", background="#f7d6d6")
+    # The joystick map is rebuilt even when the App Settings tab (and its
+    # table) has not been built yet, since joystick events resolve through it.
+    table = getattr(app, "kb_table", None)
+    if table is not None:
+        table.delete(*table.get_children())
+        table.tag_configure("conflict", background="#f7d6d6")
     app._kb_item_to_button = {}
     app._joystick_binding_map.clear()
     for btn in app._collect_buttons():
         binding_id = app._button_binding_id(btn)
+        binding = app._joystick_bindings.get(binding_id)
+        if binding:
+            tuple_key = app._joystick_binding_key(binding)
+            if tuple_key:
+                app._joystick_binding_map[tuple_key] = btn
+        if table is None:
+            continue
         label = app._button_label(btn)
         tip = getattr(btn, "_tooltip_text", "")
         if tip:
@@ -113,16 +122,12 @@ def refresh_keyboard_table(app):
         if not key:
             key = "None"
         joystick_label = "None"
-        binding = app._joystick_bindings.get(binding_id)
         if binding:
             display = app._joystick_binding_display(binding)
             if display:
                 joystick_label = display
-            tuple_key = app._joystick_binding_key(binding)
-            if tuple_key:
-                app._joystick_binding_map[tuple_key] = btn
         tags = ("conflict",) if binding_id in app._kb_conflicts else ()
-        item = app.kb_table.insert(
+        item = table.insert(
             "",
             "end",
             values=(label, axis, key, joystick_label, f"{CLEAR_ICON}  Remove/Clear Binding"),
@@ -89,6 +89,11 @@ def build_checklists_tab(app, notebook: ttk.Notebook) -> ttk.Frame:
     tab = ttk.Frame(notebook, padding=8)
     notebook.add(tab, text="Checklists")
     set_tab_tooltip(notebook, tab, "Run setup and safety checklists.")
+    populate_checklists_tab(app, tab)
+    return tab
+
+
+def populate_checklists_tab(app, tab: ttk.Frame) -> None:
     tab.grid_columnconfigure(0, weight=1)
     tab.grid_rowconfigure(0, weight=1)
     canvas = tk.Canvas(tab, highlightthickness=0)
@@ -137,4 +142,3 @@ def build_checklists_tab(app, notebook: ttk.Notebook) -> ttk.Frame:
     row = build_diagnostics_section(app, inner, row)
     row = build_safety_section(app, inner, row)
     build_safety_aids_section(app, inner, row)
-    return tab
@@ -58,7 +58,7 @@ def _safe_bundle_name(name: str) -> str:
 
 def export_backup_bundle(app: Any) -> None:
     try:
-        app._save_settings()
+        app._save_settings(immediate=True)
     except Exception:
         pass
     path = run_file_dialog(
@@ -127,6 +127,13 @@ def import_backup_bundle(app: Any) -> None:
     imported_settings = False
     imported_macros = 0
     macro_files_in_bundle = 0
+    store = getattr(app, "_settings_store", None)
+    if store is not None:
+        # A queued background save must not land on top of the imported file.
+        try:
+            store.flush()
+        except Exception:
+            pass
 
     try:
         with zipfile.ZipFile(path, "r") as archive:
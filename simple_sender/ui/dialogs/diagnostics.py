@@ -28,6 +28,13 @@ from tkinter import ttk, filedialog, messagebox
 from typing import Any, cast
 
 from simple_sender.ui.checklist_files import find_named_checklist, load_checklist_items
+from simple_sender.macro_profiler import format_macro_profiles
+from simple_sender.metrics import METRICS
+from simple_sender.profiler_capture import ProfileCapture, SamplingProfiler
+from simple_sender.stall_watchdog import format_stall_records
+from simple_sender.stream_telemetry import format_telemetry_snapshot
+from simple_sender.utils.constants import PROFILE_CAPTURE_DEFAULT_SECONDS
+from simple_sender.utils.logging_config import get_log_drop_counts
 from .popup_utils import center_window
 
 CHECKLIST_ITEMS = [
@@ -408,6 +415,55 @@ def export_session_diagnostics(app) -> None:
             stamp = datetime.fromtimestamp(ts).isoformat(timespec="seconds")
             lines.append(f"{stamp} {raw.strip()}")
         lines.append("")
+    telemetry = None
+    try:
+        telemetry = app.grbl.telemetry_snapshot()
+    except Exception:
+        telemetry = None
+    if telemetry:
+        lines.append("Stream telemetry (recent samples):")
+        lines.extend(format_telemetry_snapshot(telemetry))
+        lines.append("")
+    macro_profiles = []
+    try:
+        macro_profiles = app.macro_executor.macro_profiles()
+    except Exception:
+        macro_profiles = []
+    if macro_profiles:
+        lines.append("Macro profiles (recent runs, slowest lines):")
+        lines.extend(format_macro_profiles(macro_profiles))
+        lines.append("")
+    timeline = getattr(app, "startup_timeline", None)
+    if timeline is not None and timeline.finished:
+        lines.append("Startup timeline:")
+        lines.extend(timeline.report_lines())
+        lines.append("")
+    watchdog = getattr(app, "stall_watchdog", None)
+    stalls = watchdog.recent_stalls() if watchdog is not None else []
+    if stalls:
+        lines.append("Main-loop stalls (recent, newest first):")
+        lines.extend(format_stall_records(stalls))
+        lines.append("")
+    metrics_text = ""
+    try:
+        metrics_text = METRICS.exposition()
+    except Exception:
+        metrics_text = ""
+    if metrics_text:
+        lines.append("Metrics (Prometheus text format):")
+        lines.append(metrics_text.rstrip("\n"))
+        lines.append("")
+    capture = getattr(app, "_profile_capture", None)
+    if capture is not None:
+        lines.append("Profile capture (sampled, all threads):")
+        lines.extend(capture.report_lines())
+        lines.append("")
+    log_drops = get_log_drop_counts()
+    if log_drops:
+        lines.append("Dropped log records (writer queue full):")
+        for name, count in sorted(log_drops.items()):
+            lines.append(f"- {name or 'unnamed'}: {count}")
+        lines.append("")
     console_lines = []
     try:
         console_lines = app.streaming_controller.get_console_lines()
@@ -433,6 +489,52 @@ def export_session_diagnostics(app) -> None:
     try:
         with open(path, "w", encoding="utf-8", newline="\n") as outfile:
             outfile.write("\n".join(lines))
-        messagebox.showinfo("Export diagnostics", f"Saved to:\n{path}")
+        saved = path
+        if capture is not None:
+            prof_path = os.path.splitext(path)[0] + ".prof"
+            capture.dump_stats(prof_path)
+            saved = f"{path}\n{prof_path}"
+        messagebox.showinfo("Export diagnostics", f"Saved to:\n{saved}")
     except Exception as exc:
         messagebox.showerror("Export diagnostics", f"Failed to write diagnostics:\n{exc}")
+
+
+def start_profile_capture(app) -> None:
+    running = getattr(app, "_profile_capture_running", None)
+    if running is not None and running.running:
+        messagebox.showinfo("Profile capture", "A profile capture is already running.")
+        return
+    try:
+        seconds = float(app.profile_capture_seconds.get())
+    except Exception:
+        seconds = float(PROFILE_CAPTURE_DEFAULT_SECONDS)
+    profiler = SamplingProfiler(seconds)
+    app._profile_capture_running = profiler
+    status = getattr(app, "profile_capture_status", None)
+    if status is not None:
+        status.set(f"Capturing for {profiler.seconds:g} s...")
+    button = getattr(app, "btn_profile_capture", None)
+    if button is not None:
+        button.configure(state="disabled")
+    app.ui_q.put(("log", f"[profile] Sampling all threads for {profiler.seconds:g} s"))
+
+    def on_done(capture: ProfileCapture) -> None:
+        app._post_ui_thread(_finish_profile_capture, app, capture)
+
+    profiler.start(on_done)
+
+
+def _finish_profile_capture(app, capture: ProfileCapture) -> None:
+    app._profile_capture = capture
+    app._profile_capture_running = None
+    summary = capture.summary()
+    status = getattr(app, "profile_capture_status", None)
+    if status is not None:
+        status.set(f"Captured {summary}")
+    button = getattr(app, "btn_profile_capture", None)
+    if button is not None:
+        try:
+            button.configure(state="normal")
+        except tk.TclError:
+            pass
+    app.ui_q.put(("log", f"[profile] Captured {summary}; included in the next diagnostics export"))
@@ -99,8 +99,8 @@ def handle_gcode_load_error(app, idx, name, message):
     return _router.handle_gcode_load_error(app, idx, name, message)
 
 
-def handle_status_event(app, raw):
-    return _status.handle_status_event(app, raw)
+def handle_status_event(app, raw, report=None):
+    return _status.handle_status_event(app, raw, report)
 
 
 def handle_stream_state_event(app, evt):
@@ -37,7 +37,7 @@ from simple_sender.ui.job_controls import job_controls_ready, set_run_resume_fro
 from simple_sender.ui.dialogs.error_dialogs_ui import show_grbl_code_popup
 from simple_sender.utils.constants import MAX_LINE_LENGTH
 from simple_sender.utils.grbl_errors import annotate_grbl_alarm, annotate_grbl_error
-from simple_sender.types import UiEvent
+from simple_sender.types import GrblStatusReport, UiEvent
 
 logger = logging.getLogger(__name__)
 
@@ -232,6 +232,9 @@ def handle_event(app: Any, evt: UiEvent):
             except Exception as exc:
                 _log_suppressed("Failed showing GRBL alarm popup", exc)
             return
+        case ("status", line, report):
+            handle_status_event(app, cast(str, line), cast(GrblStatusReport, report))
+            return
         case ("status", line):
             handle_status_event(app, cast(str, line))
             return
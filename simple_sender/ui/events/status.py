@@ -22,9 +22,10 @@
 
 import time
 import logging
-from dataclasses import dataclass
-from typing import cast
+from typing import Any, cast
 
+from simple_sender.grbl_worker_status import parse_status_report
+from simple_sender.types import GrblStatusReport
 from simple_sender.ui.dro import convert_units, format_dro_value
 from simple_sender.ui.job_controls import job_controls_ready, set_run_resume_from
 
@@ -160,51 +161,6 @@ def _parse_report_units_setting(app, raw: str) -> None:
         _log_suppressed("Failed refreshing DRO display after $13 update", exc)
 
 
-@dataclass(slots=True)
-class _StatusFields:
-    state: str
-    wpos: str | None = None
-    mpos: str | None = None
-    feed: float | None = None
-    spindle: float | None = None
-    planner: int | None = None
-    rxbytes: int | None = None
-    wco: str | None = None
-    ov: str | None = None
-    pins: str | None = None
-
-
-def _parse_status_fields(raw: str) -> _StatusFields:
-    parts = raw.strip("<>").split("|")
-    fields = _StatusFields(state=parts[0] if parts else "?")
-    for part in parts:
-        if part.startswith("WPos:"):
-            fields.wpos = part[5:]
-        elif part.startswith("MPos:"):
-            fields.mpos = part[5:]
-        elif part.startswith("FS:"):
-            try:
-                feed_str, spindle_str = part[3:].split(",", 1)
-                fields.feed = float(feed_str)
-                fields.spindle = float(spindle_str)
-            except Exception as exc:
-                _log_suppressed("Failed parsing FS field from status line", exc)
-        elif part.startswith("Bf:"):
-            try:
-                planner_str, rx_str = part[3:].split(",", 1)
-                fields.planner = int(planner_str)
-                fields.rxbytes = int(rx_str)
-            except Exception as exc:
-                _log_suppressed("Failed parsing Bf field from status line", exc)
-        elif part.startswith("WCO:"):
-            fields.wco = part[4:]
-        elif part.startswith("Ov:"):
-            fields.ov = part[3:]
-        elif part.startswith("Pn:"):
-            fields.pins = part[3:]
-    return fields
-
-
 def _resolve_display_state(app, state: str) -> str:
     state_lower = state.lower()
     display_state = "Homing" if state_lower.startswith("home") else state
@@ -276,9 +232,6 @@ def _apply_machine_state(app, state: str, display_state: str) -> bool:
     ):
         app._set_manual_controls_enabled(True)
         set_run_resume_from(app, job_controls_ready(app))
-    with app.macro_executor.macro_vars() as macro_vars:
-        macro_vars["state"] = state
-        macro_vars["_status_seq"] = int(macro_vars.get("_status_seq", 0) or 0) + 1
     return True
 
 
@@ -350,17 +303,6 @@ def _sync_deferred_stream_completion(app, state: str) -> None:
         pass
 
 
-def _parse_xyz_triplet(text: str) -> list[float] | None:
-    parts = text.split(",")
-    if len(parts) < 3:
-        return None
-    try:
-        return [float(parts[0]), float(parts[1]), float(parts[2])]
-    except Exception as exc:
-        _log_suppressed("Failed parsing XYZ triplet", exc)
-        return None
-
-
 def _flash_wpos_labels(app) -> None:
     labels = getattr(app, "_wpos_value_labels", None)
     if not labels:
@@ -408,16 +350,16 @@ def _flash_wpos_labels(app) -> None:
             _log_suppressed("Failed scheduling WPos flash restore timer", exc)
 
 
-def _update_positions_and_macro_state(app, fields: _StatusFields) -> None:
-    wco_vals = _parse_xyz_triplet(fields.wco) if fields.wco else None
-    mpos_vals = _parse_xyz_triplet(fields.mpos) if fields.mpos else None
-    wpos_vals = _parse_xyz_triplet(fields.wpos) if fields.wpos else None
+def _update_positions_and_macro_state(app, report: GrblStatusReport) -> None:
+    wco_vals = report.wco
+    mpos_vals = report.mpos
+    wpos_vals = report.wpos
     if wco_vals:
-        app._wco_raw = tuple(wco_vals)
+        app._wco_raw = wco_vals
     else:
         cached_wco = getattr(app, "_wco_raw", None)
         if cached_wco and len(cached_wco) >= 3:
-            wco_vals = [cached_wco[0], cached_wco[1], cached_wco[2]]
+            wco_vals = (cached_wco[0], cached_wco[1], cached_wco[2])
 
     report_units = getattr(app, "_report_units", None) or app.unit_mode.get()
     modal_units = app.unit_mode.get()
@@ -428,31 +370,33 @@ def _update_positions_and_macro_state(app, fields: _StatusFields) -> None:
     def to_modal(value: float) -> float:
         return cast(float, convert_units(value, report_units, modal_units))
 
+    # Collected here and published under a single macro_vars lock below.
+    updates: dict[str, Any] = {"state": report.state}
+
     wpos_calc = None
     mpos_calc = None
     if mpos_vals and wpos_vals is None and wco_vals:
-        wpos_calc = [
+        wpos_calc = (
             mpos_vals[0] - wco_vals[0],
             mpos_vals[1] - wco_vals[1],
             mpos_vals[2] - wco_vals[2],
-        ]
+        )
     elif wpos_vals and mpos_vals is None and wco_vals:
-        mpos_calc = [
+        mpos_calc = (
             wpos_vals[0] + wco_vals[0],
             wpos_vals[1] + wco_vals[1],
             wpos_vals[2] + wco_vals[2],
-        ]
+        )
 
     if mpos_vals:
         try:
-            app._mpos_raw = tuple(mpos_vals)
+            app._mpos_raw = mpos_vals
             app.mpos_x.set(format_dro_value(mpos_vals[0], report_units, modal_units))
             app.mpos_y.set(format_dro_value(mpos_vals[1], report_units, modal_units))
             app.mpos_z.set(format_dro_value(mpos_vals[2], report_units, modal_units))
-            with app.macro_executor.macro_vars() as macro_vars:
-                macro_vars["mx"] = to_modal(mpos_vals[0])
-                macro_vars["my"] = to_modal(mpos_vals[1])
-                macro_vars["mz"] = to_modal(mpos_vals[2])
+            updates["mx"] = to_modal(mpos_vals[0])
+            updates["my"] = to_modal(mpos_vals[1])
+            updates["mz"] = to_modal(mpos_vals[2])
         except Exception as exc:
             _log_suppressed("Failed updating machine-position DRO values", exc)
     elif mpos_calc:
@@ -460,23 +404,21 @@ def _update_positions_and_macro_state(app, fields: _StatusFields) -> None:
             app.mpos_x.set(format_dro_value(mpos_calc[0], report_units, modal_units))
             app.mpos_y.set(format_dro_value(mpos_calc[1], report_units, modal_units))
             app.mpos_z.set(format_dro_value(mpos_calc[2], report_units, modal_units))
-            with app.macro_executor.macro_vars() as macro_vars:
-                macro_vars["mx"] = to_modal(mpos_calc[0])
-                macro_vars["my"] = to_modal(mpos_calc[1])
-                macro_vars["mz"] = to_modal(mpos_calc[2])
+            updates["mx"] = to_modal(mpos_calc[0])
+            updates["my"] = to_modal(mpos_calc[1])
+            updates["mz"] = to_modal(mpos_calc[2])
         except Exception as exc:
             _log_suppressed("Failed updating computed machine-position DRO values", exc)
 
     if wpos_vals:
         try:
-            app._wpos_raw = tuple(wpos_vals)
+            app._wpos_raw = wpos_vals
             app.wpos_x.set(format_dro_value(wpos_vals[0], report_units, modal_units))
             app.wpos_y.set(format_dro_value(wpos_vals[1], report_units, modal_units))
             app.wpos_z.set(format_dro_value(wpos_vals[2], report_units, modal_units))
-            with app.macro_executor.macro_vars() as macro_vars:
-                macro_vars["wx"] = to_modal(wpos_vals[0])
-                macro_vars["wy"] = to_modal(wpos_vals[1])
-                macro_vars["wz"] = to_modal(wpos_vals[2])
+            updates["wx"] = to_modal(wpos_vals[0])
+            updates["wy"] = to_modal(wpos_vals[1])
+            updates["wz"] = to_modal(wpos_vals[2])
             try:
                 app.toolpath_panel.set_position(
                     to_mm(wpos_vals[0]),
@@ -490,14 +432,13 @@ def _update_positions_and_macro_state(app, fields: _StatusFields) -> None:
         _flash_wpos_labels(app)
     elif wpos_calc:
         try:
-            app._wpos_raw = tuple(wpos_calc)
+            app._wpos_raw = wpos_calc
             app.wpos_x.set(format_dro_value(wpos_calc[0], report_units, modal_units))
             app.wpos_y.set(format_dro_value(wpos_calc[1], report_units, modal_units))
             app.wpos_z.set(format_dro_value(wpos_calc[2], report_units, modal_units))
-            with app.macro_executor.macro_vars() as macro_vars:
-                macro_vars["wx"] = to_modal(wpos_calc[0])
-                macro_vars["wy"] = to_modal(wpos_calc[1])
-                macro_vars["wz"] = to_modal(wpos_calc[2])
+            updates["wx"] = to_modal(wpos_calc[0])
+            updates["wy"] = to_modal(wpos_calc[1])
+            updates["wz"] = to_modal(wpos_calc[2])
             try:
                 app.toolpath_panel.set_position(
                     to_mm(wpos_calc[0]),
@@ -509,17 +450,13 @@ def _update_positions_and_macro_state(app, fields: _StatusFields) -> None:
         except Exception as exc:
             _log_suppressed("Failed updating computed WPos DRO values", exc)
 
-    if fields.feed is not None:
-        with app.macro_executor.macro_vars() as macro_vars:
-            macro_vars["curfeed"] = fields.feed
-    if fields.spindle is not None:
-        with app.macro_executor.macro_vars() as macro_vars:
-            macro_vars["curspindle"] = fields.spindle
-    if fields.planner is not None:
+    if report.feed is not None:
+        updates["curfeed"] = report.feed
+    if report.spindle is not None:
+        updates["curspindle"] = report.spindle
+    if report.planner is not None:
         try:
-            planner_available = int(fields.planner)
-            if planner_available < 0:
-                planner_available = 0
+            planner_available = max(0, int(report.planner))
             planner_capacity = int(getattr(app, "_planner_blocks_capacity", 15) or 15)
             if planner_capacity <= 0:
                 planner_capacity = 15
@@ -529,53 +466,44 @@ def _update_positions_and_macro_state(app, fields: _StatusFields) -> None:
             app._planner_blocks_available = min(planner_available, planner_capacity)
         except Exception as exc:
             _log_suppressed("Failed tracking planner availability from status line", exc)
-        with app.macro_executor.macro_vars() as macro_vars:
-            macro_vars["planner"] = fields.planner
-    if fields.rxbytes is not None:
-        with app.macro_executor.macro_vars() as macro_vars:
-            macro_vars["rxbytes"] = fields.rxbytes
+        updates["planner"] = report.planner
+    if report.rx_free is not None:
+        updates["rxbytes"] = report.rx_free
     if wco_vals:
-        with app.macro_executor.macro_vars() as macro_vars:
-            macro_vars["wcox"] = to_modal(wco_vals[0])
-            macro_vars["wcoy"] = to_modal(wco_vals[1])
-            macro_vars["wcoz"] = to_modal(wco_vals[2])
-    if fields.pins is not None:
-        with app.macro_executor.macro_vars() as macro_vars:
-            macro_vars["pins"] = fields.pins
-    if fields.ov:
-        feed_val = spindle_val = None
-        try:
-            ov_parts = [int(float(v)) for v in fields.ov.split(",")]
-            if len(ov_parts) >= 3:
-                feed_val, spindle_val = ov_parts[0], ov_parts[2]
-                with app.macro_executor.macro_vars() as macro_vars:
-                    changed = (
-                        macro_vars.get("OvFeed") != ov_parts[0]
-                        or macro_vars.get("OvRapid") != ov_parts[1]
-                        or macro_vars.get("OvSpindle") != ov_parts[2]
-                    )
-                    macro_vars["OvFeed"] = ov_parts[0]
-                    macro_vars["OvRapid"] = ov_parts[1]
-                    macro_vars["OvSpindle"] = ov_parts[2]
-                    macro_vars["_OvChanged"] = bool(changed)
-        except Exception as exc:
-            _log_suppressed("Failed parsing override values from status line", exc)
-        else:
-            if feed_val is not None:
-                app._set_feed_override_slider_value(feed_val)
-            if spindle_val is not None:
-                app._set_spindle_override_slider_value(spindle_val)
-            app._refresh_override_info()
-    pin_state = {char for char in (fields.pins or "").upper() if char.isalpha()}
-    endstop_active = bool(pin_state & {"X", "Y", "Z"})
+        updates["wcox"] = to_modal(wco_vals[0])
+        updates["wcoy"] = to_modal(wco_vals[1])
+        updates["wcoz"] = to_modal(wco_vals[2])
+    if report.pins is not None:
+        updates["pins"] = report.pins
+    ov = report.ov
+    if ov is not None:
+        updates["OvFeed"] = ov[0]
+        updates["OvRapid"] = ov[1]
+        updates["OvSpindle"] = ov[2]
+
     with app.macro_executor.macro_vars() as macro_vars:
+        if ov is not None:
+            updates["_OvChanged"] = (
+                macro_vars.get("OvFeed") != ov[0]
+                or macro_vars.get("OvRapid") != ov[1]
+                or macro_vars.get("OvSpindle") != ov[2]
+            )
+        macro_vars.update(updates)
+        macro_vars["_status_seq"] = int(macro_vars.get("_status_seq", 0) or 0) + 1
         prb_value = macro_vars.get("PRB")
+
+    if ov is not None:
+        app._set_feed_override_slider_value(ov[0])
+        app._set_spindle_override_slider_value(ov[2])
+        app._refresh_override_info()
+    pin_state = {char for char in (report.pins or "").upper() if char.isalpha()}
+    endstop_active = bool(pin_state & {"X", "Y", "Z"})
     probe_active = bool(pin_state & {"P"}) or bool(prb_value)
-    hold_active = bool(pin_state & {"H"}) or "hold" in fields.state.lower()
+    hold_active = bool(pin_state & {"H"}) or "hold" in report.state.lower()
     app._update_led_panel(endstop_active, probe_active, hold_active)
 
 
-def handle_status_event(app, raw: str):
+def handle_status_event(app, raw: str, report: GrblStatusReport | None = None):
     app._last_status_raw = raw
     app._last_status_ts = time.time()
     history = getattr(app, "_status_history", None)
@@ -585,13 +513,13 @@ def handle_status_event(app, raw: str):
     history.append((app._last_status_ts, raw))
     if len(history) > 200:
         del history[:-200]
-    fields = _parse_status_fields(raw)
+    if report is None:
+        report = parse_status_report(raw)
+    app._last_status_report = report
     app._status_seen = True
-    app._last_status_pins = fields.pins
-    display_state = _resolve_display_state(app, fields.state)
-    if not _apply_machine_state(app, fields.state, display_state):
+    app._last_status_pins = report.pins
+    display_state = _resolve_display_state(app, report.state)
+    if not _apply_machine_state(app, report.state, display_state):
         return
-    _update_positions_and_macro_state(app, fields)
-    _sync_deferred_stream_completion(app, fields.state)
-
-
+    _update_positions_and_macro_state(app, report)
+    _sync_deferred_stream_completion(app, report.state)
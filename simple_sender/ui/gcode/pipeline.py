@@ -209,6 +209,12 @@ def _reset_autolevel_state(app) -> None:
     app._auto_level_leveled_path = None
     app._auto_level_leveled_temp = False
     app._auto_level_leveled_name = None
+    if getattr(app, "_auto_level_live", False):
+        try:
+            app.grbl.set_stream_leveler(None)
+        except Exception as exc:
+            _log_suppressed("Failed clearing stream-time auto-level", exc)
+        app._auto_level_live = False
     try:
         app.toolpath_panel.set_autolevel_overlay(None)
     except Exception:
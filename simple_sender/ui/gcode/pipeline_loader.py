@@ -21,9 +21,24 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 
+import time
 from dataclasses import dataclass
 from typing import IO, Protocol, cast
 
+from simple_sender.metrics import LOAD_SECONDS_EDGES, METRICS
+
+_LOAD_SECONDS = {
+    mode: METRICS.histogram(
+        "gcode_load_seconds",
+        LOAD_SECONDS_EDGES,
+        "Background G-code read/clean/validate time",
+        mode=mode,
+    )
+    for mode in ("memory", "stream")
+}
+_LOAD_ERRORS = METRICS.counter("gcode_load_errors_total", "G-code loads that failed")
+_LOAD_BYTES = METRICS.counter("gcode_load_bytes_total", "Bytes of G-code files loaded")
+
 
 def _format_mb(value: int | None) -> str:
     if value is None:
@@ -490,6 +505,7 @@ def load_gcode_from_path(app, path: str, module):
     streaming_line_threshold = raw_line_threshold if raw_line_threshold > 0 else None
 
     def worker():
+        start = time.perf_counter()
         try:
             if use_streaming:
                 size_text = _format_mb(file_size)
@@ -506,17 +522,22 @@ def load_gcode_from_path(app, path: str, module):
                         "using streaming mode."
                     ),
                 )
-                return
-            _load_non_streaming_or_fallback_stream(
-                app,
-                path,
-                token,
-                deps,
-                file_size=file_size,
-                streaming_line_threshold=streaming_line_threshold,
-                validate_streaming=validate_streaming,
-            )
+            else:
+                _load_non_streaming_or_fallback_stream(
+                    app,
+                    path,
+                    token,
+                    deps,
+                    file_size=file_size,
+                    streaming_line_threshold=streaming_line_threshold,
+                    validate_streaming=validate_streaming,
+                )
         except Exception as exc:
+            _LOAD_ERRORS.inc()
             app.ui_q.put(("gcode_load_error", token, path, str(exc)))
+            return
+        _LOAD_SECONDS["stream" if use_streaming else "memory"].observe(time.perf_counter() - start)
+        if file_size:
+            _LOAD_BYTES.inc(file_size)
 
     deps.threading.Thread(target=worker, daemon=True).start()
@@ -22,10 +22,12 @@
 
 import logging
 import time
+from typing import Any, Callable
+
 from tkinter import ttk
 
-from simple_sender.ui.settings import build_app_settings_tab
-from simple_sender.ui.checklists_tab import build_checklists_tab
+from simple_sender.ui.settings import populate_app_settings_tab
+from simple_sender.ui.checklists_tab import populate_checklists_tab
 from simple_sender.ui.console import build_console_tab
 from simple_sender.ui.log_viewer import LogViewer
 from simple_sender.ui.viewer.gcode_viewer import GcodeViewer
@@ -34,6 +36,98 @@ from simple_sender.ui.widgets import set_tab_tooltip
 
 logger = logging.getLogger(__name__)
 
+TabBuilder = Callable[[Any, ttk.Frame], None]
+
+
+class DeferredTabs:
+    """Notebook tabs whose widgets are built the first time they are shown.
+
+    `add()` inserts an empty frame so the tab strip is complete at startup;
+    `ensure_built()` runs the registered builder into that frame once.
+    """
+
+    def __init__(self, app, notebook: ttk.Notebook):
+        self.app = app
+        self.notebook = notebook
+        self._pending: dict[str, tuple[ttk.Frame, TabBuilder]] = {}
+
+    def add(self, label: str, builder: TabBuilder, *, tooltip: str = "", padding: int = 6) -> ttk.Frame:
+        tab = ttk.Frame(self.notebook, padding=padding)
+        self.notebook.add(tab, text=label)
+        set_tab_tooltip(self.notebook, tab, tooltip)
+        self._pending[label] = (tab, builder)
+        return tab
+
+    def pending(self) -> list[str]:
+        return list(self._pending)
+
+    def is_pending(self, label: str) -> bool:
+        return label in self._pending
+
+    def ensure_built(self, label: str, *, refresh: bool = True) -> bool:
+        """Build `label` if it is still pending; return True when it was built now."""
+        entry = self._pending.pop(label, None)
+        if entry is None:
+            return False
+        tab, builder = entry
+        start = time.perf_counter()
+        try:
+            builder(self.app, tab)
+        except Exception as exc:
+            logger.exception("Failed to build %s tab: %s", label, exc)
+            return False
+        logger.debug(f"Built {label} tab in {(time.perf_counter() - start) * 1000.0:.1f} ms")
+        if refresh:
+            refresh_after_deferred_build(self.app)
+        return True
+
+    def build_all(self) -> None:
+        built = False
+        for label in self.pending():
+            built = self.ensure_built(label, refresh=False) or built
+        if built:
+            refresh_after_deferred_build(self.app)
+
+
+def refresh_after_deferred_build(app) -> None:
+    """Bring widgets created by a deferred tab in line with current app state."""
+    try:
+        app._ensure_tooltips()
+        app._refresh_tooltips_toggle_text()
+        app._refresh_render_3d_toggle_text()
+        app._refresh_keybindings_toggle_text()
+        app._refresh_joystick_toggle_text()
+        # New buttons can carry key/joystick bindings and fill the bindings table.
+        app._apply_keyboard_bindings()
+    except Exception as exc:
+        logger.exception("Failed to refresh deferred tab widgets: %s", exc)
+
+
+def ensure_tab_built(app, label: str) -> bool:
+    tabs = getattr(app, "deferred_tabs", None)
+    if tabs is None:
+        return False
+    return tabs.ensure_built(label)
+
+
+def build_bound_deferred_tabs(app) -> None:
+    """Build pending tabs now if a saved binding targets a button not built yet.
+
+    Key and joystick bindings resolve against existing buttons, so bindings
+    saved for buttons inside a deferred tab would otherwise do nothing until
+    that tab was first opened.
+    """
+    tabs = getattr(app, "deferred_tabs", None)
+    if tabs is None or not tabs.pending():
+        return
+    saved = {binding_id for binding_id, label in app._key_bindings.items() if str(label).strip()}
+    saved.update(app._joystick_bindings)
+    if not saved:
+        return
+    known = {app._button_binding_id(btn) for btn in app._collect_buttons()}
+    if saved - known:
+        tabs.build_all()
+
 
 def update_tab_visibility(app, nb=None):
     if nb is None:
@@ -46,6 +140,7 @@ def update_tab_visibility(app, nb=None):
     except Exception as exc:
         logger.exception("Failed to update tab visibility: %s", exc)
         return
+    ensure_tab_built(app, label)
     app.toolpath_panel.set_visible(label == "3D View")
     app.toolpath_panel.set_top_view_visible(label == "Top View")
     try:
@@ -90,12 +185,20 @@ def build_gcode_tab(app, notebook):
     app.gview.pack(fill="both", expand=True)
 
 
+def _build_logs_tab(app, tab: ttk.Frame) -> None:
+    app.logs_viewer = LogViewer(tab, app)
+    app.logs_viewer.pack(fill="both", expand=True)
+
+
 def build_main_tabs(app, parent):
     # Bottom notebook: G-code + Console + Settings + Checklists
     nb = ttk.Notebook(parent)
     app.notebook = nb
     nb.pack(side="top", fill="both", expand=True, pady=(10, 0))
     nb.bind("<<NotebookTabChanged>>", app._on_tab_changed)
+    # Tabs that only read app state are built on first view; tabs that
+    # receive live machine/stream updates are built up front.
+    app.deferred_tabs = tabs = DeferredTabs(app, nb)
 
     # Gcode tab
     build_gcode_tab(app, nb)
@@ -104,11 +207,7 @@ def build_main_tabs(app, parent):
     build_console_tab(app, nb)
 
     # Logs tab
-    ltab = ttk.Frame(nb, padding=6)
-    nb.add(ltab, text="Logs")
-    set_tab_tooltip(nb, ltab, "Review streaming and UI log output.")
-    app.logs_viewer = LogViewer(ltab, app)
-    app.logs_viewer.pack(fill="both", expand=True)
+    tabs.add("Logs", _build_logs_tab, tooltip="Review streaming and UI log output.")
 
     otab = ttk.Frame(nb, padding=6)
     nb.add(otab, text="Overdrive")
@@ -117,12 +216,21 @@ def build_main_tabs(app, parent):
     app.settings_controller.build_tabs(nb)
 
     # App Settings tab
-    build_app_settings_tab(app, nb)
+    tabs.add(
+        "App Settings",
+        populate_app_settings_tab,
+        tooltip="Configure app preferences, UI, and safety settings.",
+        padding=8,
+    )
 
     # Checklists tab
-    build_checklists_tab(app, nb)
+    tabs.add(
+        "Checklists",
+        populate_checklists_tab,
+        tooltip="Run setup and safety checklists.",
+        padding=8,
+    )
 
     # 3D tab
     app.toolpath_panel.build_tab(nb)
     app._update_tab_visibility(nb)
-
@@ -22,7 +22,7 @@
 
 """Settings UI package exports."""
 
-from .dialog import build_app_settings_tab
+from .dialog import build_app_settings_tab, populate_app_settings_tab
 from .scroll import (
     bind_app_settings_mousewheel,
     bind_app_settings_touch_scroll,
@@ -55,6 +55,7 @@ from .sections import (
 
 __all__ = [
     "build_app_settings_tab",
+    "populate_app_settings_tab",
     "bind_app_settings_mousewheel",
     "bind_app_settings_touch_scroll",
     "on_app_settings_mousewheel",
@@ -49,6 +49,11 @@ def build_app_settings_tab(app, notebook):
     sstab = ttk.Frame(nb, padding=8)
     nb.add(sstab, text="App Settings")
     set_tab_tooltip(nb, sstab, "Configure app preferences, UI, and safety settings.")
+    populate_app_settings_tab(app, sstab)
+    return sstab
+
+
+def populate_app_settings_tab(app, sstab):
     sstab.grid_columnconfigure(0, weight=1)
     sstab.grid_rowconfigure(0, weight=1)
     app.app_settings_canvas = tk.Canvas(sstab, highlightthickness=0)
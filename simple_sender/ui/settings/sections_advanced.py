@@ -29,7 +29,6 @@ from simple_sender.utils.constants import (
     TOOLPATH_STREAMING_RENDER_INTERVAL_MAX,
     TOOLPATH_STREAMING_RENDER_INTERVAL_MIN,
 )
-from simple_sender.ui.autolevel_dialog.prefs import pref_dict, pref_float, pref_interp
 from simple_sender.ui.widgets import apply_tooltip, attach_numeric_keypad, set_kb_id
 
 def build_safety_aids_section(app, parent: ttk.Frame, row: int) -> int:
@@ -335,6 +334,10 @@ def build_interface_section(app, parent: ttk.Frame, row: int) -> int:
 
 
 def build_auto_level_section(app, parent: ttk.Frame, row: int) -> int:
+    # Imported here: the autolevel dialog package (and the leveler it pulls in)
+    # is otherwise only needed once the operator opens the dialog.
+    from simple_sender.ui.autolevel_dialog.prefs import pref_dict, pref_float, pref_interp
+
     auto_level_frame = ttk.LabelFrame(parent, text="Auto-Level", padding=8)
     auto_level_frame.grid(row=row, column=0, sticky="ew", pady=(8, 0))
     auto_level_frame.grid_columnconfigure(1, weight=1)
@@ -105,7 +105,18 @@ def build_macros_section(app, parent: ttk.Frame, row: int) -> int:
         text="Open Macro Manager",
         command=app._open_macro_manager,
     )
-    app.btn_open_macro_manager.grid(row=5, column=0, sticky="w", pady=(6, 2))
+    app.macro_profiling_check = ttk.Checkbutton(
+        macro_frame,
+        text="Profile macro runs",
+        variable=app.macro_profiling,
+    )
+    app.macro_profiling_check.grid(row=5, column=0, columnspan=3, sticky="w", pady=4)
+    apply_tooltip(
+        app.macro_profiling_check,
+        "Record per-line send, wait-for-ok, wait-for-idle, and expression time for each macro run. "
+        "The most recent runs are included in Export diagnostics.",
+    )
+    app.btn_open_macro_manager.grid(row=6, column=0, sticky="w", pady=(6, 2))
     apply_tooltip(
         app.btn_open_macro_manager,
         "Edit, duplicate, and reorder Macro-1..Macro-8 from inside the app.",
@@ -116,7 +127,7 @@ def build_macros_section(app, parent: ttk.Frame, row: int) -> int:
         text="Warning: enabled macros can execute arbitrary Python; disable for plain G-code macros.",
         wraplength=560,
         justify="left",
-    ).grid(row=6, column=0, columnspan=3, sticky="w", pady=(2, 0))
+    ).grid(row=7, column=0, columnspan=3, sticky="w", pady=(2, 0))
     return row + 1
 
 
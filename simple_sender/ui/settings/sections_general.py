@@ -25,7 +25,7 @@ import sys
 import tkinter as tk
 from tkinter import messagebox, ttk
 
-from simple_sender.utils.constants import ALL_STOP_CHOICES
+from simple_sender.utils.constants import ALL_STOP_CHOICES, PROFILE_CAPTURE_DEFAULT_SECONDS, PROFILE_CAPTURE_MAX_SECONDS
 from simple_sender.ui.widgets import apply_tooltip, attach_numeric_keypad
 
 def build_diagnostics_section(app, parent: ttk.Frame, row: int) -> int:
@@ -56,7 +56,7 @@ def build_diagnostics_section(app, parent: ttk.Frame, row: int) -> int:
     app.btn_export_diagnostics.grid(row=1, column=1, sticky="w", pady=4)
     apply_tooltip(
         app.btn_export_diagnostics,
-        "Save recent console/status history and settings to a text file.",
+        "Save recent console/status history, settings, metrics, and any profile capture to a text file.",
     )
     ttk.Label(diagnostics_frame, text="Backup bundle").grid(
         row=2, column=0, sticky="w", padx=(0, 10), pady=4
@@ -83,25 +83,55 @@ def build_diagnostics_section(app, parent: ttk.Frame, row: int) -> int:
         app.btn_import_backup_bundle,
         "Import settings and macro assets from a previously exported bundle.",
     )
+    ttk.Label(diagnostics_frame, text="Profile capture").grid(
+        row=3, column=0, sticky="w", padx=(0, 10), pady=4
+    )
+    if not hasattr(app, "profile_capture_seconds"):
+        app.profile_capture_seconds = tk.IntVar(master=parent, value=PROFILE_CAPTURE_DEFAULT_SECONDS)
+    if not hasattr(app, "profile_capture_status"):
+        app.profile_capture_status = tk.StringVar(master=parent, value="")
+    profile_row = ttk.Frame(diagnostics_frame)
+    profile_row.grid(row=3, column=1, sticky="w", pady=4)
+    app.profile_capture_seconds_spin = ttk.Spinbox(
+        profile_row,
+        from_=1,
+        to=PROFILE_CAPTURE_MAX_SECONDS,
+        increment=5,
+        textvariable=app.profile_capture_seconds,
+        width=5,
+    )
+    app.profile_capture_seconds_spin.pack(side="left")
+    ttk.Label(profile_row, text="s").pack(side="left", padx=(4, 0))
+    app.btn_profile_capture = ttk.Button(
+        profile_row,
+        text="Capture",
+        command=app._start_profile_capture,
+    )
+    app.btn_profile_capture.pack(side="left", padx=(8, 0))
+    ttk.Label(profile_row, textvariable=app.profile_capture_status).pack(side="left", padx=(8, 0))
+    apply_tooltip(
+        app.btn_profile_capture,
+        "Sample all threads for the given seconds (e.g. during a job); the profile is added to the next diagnostics export.",
+    )
     app.validate_streaming_check = ttk.Checkbutton(
         diagnostics_frame,
         text="Validate streaming (large) G-code files",
         variable=app.validate_streaming_gcode,
     )
-    app.validate_streaming_check.grid(row=3, column=0, columnspan=2, sticky="w", pady=(6, 0))
+    app.validate_streaming_check.grid(row=4, column=0, columnspan=2, sticky="w", pady=(6, 0))
     apply_tooltip(
         app.validate_streaming_check,
         "Validate large files while loading; adds an extra scan but improves preflight checks.",
     )
     ttk.Label(diagnostics_frame, text="Streaming line threshold").grid(
-        row=4, column=0, sticky="w", padx=(0, 10), pady=(6, 0)
+        row=5, column=0, sticky="w", padx=(0, 10), pady=(6, 0)
     )
     app.streaming_line_threshold_entry = ttk.Entry(
         diagnostics_frame,
         textvariable=app.streaming_line_threshold,
         width=10,
     )
-    app.streaming_line_threshold_entry.grid(row=4, column=1, sticky="w", pady=(6, 0))
+    app.streaming_line_threshold_entry.grid(row=5, column=1, sticky="w", pady=(6, 0))
     attach_numeric_keypad(app.streaming_line_threshold_entry, allow_decimal=False)
     apply_tooltip(
         app.streaming_line_threshold_entry,
@@ -605,7 +635,7 @@ def build_power_section(app, parent: ttk.Frame, row: int) -> int:
         if not confirm:
             return
         try:
-            app._save_settings()
+            app._save_settings(immediate=True)
         except Exception:
             pass
         try:
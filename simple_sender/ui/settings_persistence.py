@@ -25,7 +25,7 @@ import os
 from typing import cast
 from simple_sender.utils.config import DEFAULT_SETTINGS
 from simple_sender.utils.constants import STATUS_POLL_DEFAULT
-from simple_sender.utils.exceptions import SettingsLoadError, SettingsSaveError
+from simple_sender.utils.exceptions import SettingsLoadError
 
 logger = logging.getLogger(__name__)
 
@@ -306,6 +306,7 @@ def _build_macro_and_autolevel_settings(
         "macros_allow_python": bool(app.macros_allow_python.get()),
         "macro_line_timeout_sec": macro_line_timeout_value,
         "macro_total_timeout_sec": macro_total_timeout_value,
+        "macro_profiling": bool(app.macro_profiling.get()),
         "macro_probe_z_location": macro_probe_z_value,
         "macro_probe_safety_margin": macro_probe_margin_value,
         "zeroing_persistent": bool(app.zeroing_persistent.get()),
@@ -315,7 +316,13 @@ def _build_macro_and_autolevel_settings(
     }
 
 
-def save_settings(app):
+def save_settings(app, *, immediate: bool = False):
+    """Collect the current settings and persist them.
+
+    By default the write is queued on the settings store's background writer
+    so bursts of changes cost one write; `immediate=True` writes (and flushes
+    anything queued) before returning, for shutdown and file exports.
+    """
     show_rapid, show_feed, show_arc = app.toolpath_panel.get_display_options()
     draw_percent = app.toolpath_panel.get_draw_percent()
     performance = app._clamp_toolpath_performance(app.toolpath_performance.get())
@@ -442,18 +449,27 @@ def save_settings(app):
         )
     )
     app.settings = data
-    app._settings_store.data = app.settings
+    store = app._settings_store
+    store.data = app.settings
+    if store.on_save_error is None:
+        store.on_save_error = lambda exc: _report_save_failure(app, exc)
     try:
-        app._settings_store.save()
-    except SettingsSaveError as exc:
-        try:
-            app.ui_q.put(("log", f"[settings] Save failed: {exc}"))
-            app.status.config(text="Settings save failed")
-        except Exception:
-            pass
+        if immediate:
+            # flush() also waits for a write the background writer already
+            # took, so nothing is still in flight when this returns.
+            store.flush()
+            if store.dirty_keys():
+                store.save()
+        else:
+            store.save_async()
     except Exception as exc:
-        try:
-            app.ui_q.put(("log", f"[settings] Save failed: {exc}"))
-            app.status.config(text="Settings save failed")
-        except Exception:
-            pass
+        _report_save_failure(app, exc)
+
+
+def _report_save_failure(app, exc: Exception) -> None:
+    # May run on the settings writer thread: only go through the UI queue.
+    try:
+        app.ui_q.put(("log", f"[settings] Save failed: {exc}"))
+        app.ui_q.put(("ui_post", app.status.config, (), {"text": "Settings save failed"}))
+    except Exception:
+        pass
@@ -22,10 +22,19 @@
 """Toolpath panel exports."""
 
 import time
+from typing import Any
 
 from . import toolpath_settings
-from .toolpath_3d import Toolpath3D
 from .toolpath_panel import ToolpathPanel
 from .toolpath_top_view import TopViewPanel
 
 __all__ = ["ToolpathPanel", "Toolpath3D", "TopViewPanel", "toolpath_settings", "time"]
+
+
+def __getattr__(name: str) -> Any:
+    # Toolpath3D is imported on first access so startup skips the 3D modules.
+    if name == "Toolpath3D":
+        from .toolpath_3d import Toolpath3D
+
+        return Toolpath3D
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -26,11 +26,14 @@ import time
 from typing import Any, Callable, Sequence, cast
 
 from . import toolpath_3d_render
+from simple_sender.metrics import METRICS
 from simple_sender.utils.constants import (
     TOOLPATH_CANVAS_MARGIN,
     VIEW_3D_POSITION_MARKER_RADIUS,
 )
 
+_RENDER_MS = METRICS.histogram("toolpath_render_ms", help="Toolpath canvas redraw time", view="3d")
+
 
 class Toolpath3DRenderMixin:
     canvas: Any
@@ -143,6 +146,10 @@ class Toolpath3DRenderMixin:
         self._render_pending = False
         if not self._visible:
             return
+        with _RENDER_MS.time():
+            self._render_frame()
+
+    def _render_frame(self):
         self._last_render_ts = time.time()
         w = self.canvas.winfo_width()
         h = self.canvas.winfo_height()
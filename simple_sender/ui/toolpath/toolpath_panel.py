@@ -21,20 +21,28 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 """Toolpath panel coordinator for top and 3D views."""
 
+from __future__ import annotations
+
 import math
 from tkinter import ttk
-from typing import Any, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Optional
 
-from simple_sender.autolevel.grid import ProbeGrid
-from .toolpath_3d import Toolpath3D
 from .toolpath_top_view import TopViewPanel
 from simple_sender.ui.widgets import set_tab_tooltip
 from simple_sender.utils.constants import (
     VIEW_3D_ARC_STEP_DEFAULT,
+    VIEW_3D_ARC_STEP_FAST,
+    VIEW_3D_ARC_STEP_FAST_THRESHOLD,
+    VIEW_3D_ARC_STEP_LARGE,
     VIEW_3D_DRAW_PERCENT_DEFAULT,
+    VIEW_3D_FULL_PARSE_LIMIT,
     VIEW_3D_PERF_LOG_THRESHOLD,
 )
 
+if TYPE_CHECKING:
+    from simple_sender.autolevel.grid import ProbeGrid
+    from .toolpath_3d import Toolpath3D
+
 
 class ToolpathPanel:
     def __init__(self, app: Any) -> None:
@@ -50,6 +58,8 @@ class ToolpathPanel:
         self._pending_top_parsed: tuple[Any, str | None] | None = None
         self._pending_top_overlay: ProbeGrid | None = None
         self._pending_view_overlay: ProbeGrid | None = None
+        self._pending_job_name: str | None = None
+        self._pending_position: tuple[float, float, float] | None = None
 
     def build_tab(self, notebook: ttk.Notebook):
         top_tab = ttk.Frame(notebook, padding=6)
@@ -65,8 +75,30 @@ class ToolpathPanel:
         notebook.add(tab, text="3D View")
         set_tab_tooltip(notebook, tab, "Interactive 3D toolpath preview and render controls.")
         self.tab = tab
+        if self._pending_top_parsed is not None and self.top_view:
+            result, lines_hash = self._pending_top_parsed
+            self._pending_top_parsed = None
+            self._pending_top_request = None
+            self.top_view.apply_parsed_gcode(result.segments, result.bounds, lines_hash=lines_hash)
+        if self._pending_top_request is not None and self.top_view and getattr(self.top_view, "_visible", True):
+            pending_lines, max_segments, arc_step_rad = self._pending_top_request
+            self._pending_top_request = None
+            self.top_view.set_lines(pending_lines, max_segments=max_segments, arc_step_rad=arc_step_rad)
+
+    def ensure_view(self) -> None:
+        """Build the 3D view the first time its tab is shown.
+
+        Until then the panel buffers what the view needs (parsed G-code,
+        job name, overlay, position); settings are read from the app when
+        the view is configured.
+        """
+        if self.view is not None or self.tab is None:
+            return
+        # The 3D renderer modules load with the view instead of at startup.
+        from .toolpath_3d import Toolpath3D
+
         self.view = Toolpath3D(
-            tab,
+            self.tab,
             on_save_view=self.app._save_3d_view,
             on_load_view=self.app._load_3d_view,
             perf_callback=self._toolpath_perf_logger,
@@ -90,15 +122,12 @@ class ToolpathPanel:
         if self._pending_view_overlay is not None and self.view:
             self.view.set_autolevel_grid(self._pending_view_overlay)
             self._pending_view_overlay = None
-        if self._pending_top_parsed is not None and self.top_view:
-            result, lines_hash = self._pending_top_parsed
-            self._pending_top_parsed = None
-            self._pending_top_request = None
-            self.top_view.apply_parsed_gcode(result.segments, result.bounds, lines_hash=lines_hash)
-        if self._pending_top_request is not None and self.top_view and getattr(self.top_view, "_visible", True):
-            pending_lines, max_segments, arc_step_rad = self._pending_top_request
-            self._pending_top_request = None
-            self.top_view.set_lines(pending_lines, max_segments=max_segments, arc_step_rad=arc_step_rad)
+        if self._pending_job_name is not None:
+            self.view.set_job_name(self._pending_job_name)
+            self._pending_job_name = None
+        if self._pending_position is not None:
+            self.view.set_position(*self._pending_position)
+            self._pending_position = None
 
     def set_autolevel_overlay(self, grid: ProbeGrid | None):
         if self.top_view:
@@ -149,6 +178,17 @@ class ToolpathPanel:
     def get_arc_step_rad(self, line_count: int) -> float:
         if self.view:
             return float(self.view.select_arc_step_rad(line_count))
+        # Same choice the view makes, so parses before it is built match.
+        try:
+            override = math.radians(float(self.app.toolpath_arc_detail.get()))
+        except Exception:
+            override = 0.0
+        if override > 0:
+            return override
+        if line_count > VIEW_3D_FULL_PARSE_LIMIT:
+            return float(VIEW_3D_ARC_STEP_LARGE)
+        if line_count > VIEW_3D_ARC_STEP_FAST_THRESHOLD:
+            return float(VIEW_3D_ARC_STEP_FAST)
         return float(VIEW_3D_ARC_STEP_DEFAULT)
 
     def apply_parse_result(self, lines: list[str], result, lines_hash: str | None = None):
@@ -201,16 +241,22 @@ class ToolpathPanel:
         if self.view:
             self.view.set_gcode_async([])
             self.view.set_job_name("")
+        else:
+            self._pending_job_name = ""
         if self.top_view:
             self.top_view.clear()
 
     def set_job_name(self, name: str):
         if self.view:
             self.view.set_job_name(name)
+        else:
+            self._pending_job_name = name
         if self.top_view:
             self.top_view.set_job_name(name)
 
     def set_visible(self, visible: bool):
+        if visible:
+            self.ensure_view()
         if self.view:
             self.view.set_visible(visible)
         # Keep the top view hidden only when its tab is not selected.
@@ -261,10 +307,16 @@ class ToolpathPanel:
     def reparse_lines(self, lines: list[str], lines_hash: str | None = None):
         if self.view:
             self.view.set_gcode_async(lines, lines_hash=lines_hash)
+        else:
+            self._pending_parsed = None
+            self._pending_gcode_lines = lines
+            self._pending_gcode_hash = lines_hash
 
     def set_position(self, x: float, y: float, z: float):
         if self.view:
             self.view.set_position(x, y, z)
+        else:
+            self._pending_position = (x, y, z)
         if self.top_view:
             self.top_view.set_position(x, y, z)
 
@@ -285,4 +337,8 @@ class ToolpathPanel:
     def get_display_options(self):
         if self.view:
             return self.view.get_display_options()
-        return (False, False, False)
+        return (
+            bool(self.app.settings.get("toolpath_show_rapid", False)),
+            bool(self.app.settings.get("toolpath_show_feed", True)),
+            bool(self.app.settings.get("toolpath_show_arc", False)),
+        )
@@ -28,6 +28,7 @@ from typing import Any, Iterable, Sequence
 
 from simple_sender.autolevel.grid import ProbeGrid
 from simple_sender.gcode_parser import parse_gcode_lines
+from simple_sender.metrics import METRICS
 from simple_sender.ui.widgets import _resolve_widget_bg
 from simple_sender.utils.constants import (
     TOOLPATH_CANVAS_MARGIN,
@@ -39,6 +40,8 @@ from simple_sender.utils.constants import (
     VIEW_3D_POSITION_MARKER_RADIUS,
 )
 
+_RENDER_MS = METRICS.histogram("toolpath_render_ms", help="Toolpath canvas redraw time", view="top")
+
 _TOOLPATH_SEGMENT_COLORS = {
     "rapid": "#8a8a8a",
     "feed": "#2c6dd2",
@@ -199,6 +202,10 @@ class TopViewPanel(ttk.Frame):
         self._render_pending = False
         if not self.winfo_exists():
             return
+        with _RENDER_MS.time():
+            self._render_frame()
+
+    def _render_frame(self) -> None:
         w = self.canvas.winfo_width()
         h = self.canvas.winfo_height()
         if w <= 1 or h <= 1:
@@ -25,6 +25,7 @@ import threading
 import time
 from collections import OrderedDict, deque
 
+from simple_sender.metrics import METRICS
 from simple_sender.utils.constants import (
     UI_EVENT_QUEUE_MAXSIZE,
     UI_EVENT_QUEUE_DROP_NOTICE_INTERVAL,
@@ -33,6 +34,15 @@ from simple_sender.types import AppProtocol, UiEvent
 
 UI_QUEUE_DRAIN_INTERVAL_MS = 50
 
+_COALESCED = METRICS.counter("ui_events_coalesced_total", "UI events replaced by a newer event of the same kind")
+_QUEUE_DEPTH = METRICS.gauge("ui_queue_depth", "UI events waiting at the start of the last drain")
+_DRAIN_MS = METRICS.histogram("ui_drain_ms", help="Time spent handling one batch of UI events")
+_DRAIN_EVENTS = METRICS.histogram(
+    "ui_drain_events",
+    (0, 1, 5, 10, 25, 50, 100),
+    "UI events handled per drain",
+)
+
 
 class UiEventQueue:
     _LOW_PRIORITY_KINDS = {"log_rx", "log_tx"}
@@ -71,6 +81,7 @@ class UiEventQueue:
             if kind in self._COALESCE_KINDS:
                 if kind in self._coalesced:
                     self._coalesced.move_to_end(kind)
+                    _COALESCED.inc()
                 self._coalesced[kind] = item
                 return
             if len(self._low) >= self._maxsize:
@@ -115,6 +126,7 @@ class UiEventQueue:
 
     def _record_drop(self, kind: str) -> None:
         self._drop_counts[kind] = self._drop_counts.get(kind, 0) + 1
+        METRICS.counter("ui_events_dropped_total", "Low-priority UI events dropped on overflow", kind=kind).inc()
 
     def _is_high_priority(self, item: UiEvent, kind: str) -> bool:
         if kind in self._COALESCE_KINDS:
@@ -144,15 +156,25 @@ class UiEventQueue:
 
 
 def drain_ui_queue(app: AppProtocol) -> None:
+    try:
+        _QUEUE_DEPTH.set(app.ui_q.qsize())
+    except Exception:
+        pass
+    start = time.perf_counter()
+    handled = 0
     for _ in range(100):
         try:
             evt = app.ui_q.get_nowait()
         except queue.Empty:
             break
+        handled += 1
         try:
             app._handle_evt(evt)
         except Exception as exc:
             app._log_exception("UI event error", exc)
+    if handled:
+        _DRAIN_MS.observe((time.perf_counter() - start) * 1000.0)
+    _DRAIN_EVENTS.observe(handled)
     if hasattr(app.ui_q, "pop_drop_summary"):
         try:
             summary = app.ui_q.pop_drop_summary()
@@ -33,13 +33,17 @@ import sys
 import shutil
 import logging
 import tempfile
-from typing import Dict, Any, Optional
+import threading
+import time
+from typing import Callable, Dict, Any, Optional, Set
 from pathlib import Path
 
 from .constants import (
     GCODE_STREAMING_LINE_THRESHOLD,
     SETTINGS_FILENAME,
     SETTINGS_BACKUP_SUFFIX,
+    SETTINGS_SAVE_DEBOUNCE,
+    SETTINGS_SAVE_MAX_DELAY,
     SETTINGS_TEMP_SUFFIX,
     WATCHDOG_HOMING_TIMEOUT,
 )
@@ -109,6 +113,7 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
     "macros_allow_python": False,
     "macro_line_timeout_sec": 0.0,
     "macro_total_timeout_sec": 0.0,
+    "macro_profiling": False,
     "macro_probe_z_location": -5.0,
     "macro_probe_safety_margin": 3.0,
     "max_recent_files": 10,
@@ -172,8 +177,12 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
         "probe_feed": 100.0,
         "retract_z": 2.0,
         "settle_time": 0.0,
+        "retract_mode": "fixed",
+        "travel_clearance": 1.0,
         "path_order": "serpentine",
         "interpolation": "bicubic",
+        "z_tolerance": 0.005,
+        "refine_tolerance": 0.0,
         "avoidance_areas": [
             {"enabled": False, "x": 0.0, "y": 0.0, "radius": 20.0, "note": ""},
             {"enabled": False, "x": 0.0, "y": 0.0, "radius": 20.0, "note": ""},
@@ -278,12 +287,17 @@ class Settings:
     
     Handles loading, saving, and accessing application settings with
     atomic file operations and automatic backup.
+
+    `save()` writes on the calling thread. `save_async()` only queues a
+    snapshot of the changed settings; a background writer coalesces bursts
+    of requests into one write, and `flush()` forces the queued write out.
     
     Example:
         settings = Settings()
         settings.load()
         settings.set("last_port", "COM3")
-        settings.save()
+        settings.save_async()
+        settings.flush()
     """
     
     def __init__(self, filepath: Optional[str] = None):
@@ -294,6 +308,17 @@ class Settings:
         """
         self.filepath = filepath or get_settings_path()
         self.data: Dict[str, Any] = self._get_defaults()
+        self.on_save_error: Optional[Callable[[Exception], None]] = None
+        self.last_save_error: Optional[Exception] = None
+        # Last snapshot queued or written; dirty keys are computed against it.
+        self._saved: Dict[str, Any] = {}
+        self._dirty: Set[str] = set()
+        self._write_lock = threading.Lock()
+        self._pending_cond = threading.Condition()
+        self._pending: Optional[Dict[str, Any]] = None
+        self._pending_first = 0.0
+        self._pending_due = 0.0
+        self._writer: Optional[threading.Thread] = None
         logger.info(f"Settings file: {self.filepath}")
     
     def _get_defaults(self) -> Dict[str, Any]:
@@ -324,6 +349,8 @@ class Settings:
             # Merge with defaults (in case new settings were added)
             defaults = self._get_defaults()
             self.data = _deep_merge_defaults(defaults, loaded_data)
+            self._saved = copy.deepcopy(self.data)
+            self._dirty.clear()
             
             logger.info("Settings loaded successfully")
             return True
@@ -340,14 +367,125 @@ class Settings:
             logger.error(f"Unexpected error loading settings: {e}")
             raise SettingsLoadError(f"Unexpected error: {e}")
     
+    def dirty_keys(self) -> Set[str]:
+        """Top-level keys that differ from the last saved snapshot.
+
+        Returns:
+            Keys changed via `set()` or by editing `data` directly; every key
+            when the settings file does not exist yet
+        """
+        if not os.path.exists(self.filepath):
+            return set(self.data) | set(self._saved)
+        missing = object()
+        dirty = set(self._dirty)
+        for key in set(self.data) | set(self._saved):
+            if self.data.get(key, missing) != self._saved.get(key, missing):
+                dirty.add(key)
+        return dirty
+
     def save(self) -> None:
-        """Save settings to file atomically.
+        """Save settings to file atomically on the calling thread.
         
-        Uses atomic file write with backup to prevent data loss.
+        Any save queued by `save_async()` is superseded by this write.
         
         Raises:
             SettingsSaveError: If save fails
         """
+        snapshot = copy.deepcopy(self.data)
+        self._saved = snapshot
+        self._dirty.clear()
+        with self._write_lock:
+            with self._pending_cond:
+                self._pending = None
+            self._write(snapshot)
+
+    def save_async(self, delay: float = SETTINGS_SAVE_DEBOUNCE) -> bool:
+        """Queue a background save of the current settings.
+
+        The snapshot is taken now; the write happens once no new request has
+        arrived for `delay` seconds, or at most `SETTINGS_SAVE_MAX_DELAY`
+        after the first queued request.
+
+        Args:
+            delay: Debounce interval in seconds
+
+        Returns:
+            True if a save was queued, False when nothing changed
+        """
+        dirty = self.dirty_keys()
+        if not dirty:
+            return False
+        snapshot = copy.deepcopy(self.data)
+        self._saved = snapshot
+        self._dirty.clear()
+        now = time.monotonic()
+        with self._pending_cond:
+            if self._pending is None:
+                self._pending_first = now
+            self._pending = snapshot
+            self._pending_due = min(
+                now + max(0.0, delay),
+                self._pending_first + SETTINGS_SAVE_MAX_DELAY,
+            )
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    name="settings-writer",
+                    daemon=True,
+                )
+                self._writer.start()
+            self._pending_cond.notify_all()
+        logger.debug(f"Settings save queued ({len(dirty)} changed key(s))")
+        return True
+
+    def flush(self) -> None:
+        """Write any queued save now and wait for an in-progress write.
+
+        Raises:
+            SettingsSaveError: If the queued write fails
+        """
+        with self._write_lock:
+            with self._pending_cond:
+                snapshot = self._pending
+                self._pending = None
+            if snapshot is not None:
+                self._write(snapshot)
+
+    def has_pending_save(self) -> bool:
+        with self._pending_cond:
+            return self._pending is not None
+
+    def _writer_loop(self) -> None:
+        while True:
+            with self._pending_cond:
+                while self._pending is not None:
+                    remaining = self._pending_due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._pending_cond.wait(remaining)
+                if self._pending is None:
+                    self._writer = None
+                    return
+            # Take the snapshot only while holding the write lock so a
+            # concurrent flush() can never write an older snapshot last.
+            with self._write_lock:
+                with self._pending_cond:
+                    snapshot = self._pending
+                    self._pending = None
+                if snapshot is None:
+                    continue
+                try:
+                    self._write(snapshot)
+                except SettingsSaveError as exc:
+                    callback = self.on_save_error
+                    if callback is not None:
+                        try:
+                            callback(exc)
+                        except Exception:
+                            logger.exception("Settings save error callback failed")
+
+    def _write(self, data: Dict[str, Any]) -> None:
+        """Write `data` atomically with a backup of the previous file."""
         filepath = Path(self.filepath)
         temp_path = Path(str(filepath) + SETTINGS_TEMP_SUFFIX)
         backup_path = Path(str(filepath) + SETTINGS_BACKUP_SUFFIX)
@@ -358,7 +496,7 @@ class Settings:
             
             # Write to temporary file first
             with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, indent=2, sort_keys=True)
+                json.dump(data, f, indent=2, sort_keys=True)
             
             # Create backup of existing file
             if filepath.exists():
@@ -369,11 +507,13 @@ class Settings:
             
             # Atomic rename
             temp_path.replace(filepath)
+            self.last_save_error = None
             
             logger.info("Settings saved successfully")
             
         except IOError as e:
             logger.error(f"Failed to write settings: {e}")
+            self._mark_unsaved()
             
             # Try to restore backup
             if backup_path.exists():
@@ -383,11 +523,14 @@ class Settings:
                 except IOError:
                     pass
             
-            raise SettingsSaveError(f"Failed to save: {e}")
+            self.last_save_error = SettingsSaveError(f"Failed to save: {e}")
+            raise self.last_save_error
             
         except Exception as e:
             logger.error(f"Unexpected error saving settings: {e}")
-            raise SettingsSaveError(f"Unexpected error: {e}")
+            self._mark_unsaved()
+            self.last_save_error = SettingsSaveError(f"Unexpected error: {e}")
+            raise self.last_save_error
             
         finally:
             # Clean up temp file
@@ -397,6 +540,11 @@ class Settings:
                 except OSError:
                     pass
     
+    def _mark_unsaved(self) -> None:
+        # A failed write leaves the file stale: treat every key as dirty so
+        # the next save request retries.
+        self._saved = {}
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get setting value.
         
@@ -428,6 +576,7 @@ class Settings:
         """
         # Support nested keys like "3d_view_settings.zoom"
         keys = key.split(".")
+        self._dirty.add(keys[0])
         
         if len(keys) == 1:
             self.data[key] = value
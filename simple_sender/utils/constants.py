@@ -131,6 +131,27 @@ UI_EVENT_QUEUE_MAXSIZE = 3000
 UI_EVENT_QUEUE_DROP_NOTICE_INTERVAL = 1.0
 """Minimum seconds between UI drop summary log entries."""
 
+LOG_QUEUE_MAXSIZE = 20000
+"""Maximum number of log records buffered for the async log writer before dropping."""
+
+LOG_QUEUE_DROP_NOTICE_INTERVAL = 5.0
+"""Minimum seconds between dropped-log-record notices written to the log files."""
+
+LOG_WRITER_STOP_TIMEOUT = 2.0
+"""Seconds to wait for the async log writer to flush on shutdown."""
+
+FLIGHT_RECORDER_MAX_BYTES = 16_000_000
+"""Maximum size of a flight recording file before rotation (bytes)."""
+
+FLIGHT_RECORDER_BACKUPS = 3
+"""Number of rotated flight recording files to keep."""
+
+FLIGHT_RECORDER_FLUSH_INTERVAL = 0.25
+"""Seconds between flight recorder flushes to disk."""
+
+FLIGHT_RECORDER_MAX_PENDING = 4_000_000
+"""Maximum unflushed flight recorder bytes before frames are dropped."""
+
 GRBL_SETTINGS_WRITE_DELAY = 0.05
 """Delay between sending GRBL settings updates (seconds)."""
 
@@ -464,8 +485,11 @@ MACRO_EXTS = ("", ".txt")
 MACRO_WAIT_TIMEOUT = 30.0
 """Default timeout for %wait command (seconds)."""
 
-MACRO_WAIT_POLL_INTERVAL = 0.1
-"""Polling interval for %wait command (seconds)."""
+MACRO_WAIT_RECHECK_INTERVAL = 0.5
+"""Longest a macro wait blocks between status signals before re-checking (seconds)."""
+
+MACRO_IDLE_SETTLE_S = 0.2
+"""How long Idle must persist before a wait that never saw motion returns (seconds)."""
 
 MACRO_LINE_TIMEOUT = 0.0
 """Default maximum execution time for a single macro line (seconds, 0 disables)."""
@@ -473,6 +497,18 @@ MACRO_LINE_TIMEOUT = 0.0
 MACRO_TOTAL_TIMEOUT = 0.0
 """Default maximum execution time for an entire macro run (seconds, 0 disables)."""
 
+MACRO_PROGRAM_CACHE_SIZE = 32
+"""Number of compiled macro files kept in memory between runs."""
+
+MACRO_STREAM_MIN_LINES = 2
+"""Consecutive plain G-code macro lines needed before they are streamed instead of sent one by one."""
+
+MACRO_STREAM_CHECK_INTERVAL = 0.25
+"""How often a streamed macro run re-checks alarm, connection, and timeouts while draining (seconds)."""
+
+MACRO_PROFILE_HISTORY = 20
+"""Number of profiled macro runs kept for the diagnostics export."""
+
 MACRO_STDEXPR = False
 """Use standard Python expressions instead of bracket notation."""
 
@@ -494,6 +530,27 @@ AUTOLEVEL_LARGE_MIN_AREA_DEFAULT = 10000.0
 AUTOLEVEL_START_STATE_POLL_MS = 300
 """Polling interval (ms) for auto-level start readiness."""
 
+AUTOLEVEL_PROBE_PIPELINE_DEPTH = 2
+"""Probe points whose command blocks may be queued ahead of their [PRB:] report."""
+
+AUTOLEVEL_PROBE_HALT_TIMEOUT = 5.0
+"""Seconds to wait for the feed hold, then for the GRBL banner, when a probe run halts."""
+
+AUTOLEVEL_REFINE_COARSE_STRIDE = 4
+"""Grid-node stride of the first pass when adaptive refinement probing is enabled."""
+
+AUTOLEVEL_MAP_CACHE_DIRNAME = "height_maps"
+"""Directory (next to the settings file) holding recently probed height maps."""
+
+AUTOLEVEL_MAP_CACHE_KEEP = 20
+"""Number of cached height maps kept before the oldest are deleted."""
+
+AUTOLEVEL_MAP_CACHE_MAX_AGE = 12 * 3600.0
+"""Maximum age (seconds) of a cached height map offered for reuse."""
+
+AUTOLEVEL_MAP_CACHE_WCO_TOLERANCE = 0.01
+"""Work-offset difference (mm) still treated as the same fixture setup."""
+
 # ============================================================================
 # G-CODE PARSING CONSTANTS
 # ============================================================================
@@ -520,6 +577,12 @@ SETTINGS_BACKUP_SUFFIX = ".backup"
 SETTINGS_TEMP_SUFFIX = ".tmp"
 """Suffix for temporary settings file during write."""
 
+SETTINGS_SAVE_DEBOUNCE = 0.5
+"""Quiet period before a queued settings save is written (seconds)."""
+
+SETTINGS_SAVE_MAX_DELAY = 2.0
+"""Longest a queued settings save waits under continuous changes (seconds)."""
+
 # ============================================================================
 # STREAMING CONSTANTS
 # ============================================================================
@@ -533,6 +596,30 @@ TX_THROUGHPUT_WINDOW = 2.0
 TX_THROUGHPUT_EMIT_INTERVAL = 0.5
 """Minimum interval between throughput updates (seconds)."""
 
+TELEMETRY_RING_SIZE = 4096
+"""Samples kept per streaming telemetry ring buffer (ack latency, RX occupancy, Bf)."""
+
+METRICS_DUMP_INTERVAL = 10.0
+"""Interval between metrics exposition file rewrites when file dumping is on (seconds)."""
+
+UI_STALL_HEARTBEAT_MS = 100
+"""Interval of the Tk heartbeat used to measure main-loop latency (milliseconds)."""
+
+UI_STALL_THRESHOLD_MS = 500.0
+"""Main-loop delay that counts as a stall and triggers a stack sample (milliseconds)."""
+
+UI_STALL_HISTORY = 20
+"""Recent stalls (with stacks) kept for Export diagnostics."""
+
+PROFILE_CAPTURE_DEFAULT_SECONDS = 10
+"""Default length of an on-demand profile capture (seconds)."""
+
+PROFILE_CAPTURE_MAX_SECONDS = 120
+"""Longest profile capture the Diagnostics action allows (seconds)."""
+
+PROFILE_SAMPLE_INTERVAL = 0.01
+"""Interval between stack samples of all threads during a profile capture (seconds)."""
+
 STREAM_RECONNECT_DELAY = 0.5
 """Delay before attempting reconnect (seconds)."""
 
@@ -570,6 +657,9 @@ SERIAL_CONNECT_DELAY = 0.25
 SERIAL_TIMEOUT = 0.1
 """Serial read timeout (seconds)."""
 
+SERIAL_READ_MAX = 4096
+"""Maximum bytes pulled from the serial port per RX read."""
+
 SERIAL_WRITE_TIMEOUT = 0.5
 """Serial write timeout (seconds)."""
 
@@ -20,20 +20,222 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-"""Structured logging setup for Simple Sender."""
+"""Structured logging setup for Simple Sender.
+
+File and console handlers are not attached to loggers directly. Each one is
+wrapped in a queue handler that hands records to a single background writer
+thread, so the serial RX/TX threads never block on disk I/O, log rotation or
+antivirus scans. When the bounded queue overflows, records are dropped and
+counted instead of stalling the caller.
+"""
 
 from __future__ import annotations
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import tempfile
+import threading
+import time
 from pathlib import Path
+from typing import Iterable
 
 from .config import get_settings_path
+from .constants import (
+    LOG_QUEUE_DROP_NOTICE_INTERVAL,
+    LOG_QUEUE_MAXSIZE,
+    LOG_WRITER_STOP_TIMEOUT,
+)
 
 APP_LOGGER_NAME = "simple_sender"
 LOG_DIRNAME = "logs"
 
+_STOP = object()
+
+
+class AsyncLogWriter:
+    """Bounded log record queue drained by one dedicated writer thread."""
+
+    def __init__(
+        self,
+        maxsize: int = LOG_QUEUE_MAXSIZE,
+        *,
+        drop_notice_interval: float = LOG_QUEUE_DROP_NOTICE_INTERVAL,
+    ) -> None:
+        self.queue: queue.Queue[object] = queue.Queue(max(1, int(maxsize)))
+        self._drop_notice_interval = float(drop_notice_interval)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._drop_counts: dict[str, int] = {}
+        self._pending_drops: dict[str, int] = {}
+        self._last_drop_notice: dict[str, float] = {}
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name="simple_sender-log-writer",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = LOG_WRITER_STOP_TIMEOUT) -> None:
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self.queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        thread.join(timeout=timeout)
+
+    def is_running(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def note_drop(self, group: str) -> None:
+        with self._lock:
+            self._drop_counts[group] = self._drop_counts.get(group, 0) + 1
+            self._pending_drops[group] = self._pending_drops.get(group, 0) + 1
+
+    def drop_counts(self) -> dict[str, int]:
+        """Return total dropped records per handler group since startup."""
+        with self._lock:
+            return dict(self._drop_counts)
+
+    def _take_drop_notice(self, group: str, now: float) -> int:
+        with self._lock:
+            pending = self._pending_drops.get(group, 0)
+            if pending <= 0:
+                return 0
+            last = self._last_drop_notice.get(group, 0.0)
+            if (now - last) < self._drop_notice_interval:
+                return 0
+            self._pending_drops[group] = 0
+            self._last_drop_notice[group] = now
+            return pending
+
+    def _run(self) -> None:
+        while True:
+            item = self.queue.get()
+            if item is _STOP:
+                break
+            group, targets, record = item  # type: ignore[misc]
+            dropped = self._take_drop_notice(group, time.monotonic())
+            if dropped:
+                notice = logging.LogRecord(
+                    record.name,
+                    logging.WARNING,
+                    __file__,
+                    0,
+                    f"[log] Dropped {dropped} log record(s); writer queue was full.",
+                    None,
+                    None,
+                )
+                _dispatch(targets, notice)
+            _dispatch(targets, record)
+        for handler in _iter_writer_handlers():
+            try:
+                handler.flush()
+            except Exception:
+                pass
+
+
+def _dispatch(targets: Iterable[logging.Handler], record: logging.LogRecord) -> None:
+    for handler in targets:
+        if record.levelno < handler.level:
+            continue
+        try:
+            handler.handle(record)
+        except Exception:
+            handler.handleError(record)
+
+
+class AsyncQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that forwards to target handlers on the writer thread."""
+
+    def __init__(self, writer: AsyncLogWriter, target: logging.Handler) -> None:
+        super().__init__(writer.queue)
+        self.writer = writer
+        self.target = target
+        self.set_name(target.get_name())
+
+    # The level is the target's, so records the target would discard are
+    # filtered by the logger before they are formatted and queued.
+    @property  # type: ignore[override]
+    def level(self) -> int:
+        target = self.__dict__.get("target")
+        return target.level if target is not None else logging.NOTSET
+
+    @level.setter
+    def level(self, value: int) -> None:
+        target = self.__dict__.get("target")
+        if target is not None:
+            target.setLevel(value)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait((self.get_name() or "", (self.target,), record))
+        except queue.Full:
+            self.writer.note_drop(self.get_name() or "")
+
+    def close(self) -> None:
+        try:
+            self.target.close()
+        finally:
+            super().close()
+
+
+_WRITER: AsyncLogWriter | None = None
+_WRITER_LOCK = threading.Lock()
+
+
+def get_log_writer() -> AsyncLogWriter:
+    """Return the shared async log writer, starting it on first use."""
+    global _WRITER
+    with _WRITER_LOCK:
+        if _WRITER is None:
+            _WRITER = AsyncLogWriter()
+            atexit.register(shutdown_logging)
+        writer = _WRITER
+    writer.start()
+    return writer
+
+
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the writer thread."""
+    writer = _WRITER
+    if writer is not None:
+        writer.stop()
+
+
+def get_log_drop_counts() -> dict[str, int]:
+    """Return dropped log record counts per handler (empty if nothing dropped)."""
+    writer = _WRITER
+    if writer is None:
+        return {}
+    return writer.drop_counts()
+
+
+def _iter_writer_handlers() -> Iterable[logging.Handler]:
+    names = (APP_LOGGER_NAME, f"{APP_LOGGER_NAME}.serial", f"{APP_LOGGER_NAME}.ui")
+    for name in names:
+        for handler in logging.getLogger(name).handlers:
+            if isinstance(handler, AsyncQueueHandler):
+                yield handler.target
+
+
+def add_async_handler(logger: logging.Logger, handler: logging.Handler) -> AsyncQueueHandler:
+    """Attach `handler` to `logger` behind the shared async log writer."""
+    queued = AsyncQueueHandler(get_log_writer(), handler)
+    logger.addHandler(queued)
+    return queued
+
 
 def _handler_exists(logger: logging.Logger, name: str) -> bool:
     for handler in logger.handlers:
@@ -59,7 +261,10 @@ def get_log_dir() -> Path:
 
 
 def setup_logging() -> logging.Logger:
-    """Initialize application logging with rotating file handlers."""
+    """Initialize application logging with rotating file handlers.
+
+    All handlers are written from the async log writer thread.
+    """
     log_dir = get_log_dir()
 
     root = logging.getLogger(APP_LOGGER_NAME)
@@ -73,7 +278,7 @@ def setup_logging() -> logging.Logger:
             logging.Formatter("%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
         )
         console.set_name("simple_sender_console")
-        root.addHandler(console)
+        add_async_handler(root, console)
 
     if not _handler_exists(root, "simple_sender_app_file"):
         app_handler = logging.handlers.RotatingFileHandler(
@@ -87,7 +292,7 @@ def setup_logging() -> logging.Logger:
             logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
         )
         app_handler.set_name("simple_sender_app_file")
-        root.addHandler(app_handler)
+        add_async_handler(root, app_handler)
 
     if not _handler_exists(root, "simple_sender_error_file"):
         error_handler = logging.handlers.RotatingFileHandler(
@@ -101,7 +306,7 @@ def setup_logging() -> logging.Logger:
             logging.Formatter("%(asctime)s [%(levelname)s] %(name)s:%(lineno)d\n%(message)s\n")
         )
         error_handler.set_name("simple_sender_error_file")
-        root.addHandler(error_handler)
+        add_async_handler(root, error_handler)
 
     serial_logger = logging.getLogger(f"{APP_LOGGER_NAME}.serial")
     serial_logger.setLevel(logging.DEBUG)
@@ -120,7 +325,7 @@ def setup_logging() -> logging.Logger:
             )
         )
         serial_handler.set_name("simple_sender_serial_file")
-        serial_logger.addHandler(serial_handler)
+        add_async_handler(serial_logger, serial_handler)
 
     ui_logger = logging.getLogger(f"{APP_LOGGER_NAME}.ui")
     ui_logger.setLevel(logging.DEBUG)
@@ -136,6 +341,6 @@ def setup_logging() -> logging.Logger:
             logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
         )
         ui_handler.set_name("simple_sender_ui_file")
-        ui_logger.addHandler(ui_handler)
+        add_async_handler(ui_logger, ui_handler)
 
     return root
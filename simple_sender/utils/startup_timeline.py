@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# Simple Sender (GRBL G-code Sender)
+# Copyright (C) 2026 Bob Kolbasowski
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# Optional (not required by the license): If you make improvements, please consider
+# contributing them back upstream (e.g., via a pull request) so others can benefit.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Startup timeline: wall time per startup phase and, optionally, per import.
+
+Phases are always recorded (a few `perf_counter` calls). Import timing wraps
+`builtins.__import__` and is only enabled when `SIMPLE_SENDER_STARTUP_IMPORTS`
+is set, or by calling `track_imports()`; it reports inclusive and self time
+for each module imported for the first time, like `python -X importtime`.
+"""
+
+from __future__ import annotations
+
+import builtins
+import importlib.util
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+STARTUP_IMPORTS_ENV = "SIMPLE_SENDER_STARTUP_IMPORTS"
+
+
+@dataclass
+class StartupPhase:
+    name: str
+    start: float
+    duration: float
+    depth: int
+
+
+@dataclass
+class ImportCost:
+    module: str
+    inclusive: float
+    self_time: float
+
+
+class StartupTimeline:
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self.phases: list[StartupPhase] = []
+        self.marks: list[tuple[str, float]] = []
+        self.imports: list[ImportCost] = []
+        self._depth = 0
+        self._orig_import: Any = None
+        self._import_stack: list[float] = []
+        self._thread_id: int | None = None
+        self.finished = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        depth = self._depth
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth = depth
+            self.phases.append(
+                StartupPhase(name, start - self.origin, time.perf_counter() - start, depth)
+            )
+
+    def mark(self, name: str) -> float:
+        """Record a point in time; returns seconds since the timeline origin."""
+        elapsed = time.perf_counter() - self.origin
+        self.marks.append((name, elapsed))
+        return elapsed
+
+    def track_imports_from_env(self) -> None:
+        if os.getenv(STARTUP_IMPORTS_ENV):
+            self.track_imports()
+
+    def track_imports(self) -> None:
+        if self._orig_import is not None:
+            return
+        self._orig_import = builtins.__import__
+        # Only the startup thread is timed; worker threads import concurrently.
+        self._thread_id = threading.get_ident()
+        builtins.__import__ = self._timed_import
+
+    def stop_import_tracking(self) -> None:
+        if self._orig_import is None:
+            return
+        if builtins.__import__ is self._timed_import:
+            builtins.__import__ = self._orig_import
+        self._orig_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        orig = self._orig_import
+        if orig is None or threading.get_ident() != self._thread_id:
+            return (orig or builtins.__import__)(name, globals, locals, fromlist, level)
+        module = name
+        if level:
+            package = (globals or {}).get("__package__") or ""
+            try:
+                module = importlib.util.resolve_name("." * level + name, package)
+            except (ImportError, ValueError):
+                module = name
+        loaded = sys.modules.get(module)
+        if loaded is not None:
+            # `from pkg import sub` may still load submodules of a loaded package.
+            pending = [
+                f"{module}.{item}"
+                for item in (fromlist or ())
+                if item != "*" and not hasattr(loaded, item)
+            ]
+            if not pending:
+                return orig(name, globals, locals, fromlist, level)
+            module = ", ".join(pending)
+        self._import_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return orig(name, globals, locals, fromlist, level)
+        finally:
+            inclusive = time.perf_counter() - start
+            children = self._import_stack.pop()
+            if self._import_stack:
+                self._import_stack[-1] += inclusive
+            self.imports.append(ImportCost(module, inclusive, max(0.0, inclusive - children)))
+
+    def finish(self, name: str = "first idle") -> float:
+        """Mark the end of startup and stop import tracking."""
+        elapsed = self.mark(name)
+        self.stop_import_tracking()
+        self.finished = True
+        return elapsed
+
+    def report_lines(self, *, top_imports: int = 15) -> list[str]:
+        lines: list[str] = []
+        for phase in sorted(self.phases, key=lambda item: item.start):
+            indent = "  " * phase.depth
+            lines.append(
+                f"{indent}{phase.name}: {phase.duration * 1000.0:.1f} ms "
+                f"(at {phase.start * 1000.0:.1f} ms)"
+            )
+        for name, elapsed in self.marks:
+            lines.append(f"{name}: at {elapsed * 1000.0:.1f} ms")
+        if self.imports:
+            slowest = sorted(self.imports, key=lambda item: item.self_time, reverse=True)
+            lines.append(f"Imports ({len(self.imports)} modules, slowest self time):")
+            for cost in slowest[:top_imports]:
+                lines.append(
+                    f"  {cost.module}: self {cost.self_time * 1000.0:.1f} ms, "
+                    f"inclusive {cost.inclusive * 1000.0:.1f} ms"
+                )
+        return lines
+
+
+STARTUP_TIMELINE = StartupTimeline()
+"""Process-wide timeline; `main()` and `App.__init__` record into it."""